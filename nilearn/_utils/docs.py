@@ -225,6 +225,33 @@ docdict["classifier_options"] = f"""
 
 """
 
+# checkpoint_dir
+docdict["checkpoint_dir"] = """
+checkpoint_dir : :obj:`str` or :class:`pathlib.Path` or None, default=None
+    Directory where the scores of each group of spheres are saved
+    as soon as the group is processed.
+    Running again with the same inputs and the same directory
+    skips the groups whose scores were already saved,
+    so that an interrupted search light can be resumed,
+    even with a different ``n_jobs``.
+    If None, nothing is saved.
+
+    .. nilearn_versionadded:: 0.14.0dev
+"""
+
+# chunk_size
+docdict["chunk_size"] = """
+chunk_size : :obj:`int` or None, default=None
+    Number of volumes read, smoothed and masked at once.
+    If not None, 4D images are masked block by block
+    through their data object,
+    so that peak memory usage is bounded by ``chunk_size`` volumes
+    rather than by the full 4D image.
+    If None, the whole image is loaded in memory before masking.
+
+    .. nilearn_versionadded:: 0.14.0dev
+"""
+
 # clean_args
 docdict["clean_args"] = """
 clean_args : :obj:`dict` or None, default=None
@@ -280,6 +307,30 @@ cmap : :class:`matplotlib.colors.Colormap`, or :obj:`str`, \
 
 """
 
+# callback for permutations
+docdict["callback_permutations"] = """
+callback : callable(dict) -> :obj:`bool` or None, default=None
+    Function called at the end of every round of permutations
+    with a dictionary of statistics:
+
+    - ``"n_perm"``: number of permutations performed so far,
+    - ``"pvals"``: family-wise corrected voxel-level p-values
+      of shape (n_regressors, n_descriptors),
+    - ``"standard_error"``: Monte-Carlo standard error of these p-values,
+    - ``"n_undecided"``: number of p-values whose confidence interval
+      still contains ``early_stopping_alpha``
+      (None if ``early_stopping_alpha`` is None),
+    - ``"tfce_pvals"``, ``"tfce_standard_error"``
+      and ``"tfce_n_undecided"``: the same statistics
+      for the TFCE p-values, only if ``tfce`` is True,
+    - ``"elapsed_time"``: time spent on the permutations, in seconds.
+
+    If it returns True, no more permutations are performed.
+    Passing a callback runs the permutations by rounds.
+
+    .. nilearn_versionadded:: 0.14.0dev
+"""
+
 # colorbar
 docdict["colorbar"] = """
 colorbar : :obj:`bool`, optional
@@ -486,6 +537,36 @@ dtype : dtype like, "auto" or None, default=None
     ``dtype=bool`` will raise an Exception.
 """
 
+# early_stopping_alpha
+docdict["early_stopping_alpha"] = """
+early_stopping_alpha : :obj:`float` or None, default=None
+    Significance level used to stop the permutations early.
+    If not None, permutations are run by rounds and stop
+    as soon as the 99%% confidence interval
+    of the Monte-Carlo estimate of every family-wise corrected
+    voxel-level p-value lies entirely above or below
+    ``early_stopping_alpha``.
+    If ``tfce`` is True, the TFCE p-values must be decided as well.
+    Cannot be used with cluster-level inference (``threshold``).
+    ``n_perm`` is then the maximum number of permutations.
+
+    .. nilearn_versionadded:: 0.14.0dev
+"""
+
+# early_stopping_tol
+docdict["early_stopping_tol"] = """
+early_stopping_tol : :obj:`float` or None, default=None
+    Tolerance used to stop the permutations early.
+    If not None, permutations are run by rounds and stop
+    as soon as the Monte-Carlo standard error of every family-wise corrected
+    voxel-level p-value is smaller than ``early_stopping_tol``.
+    If ``tfce`` is True, this applies to the TFCE p-values as well.
+    Cannot be used with cluster-level inference (``threshold``).
+    ``n_perm`` is then the maximum number of permutations.
+
+    .. nilearn_versionadded:: 0.14.0dev
+"""
+
 # estimator_args
 docdict["estimator_args"] = """
 estimator_args : dict[str, Any] or None, default=None
@@ -676,6 +757,24 @@ img : Niimg-like object
     See :ref:`extracting_data`.
 """
 
+# incremental_group_pca
+docdict["incremental_group_pca"] = """
+incremental_group_pca : :obj:`int` or None, default=None
+    Number of dimensions of the group data reduction,
+    when it is computed incrementally.
+    If None, the reduced data of all subjects are concatenated
+    in memory before the group level decomposition.
+    If an integer, subjects are added one after the other
+    to a group principal subspace with this number of dimensions,
+    using the MELODIC's Incremental Group-PCA (MIGP)
+    of :footcite:t:`Smith2014b`.
+    Memory usage then does not grow with the number of subjects.
+    Must be greater than or equal to ``n_components``.
+    Larger values give a closer approximation of the group decomposition.
+
+    .. nilearn_versionadded:: 0.14.0dev
+"""
+
 # imgs
 docdict["imgs"] = """
 imgs : :obj:`list` of Niimg-like objects
@@ -1,7 +1,9 @@
 import functools
 import os
 import sys
+import threading
 import warnings
+from collections import OrderedDict
 
 from nilearn._utils.logger import find_stack_level
 
@@ -230,3 +232,68 @@ def is_gil_enabled() -> bool:
 
 def is_sphinx_build() -> bool:
     return any(module.startswith("sphinx.") for module in sys.modules)
+
+
+class KeyedLRUCache:
+    """Thread-safe cache of the values last computed for some keys.
+
+    Values are computed outside of the lock,
+    so that a value may be computed twice by concurrent threads.
+
+    Parameters
+    ----------
+    max_items : :obj:`int`
+        Maximum number of cached values.
+
+    max_bytes : :obj:`int` or None, default=None
+        Maximum total size of cached values, as returned by ``nbytes``.
+        Values larger than ``max_bytes`` are not cached.
+        If None, the size of values is not bounded.
+
+    nbytes : callable or None, default=None
+        Function returning the size in bytes of a value.
+        Required if ``max_bytes`` is not None.
+    """
+
+    def __init__(self, max_items, max_bytes=None, nbytes=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.nbytes = nbytes
+        self._values = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """Return the value cached for key, \
+        or compute it with ``compute()`` and cache it.
+        """
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key]
+
+        value = compute()
+        size = 0 if self.max_bytes is None else self.nbytes(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return value
+
+        with self._lock:
+            self._values[key] = value
+            self._sizes[key] = size
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_items or (
+                self.max_bytes is not None
+                and sum(self._sizes.values()) > self.max_bytes
+            ):
+                oldest, _ = self._values.popitem(last=False)
+                del self._sizes[oldest]
+        return value
+
+    def clear(self):
+        """Remove all cached values."""
+        with self._lock:
+            self._values.clear()
+            self._sizes.clear()
+
+    def __len__(self):
+        return len(self._values)
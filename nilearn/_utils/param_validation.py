@@ -175,6 +175,7 @@ TYPE_MAPS = {
     "annotate": nilearn_typing.Annotate,
     "border_size": nilearn_typing.BorderSize,
     "bg_on_data": nilearn_typing.BgOnData,
+    "chunk_size": nilearn_typing.ChunkSize,
     "colorbar": nilearn_typing.ColorBar,
     "cluster_threshold": nilearn_typing.ClusterThreshold,
     "connected": nilearn_typing.Connected,
@@ -182,6 +183,8 @@ TYPE_MAPS = {
     "data_dir": nilearn_typing.DataDir,
     "draw_cross": nilearn_typing.DrawCross,
     "detrend": nilearn_typing.Detrend,
+    "early_stopping_alpha": nilearn_typing.EarlyStoppingAlpha,
+    "early_stopping_tol": nilearn_typing.EarlyStoppingTol,
     "force_resample": nilearn_typing.ForceResample,
     "high_pass": nilearn_typing.HighPass,
     "hrf_model": nilearn_typing.HrfModel,
@@ -3,6 +3,7 @@ from pathlib import Path
 import pytest
 
 from nilearn._utils.helpers import (
+    KeyedLRUCache,
     _warn_deprecated_params,
     is_kaleido_installed,
     is_plotly_installed,
@@ -116,3 +117,45 @@ def test_is_kaleido_installed():
 def test_stringify_path():
     assert isinstance(stringify_path(Path("foo") / "bar"), str)
     assert stringify_path([]) == []
+
+
+def test_keyed_lru_cache():
+    """Check that the least recently used values are evicted."""
+    cache = KeyedLRUCache(max_items=2)
+    computed = []
+
+    def compute(key):
+        def _compute():
+            computed.append(key)
+            return key * 2
+
+        return _compute
+
+    assert cache.get(1, compute(1)) == 2
+    assert cache.get(2, compute(2)) == 4
+    assert cache.get(1, compute(1)) == 2
+    assert cache.get(3, compute(3)) == 6
+    assert cache.get(1, compute(1)) == 2
+    assert cache.get(2, compute(2)) == 4
+    assert computed == [1, 2, 3, 2]
+    assert len(cache) == 2
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_keyed_lru_cache_max_bytes():
+    """Check that the total size of cached values is bounded."""
+    cache = KeyedLRUCache(max_items=3, max_bytes=10, nbytes=len)
+
+    cache.get("a", lambda: "x" * 4)
+    cache.get("b", lambda: "x" * 4)
+    assert len(cache) == 2
+
+    cache.get("c", lambda: "x" * 4)
+    assert len(cache) == 2
+
+    # too large to be cached
+    assert cache.get("d", lambda: "x" * 11) == "x" * 11
+    assert len(cache) == 2
@@ -1,9 +1,11 @@
 """Connectivity matrices."""
 
 import warnings
+from collections import defaultdict
 from math import floor, sqrt
 
 import numpy as np
+from joblib import Parallel, delayed
 from scipy import linalg
 from sklearn.base import TransformerMixin, clone
 from sklearn.covariance import LedoitWolf
@@ -18,6 +20,10 @@ from nilearn._utils.logger import find_stack_level, log
 from nilearn._utils.param_validation import check_parameter_in_allowed
 from nilearn._utils.versions import SKLEARN_LT_1_6
 
+# Maximum number of time series values stacked in memory
+# to compute covariances in batches
+_MAX_BATCH_SIZE = 2**24
+
 
 def _check_square(matrix: np.ndarray) -> None:
     """Raise a ValueError if the input matrix is square.
@@ -40,11 +46,18 @@ def _check_spd(matrix: np.ndarray) -> None:
 
     Parameters
     ----------
-    matrix : numpy.ndarray
-        Input array.
+    matrix : numpy.ndarray, shape (..., n_features, n_features)
+        Input array. Stacks of matrices are checked at once.
 
     """
-    if not is_spd(matrix, decimal=7):
+    if matrix.ndim > 2:
+        valid = (
+            np.allclose(matrix, matrix.swapaxes(-1, -2), atol=0, rtol=1e-7)
+            and np.linalg.eigvalsh(matrix).min() > 0
+        )
+    else:
+        valid = is_spd(matrix, decimal=7)
+    if not valid:
         raise ValueError("Expected a symmetric positive definite matrix.")
 
 
@@ -59,20 +72,23 @@ def _form_symmetric(
     function : function numpy.ndarray -> numpy.ndarray
         The transform to apply to the eigenvalues.
 
-    eigenvalues : numpy.ndarray, shape (n_features, )
+    eigenvalues : numpy.ndarray, shape (..., n_features)
         Input argument of the function.
 
-    eigenvectors : numpy.ndarray, shape (n_features, n_features)
+    eigenvectors : numpy.ndarray, shape (..., n_features, n_features)
         Unitary matrix.
 
     Returns
     -------
-    output : numpy.ndarray, shape (n_features, n_features)
+    output : numpy.ndarray, shape (..., n_features, n_features)
         The symmetric matrix obtained after transforming the eigenvalues, while
         keeping the same eigenvectors.
 
     """
-    return np.dot(eigenvectors * function(eigenvalues), eigenvectors.T)
+    return np.matmul(
+        eigenvectors * function(eigenvalues)[..., np.newaxis, :],
+        eigenvectors.swapaxes(-1, -2),
+    )
 
 
 def _map_eigenvalues(function, symmetric):
@@ -85,12 +101,13 @@ def _map_eigenvalues(function, symmetric):
     function : function numpy.ndarray -> numpy.ndarray
         The transform to apply to the eigenvalues.
 
-    symmetric : numpy.ndarray, shape (n_features, n_features)
-        The input symmetric matrix.
+    symmetric : numpy.ndarray, shape (..., n_features, n_features)
+        The input symmetric matrix. Stacks of matrices are transformed
+        in a single batched call.
 
     Returns
     -------
-    output : numpy.ndarray, shape (n_features, n_features)
+    output : numpy.ndarray, shape (..., n_features, n_features)
         The new symmetric matrix obtained after transforming the eigenvalues,
         while keeping the same eigenvectors.
 
@@ -100,11 +117,14 @@ def _map_eigenvalues(function, symmetric):
     be wrong.
 
     """
-    eigenvalues, eigenvectors = linalg.eigh(symmetric)
+    if symmetric.ndim > 2:
+        eigenvalues, eigenvectors = np.linalg.eigh(symmetric)
+    else:
+        eigenvalues, eigenvectors = linalg.eigh(symmetric)
     return _form_symmetric(function, eigenvalues, eigenvectors)
 
 
-def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
+def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7, weights=None):
     """Compute the geometric mean of symmetric positive definite matrices.
 
     The geometric mean of n positive definite matrices
@@ -144,6 +164,10 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
         this value, the gradient descent is stopped. If None, no  check is
         performed.
 
+    weights : array-like of shape (n_matrices,) or None, default=None
+        Weight of each matrix in the sum of squared distances.
+        If None, all matrices have the same weight.
+
     Returns
     -------
     gmean : numpy.ndarray, shape (n_features, n_features)
@@ -156,12 +180,12 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
         _check_square(matrix)
         if matrix.shape[0] != n_features:
             raise ValueError("Matrices are not of the same shape.")
-        _check_spd(matrix)
+    matrices = np.asarray(matrices)
+    _check_spd(matrices)
 
     # Initialization
-    matrices = np.array(matrices)
     if init is None:
-        gmean = np.mean(matrices, axis=0)
+        gmean = np.average(matrices, axis=0, weights=weights)
     else:
         _check_square(init)
         if init.shape[0] != n_features:
@@ -177,13 +201,10 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
         # Computation of the gradient
         vals_gmean, vecs_gmean = linalg.eigh(gmean)
         gmean_inv_sqrt = _form_symmetric(np.sqrt, 1.0 / vals_gmean, vecs_gmean)
-        whitened_matrices = [
-            gmean_inv_sqrt.dot(matrix).dot(gmean_inv_sqrt)
-            for matrix in matrices
-        ]
-        logs = [_map_eigenvalues(np.log, w_mat) for w_mat in whitened_matrices]
+        whitened_matrices = gmean_inv_sqrt @ matrices @ gmean_inv_sqrt
+        logs = _map_eigenvalues(np.log, whitened_matrices)
         # Covariant derivative is - gmean.dot(logms_mean)
-        logs_mean = np.mean(logs, axis=0)
+        logs_mean = np.average(logs, axis=0, weights=weights)
         if np.any(np.isnan(logs_mean)):
             raise FloatingPointError("Nan value after logarithm operation.")
 
@@ -370,17 +391,35 @@ def vec_to_sym_matrix(vec, diagonal=None):
     return sym
 
 
+def _fill_diagonal(matrices: np.ndarray, value: float) -> None:
+    """Fill in place the diagonal of the last two dimensions of an array.
+
+    Parameters
+    ----------
+    matrices : numpy.ndarray, shape (..., n_features, n_features)
+        Input array.
+
+    value : :obj:`float`
+        Value to write on the diagonals.
+
+    """
+    diagonal = np.arange(matrices.shape[-1])
+    matrices[..., diagonal, diagonal] = value
+
+
 def cov_to_corr(covariance: np.ndarray) -> np.ndarray:
     """Return correlation matrix for a given covariance matrix.
 
+    Acts on the last two dimensions of the array if not 2-dimensional.
+
     Parameters
     ----------
-    covariance : 2D numpy.ndarray
+    covariance : numpy.ndarray, shape (..., n_features, n_features)
         The input covariance matrix.
 
     Returns
     -------
-    correlation : 2D numpy.ndarray
+    correlation : numpy.ndarray, shape (..., n_features, n_features)
         The output correlation matrix.
 
     Examples
@@ -393,26 +432,32 @@ def cov_to_corr(covariance: np.ndarray) -> np.ndarray:
            [0.33333333, 1.        ]])
 
     """
-    diagonal = np.atleast_2d(1.0 / np.sqrt(np.diag(covariance)))
-    correlation = covariance * diagonal * diagonal.T
+    diagonal = 1.0 / np.sqrt(np.diagonal(covariance, axis1=-2, axis2=-1))
+    correlation = (
+        covariance
+        * diagonal[..., np.newaxis, :]
+        * diagonal[..., :, np.newaxis]
+    )
 
     # Force exact 1. on diagonal
-    np.fill_diagonal(correlation, 1.0)
+    _fill_diagonal(correlation, 1.0)
     return correlation
 
 
 def prec_to_partial(precision: np.ndarray) -> np.ndarray:
     """Return partial correlation matrix for a given precision matrix.
 
+    Acts on the last two dimensions of the array if not 2-dimensional.
+
     Parameters
     ----------
-    precision : 2D numpy.ndarray
+    precision : numpy.ndarray, shape (..., n_features, n_features)
         The input precision matrix.
 
     Returns
     -------
-    partial_correlation : 2D numpy.ndarray
-        The 2D output partial correlation matrix.
+    partial_correlation : numpy.ndarray, shape (..., n_features, n_features)
+        The output partial correlation matrix.
 
     Examples
     --------
@@ -425,10 +470,67 @@ def prec_to_partial(precision: np.ndarray) -> np.ndarray:
 
     """
     partial_correlation = -cov_to_corr(precision)
-    np.fill_diagonal(partial_correlation, 1.0)
+    _fill_diagonal(partial_correlation, 1.0)
     return partial_correlation
 
 
+def _ledoit_wolf_covariances(
+    signals: np.ndarray, assume_centered: bool = False
+) -> np.ndarray:
+    """Compute Ledoit-Wolf shrunk covariances of a stack of time series.
+
+    Batched equivalent of fitting a :class:`sklearn.covariance.LedoitWolf`
+    estimator on each time series in turn.
+
+    Parameters
+    ----------
+    signals : numpy.ndarray, shape (n_subjects, n_samples, n_features)
+        Time series of each subject.
+
+    assume_centered : :obj:`bool`, default=False
+        If True, the time series are not centered before computation.
+
+    Returns
+    -------
+    covariances : numpy.ndarray, shape (n_subjects, n_features, n_features)
+        The shrunk covariance matrices.
+
+    """
+    if not assume_centered:
+        signals = signals - signals.mean(axis=1, keepdims=True)
+    n_samples, n_features = signals.shape[1:]
+
+    emp_covs = np.matmul(signals.swapaxes(1, 2), signals) / n_samples
+    emp_cov_traces = np.trace(emp_covs, axis1=1, axis2=2)
+    mu = emp_cov_traces / n_features
+
+    # sum of the squared coefficients of <X.T, X> / n_samples ** 2
+    delta_ = np.sum(emp_covs**2, axis=(1, 2))
+    # sum of the coefficients of <X2.T, X2>,
+    # computed from the squared norms of the samples
+    beta_ = np.sum(np.sum(signals**2, axis=2) ** 2, axis=1)
+
+    beta = (beta_ / n_samples - delta_) / (n_features * n_samples)
+    delta = (delta_ - 2.0 * mu * emp_cov_traces + n_features * mu**2) / (
+        n_features
+    )
+    # do not shrink more than "1", which would invert the covariances
+    beta = np.minimum(beta, delta)
+    shrinkage = np.divide(
+        beta, delta, out=np.zeros_like(beta), where=beta != 0
+    )
+
+    covariances = (1.0 - shrinkage)[:, np.newaxis, np.newaxis] * emp_covs
+    diagonal = np.arange(n_features)
+    covariances[:, diagonal, diagonal] += (shrinkage * mu)[:, np.newaxis]
+    return covariances
+
+
+def _fit_covariance(estimator, signals: np.ndarray) -> np.ndarray:
+    """Fit a covariance estimator and return its covariance matrix."""
+    return estimator.fit(signals).covariance_
+
+
 @fill_doc
 class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
     """A class that computes different kinds of \
@@ -448,6 +550,9 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
         (n_samples, n_features) and has an attribute ``covariance_`` of shape
         (n_features, n_features) after fitting. Please see
         ``sklearn.covariance`` for examples.
+        With a :class:`~sklearn.covariance.LedoitWolf` estimator,
+        the covariances of the subjects with the same number of samples
+        are computed together with batched array operations.
 
     kind : {"covariance", "correlation", "partial correlation",\
             "tangent", "precision"}, default='covariance'
@@ -473,6 +578,12 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
             deprecated.
             This parameter will be removed in version 0.15.
 
+    %(n_jobs)s
+        Used to fit the covariance estimator on several subjects in
+        parallel, when covariances cannot be computed in batches.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     %(verbose0)s
 
     Attributes
@@ -492,6 +603,12 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
     n_features_in_ : :obj:`int`
         Number of features seen during fit.
 
+    n_subjects_seen_ : :obj:`int`
+        Number of subjects used to compute ``mean_``.
+        Incremented by each call to ``partial_fit``.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     whitening_ : numpy.ndarray or None
         The inverted square-rooted geometric mean of the covariance matrices.
         Only set when for ``kind=="tangent"``
@@ -509,6 +626,7 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
         vectorize=False,
         discard_diagonal=False,
         standardize=True,
+        n_jobs=1,
         verbose=0,
     ):
         self.cov_estimator = cov_estimator
@@ -516,6 +634,7 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
         self.vectorize = vectorize
         self.discard_diagonal = discard_diagonal
         self.standardize = standardize
+        self.n_jobs = n_jobs
         self.verbose = verbose
 
     def _check_input(self, X, confounds=None):
@@ -598,10 +717,53 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
         self._fit_transform(X, do_fit=True)
         return self
 
+    @fill_doc
+    def partial_fit(self, X, y=None):
+        """Update the mean connectivity with a batch of subjects.
+
+        Only the mean connectivity matrix is kept between calls,
+        so that subjects can be streamed from disk
+        without holding all the time series in memory.
+        Calling ``partial_fit`` on each batch gives the same ``mean_``
+        as calling ``fit`` on all the subjects, except for the "tangent"
+        kind. For the "tangent" kind, the geometric mean is refined
+        from the previous estimate, where the subjects already seen
+        are summarized by their geometric mean.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
+        Parameters
+        ----------
+        X : iterable of :class:`numpy.ndarray` \
+            each of shape (n_samples, n_features)
+            Each :class:`numpy.ndarray` represents a subject's time series.
+            The number of samples may differ from one subject to another.
+
+        %(y_dummy)s
+
+        Returns
+        -------
+        self : ConnectivityMatrix instance
+            The object itself. Useful for chaining operations.
+
+        """
+        del y
+        self._fit_transform(X, do_fit=True, partial=True)
+        return self
+
     def _fit_transform(
-        self, X, do_transform=False, do_fit=False, confounds=None
+        self,
+        X,
+        do_transform=False,
+        do_fit=False,
+        confounds=None,
+        partial=False,
     ):
-        """Avoid duplication of computation."""
+        """Avoid duplication of computation.
+
+        With ``partial=True``, the statistics of a previous fit are updated
+        instead of being replaced.
+        """
         if not hasattr(X, "__iter__"):
             raise TypeError(
                 "Input must be an iterable of numpy arrays. "
@@ -614,7 +776,10 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
 
         self._check_input(X, confounds=confounds)
 
-        if do_fit:
+        n_subjects_seen = 0
+        if partial and self.__sklearn_is_fitted__():
+            n_subjects_seen = self.n_subjects_seen_
+        elif do_fit:
             if self.cov_estimator is None:
                 self.cov_estimator_ = LedoitWolf(store_precision=False)
             else:
@@ -652,58 +817,38 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
         # Compute all the matrices, stored in "connectivities"
         if self.kind == "correlation":
             standardize = "zscore_sample" if self.standardize is True else None
-            covariances_std = [
-                self.cov_estimator_.fit(
+            covariances_std = self._compute_covariances(
+                [
                     signal.standardize_signal(
                         x,
                         detrend=False,
                         standardize=standardize,
                     )
-                ).covariance_
-                for x in X
-            ]
-            connectivities = [cov_to_corr(cov) for cov in covariances_std]
+                    for x in X
+                ]
+            )
+            connectivities = cov_to_corr(covariances_std)
         else:
-            covariances = [self.cov_estimator_.fit(x).covariance_ for x in X]
+            covariances = self._compute_covariances(X)
 
             if self.kind in ("covariance", "tangent"):
                 connectivities = covariances
             elif self.kind == "precision":
-                connectivities = [linalg.inv(cov) for cov in covariances]
+                connectivities = np.linalg.inv(covariances)
             elif self.kind == "partial correlation":
-                connectivities = [
-                    prec_to_partial(linalg.inv(cov)) for cov in covariances
-                ]
+                connectivities = prec_to_partial(np.linalg.inv(covariances))
 
         # Store the mean
         if do_fit:
-            if self.kind == "tangent":
-                self.mean_ = _geometric_mean(
-                    covariances, max_iter=30, tol=1e-7
-                )
-                self.whitening_ = _map_eigenvalues(
-                    lambda x: 1.0 / np.sqrt(x), self.mean_
-                )
-            else:
-                self.mean_ = np.mean(connectivities, axis=0)
-                # Fight numerical instabilities: make symmetric
-                self.mean_ = self.mean_ + self.mean_.T
-                self.mean_ *= 0.5
-                self.whitening_ = None
-
+            self._update_mean(connectivities, n_subjects_seen)
             log("Finished fit", verbose=self.verbose)
 
         # Compute the vector we return on transform
         if do_transform:
             if self.kind == "tangent":
-                connectivities = [
-                    _map_eigenvalues(
-                        np.log, self.whitening_.dot(cov).dot(self.whitening_)
-                    )
-                    for cov in connectivities
-                ]
-
-            connectivities = np.array(connectivities)
+                connectivities = _map_eigenvalues(
+                    np.log, self.whitening_ @ connectivities @ self.whitening_
+                )
 
             if self.vectorize:
                 connectivities = sym_matrix_to_vec(
@@ -716,6 +861,101 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
 
         return connectivities
 
+    def _update_mean(self, connectivities, n_subjects_seen):
+        """Update mean_ and whitening_ with the matrices of new subjects.
+
+        Parameters
+        ----------
+        connectivities : numpy.ndarray, shape (n_subjects, n_features, \
+            n_features)
+            Connectivity matrices of the new subjects.
+            Covariance matrices for the "tangent" kind.
+
+        n_subjects_seen : :obj:`int`
+            Number of subjects summarized by the current mean_.
+            0 to compute the mean of the new subjects only.
+        """
+        if self.kind == "tangent" and n_subjects_seen > 0:
+            # warm start from the geometric mean of the previous subjects
+            self.mean_ = _geometric_mean(
+                [self.mean_, *connectivities],
+                init=self.mean_,
+                max_iter=30,
+                tol=1e-7,
+                weights=[n_subjects_seen] + [1] * len(connectivities),
+            )
+        elif self.kind == "tangent":
+            self.mean_ = _geometric_mean(connectivities, max_iter=30, tol=1e-7)
+        else:
+            mean = np.sum(connectivities, axis=0)
+            if n_subjects_seen > 0:
+                mean += n_subjects_seen * self.mean_
+            self.mean_ = mean / (n_subjects_seen + len(connectivities))
+            # Fight numerical instabilities: make symmetric
+            self.mean_ = self.mean_ + self.mean_.T
+            self.mean_ *= 0.5
+
+        if self.kind == "tangent":
+            self.whitening_ = _map_eigenvalues(
+                lambda x: 1.0 / np.sqrt(x), self.mean_
+            )
+        else:
+            self.whitening_ = None
+        self.n_subjects_seen_ = n_subjects_seen + len(connectivities)
+
+    def _compute_covariances(self, X):
+        """Compute the covariance matrix of each subject.
+
+        Subjects with the same number of samples are stacked
+        and processed in batches when the covariance estimator
+        is a :class:`~sklearn.covariance.LedoitWolf`.
+        Otherwise the estimator is fitted on each subject,
+        in parallel if ``n_jobs`` allows it.
+
+        Parameters
+        ----------
+        X : :obj:`list` of :class:`numpy.ndarray` \
+            each of shape (n_samples, n_features)
+            Each :class:`numpy.ndarray` represents a subject's time series.
+
+        Returns
+        -------
+        covariances : numpy.ndarray, shape (n_subjects, n_features, n_features)
+            The covariance matrices.
+        """
+        covariances = [None] * len(X)
+        remaining = list(range(len(X)))
+        if type(self.cov_estimator_) is LedoitWolf and self.n_features_in_ > 1:
+            remaining = []
+            subjects_by_n_samples = defaultdict(list)
+            for i, x in enumerate(X):
+                subjects_by_n_samples[x.shape[0]].append(i)
+            for n_samples, subjects in subjects_by_n_samples.items():
+                if n_samples == 1:
+                    remaining.extend(subjects)
+                    continue
+                batch_size = max(
+                    1, _MAX_BATCH_SIZE // (n_samples * self.n_features_in_)
+                )
+                for start in range(0, len(subjects), batch_size):
+                    batch = subjects[start : start + batch_size]
+                    batch_covariances = _ledoit_wolf_covariances(
+                        np.stack([X[i] for i in batch]),
+                        assume_centered=self.cov_estimator_.assume_centered,
+                    )
+                    for i, covariance in zip(
+                        batch, batch_covariances, strict=True
+                    ):
+                        covariances[i] = covariance
+
+        fitted = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(_fit_covariance)(clone(self.cov_estimator_), X[i])
+            for i in remaining
+        )
+        for i, covariance in zip(remaining, fitted, strict=True):
+            covariances[i] = covariance
+        return np.array(covariances)
+
     @fill_doc
     def fit_transform(self, X, y=None, confounds=None):
         """Fit the covariance estimator to the given time series \
@@ -832,13 +1072,11 @@ class ConnectivityMeasure(TransformerMixin, NilearnBaseEstimator):
 
         if self.kind == "tangent":
             mean_sqrt = _map_eigenvalues(np.sqrt, self.mean_)
-            connectivities = [
-                mean_sqrt.dot(_map_eigenvalues(np.exp, displacement)).dot(
-                    mean_sqrt
-                )
-                for displacement in connectivities
-            ]
-            connectivities = np.array(connectivities)
+            connectivities = (
+                mean_sqrt
+                @ _map_eigenvalues(np.exp, connectivities)
+                @ mean_sqrt
+            )
 
         return connectivities
 
@@ -5,6 +5,7 @@ graphical models.
 import collections.abc
 import itertools
 import operator
+import time
 import warnings
 
 import numpy as np
@@ -75,44 +76,59 @@ def compute_alpha_max(emp_covs, n_samples):
 
 
 def _update_submatrix(full, sub, sub_inv, p, h, v):
-    """Update submatrix and its inverse.
+    """Update submatrices and their inverses, for all subjects at once.
 
-    sub_inv is the inverse of the submatrix of "full" obtained by removing
+    sub_inv[k] is the inverse of the submatrix of full[k] obtained by removing
     the p-th row and column.
 
     sub_inv is modified in-place. After execution of this function, it contains
-    the inverse of the submatrix of "full" obtained by removing the n+1-th row
-    and column.
+    the inverses of the submatrices of "full" obtained by removing the n+1-th
+    row and column.
 
     This computation is based on the Sherman-Woodbury-Morrison identity.
 
+    Parameters
+    ----------
+    full : numpy.ndarray, shape (n_subjects, n_features, n_features)
+        Stack of full matrices.
+
+    sub, sub_inv : numpy.ndarray, shape (n_subjects, n_features - 1, \
+        n_features - 1)
+        Stacks of submatrices and of their inverses, modified in-place.
+
+    p : :obj:`int`
+        Index of the row and column removed from the new submatrices.
+
+    h, v : numpy.ndarray, shape (n_subjects, n_features - 1)
+        Auxiliary arrays.
+
     """
     n = p - 1
-    v[: n + 1] = full[: n + 1, n]
-    v[n + 1 :] = full[n + 2 :, n]
-    h[: n + 1] = full[n, : n + 1]
-    h[n + 1 :] = full[n, n + 2 :]
+    v[:, : n + 1] = full[:, : n + 1, n]
+    v[:, n + 1 :] = full[:, n + 2 :, n]
+    h[:, : n + 1] = full[:, n, : n + 1]
+    h[:, n + 1 :] = full[:, n, n + 2 :]
 
     # change row: first usage of SWM identity
-    coln = sub_inv[:, n : n + 1]  # 2d array, useful for sub_inv below
-    V = h - sub[n, :]
-    coln = coln / (1.0 + np.dot(V, coln))
+    coln = sub_inv[:, :, n]
+    V = h - sub[:, n, :]
+    coln = coln / (1.0 + np.einsum("ki,ki->k", V, coln))[:, np.newaxis]
     # The following line is equivalent to
-    # sub_inv -= np.outer(coln, np.dot(V, sub_inv))
-    sub_inv -= np.dot(coln, np.dot(V, sub_inv)[np.newaxis, :])
-    sub[n, :] = h
+    # sub_inv[k] -= np.outer(coln[k], np.dot(V[k], sub_inv[k]))
+    sub_inv -= coln[:, :, np.newaxis] * np.matmul(V[:, np.newaxis, :], sub_inv)
+    sub[:, n, :] = h
 
     # change column: second usage of SWM identity
-    rown = sub_inv[n : n + 1, :]  # 2d array, useful for sub_inv below
-    U = v - sub[:, n]
-    rown = rown / (1.0 + np.dot(rown, U))
-    # The following line is equivalent to (but faster)
-    # sub_inv -= np.outer(np.dot(sub_inv, U), rown)
-    sub_inv -= np.dot(np.dot(sub_inv, U)[:, np.newaxis], rown)
-    sub[:, n] = v  # equivalent to sub[n, :] += U
+    rown = sub_inv[:, n, :]
+    U = v - sub[:, :, n]
+    rown = rown / (1.0 + np.einsum("ki,ki->k", rown, U))[:, np.newaxis]
+    # The following line is equivalent to
+    # sub_inv[k] -= np.outer(np.dot(sub_inv[k], U[k]), rown[k])
+    sub_inv -= np.matmul(sub_inv, U[:, :, np.newaxis]) * rown[:, np.newaxis, :]
+    sub[:, :, n] = v  # equivalent to sub[:, n, :] += U
 
     # Make sub_inv symmetric (overcome some numerical limitations)
-    sub_inv += sub_inv.T.copy()
+    sub_inv += sub_inv.swapaxes(1, 2).copy()
     sub_inv /= 2.0
 
 
@@ -191,6 +207,9 @@ def group_sparse_covariance(
         - current value of precisions (ndarray).
         - previous value of precisions (ndarray). None before first iteration.
 
+        ``nilearn.connectome.group_sparse_cov.TimingProbe`` can be used
+        to record the time spent in each iteration.
+
     precisions_init : numpy.ndarray,  default=None
         initial value of the precision matrices. If not provided, a diagonal
         matrix with the variances of each input signal is used.
@@ -263,24 +282,18 @@ def _group_sparse_covariance(
 
     omega = _init_omega(emp_covs, precisions_init)
 
+    # Views with subjects along the first axis, to process all subjects
+    # in the same vectorized operations.
+    omega_stack = omega.transpose(2, 0, 1)
+    emp_covs_stack = emp_covs.transpose(2, 0, 1)
+
     # Preallocate arrays
     y = np.ndarray(shape=(n_subjects, n_features - 1), dtype=np.float64)
     u = np.ndarray(shape=(n_subjects, n_features - 1), dtype=np.float64)
-    y_1 = np.ndarray(shape=(n_subjects, n_features - 2), dtype=np.float64)
-    h_12 = np.ndarray(shape=(n_subjects, n_features - 2), dtype=np.float64)
-    q = np.ndarray(shape=(n_subjects,), dtype=np.float64)
-    aq = np.ndarray(shape=(n_subjects,), dtype=np.float64)  # temp. array
-    c = np.ndarray(shape=(n_subjects,), dtype=np.float64)
-    W = np.ndarray(
-        shape=(omega.shape[0] - 1, omega.shape[1] - 1, omega.shape[2]),
-        dtype=np.float64,
-        order="F",
-    )
-    W_inv = np.ndarray(shape=W.shape, dtype=np.float64, order="F")
 
     # Auxiliary arrays.
-    v = np.ndarray((omega.shape[0] - 1,), dtype=np.float64)
-    h = np.ndarray((omega.shape[1] - 1,), dtype=np.float64)
+    v = np.ndarray((n_subjects, n_features - 1), dtype=np.float64)
+    h = np.ndarray((n_subjects, n_features - 1), dtype=np.float64)
 
     # Optional.
     tolerance_reached = False
@@ -317,15 +330,15 @@ def _group_sparse_covariance(
         omega_old[...] = omega
         for p in range(n_features):
             if p == 0:
-                W, W_inv = _set_initial_state_w_and_w_inv(omega, debug, p)
+                W, W_inv = _set_initial_state_w_and_w_inv(
+                    omega_stack, debug, p
+                )
 
             else:
                 if debug:
                     omega_orig = omega.copy()
 
-                _update_w_and_w_inv(
-                    omega, debug, W, W_inv, n_subjects, p, h, v
-                )
+                _update_w_and_w_inv(omega_stack, debug, W, W_inv, p, h, v)
 
                 if debug:
                     # Check that omega has not been modified.
@@ -333,97 +346,66 @@ def _group_sparse_covariance(
 
             # In the following lines, implicit loop on k (subjects)
             # Extract y and u
-            y[:, :p] = omega[:p, p, :].T
-            y[:, p:] = omega[p + 1 :, p, :].T
+            y[:, :p] = omega_stack[:, :p, p]
+            y[:, p:] = omega_stack[:, p + 1 :, p]
+
+            u[:, :p] = emp_covs_stack[:, :p, p]
+            u[:, p:] = emp_covs_stack[:, p + 1 :, p]
+
+            # v(k) -> emp_covs[p, p, k]
+            v_p = emp_covs_stack[:, p, p]
+            t_v = n_samples * v_p
 
-            u[:, :p] = emp_covs[:p, p, :].T
-            u[:, p:] = emp_covs[p + 1 :, p, :].T
+            # W_inv(k).y(k), updated each time a coefficient of y changes.
+            # h_12(k).y_1(k) is then read from it instead of being
+            # recomputed for every coordinate.
+            w_inv_y = np.matmul(W_inv, y[:, :, np.newaxis])[:, :, 0]
+            # coefficients that are zero for all subjects stay unchanged
+            # when the optimal value is zero.
+            nonzero = y.any(axis=0).tolist()
 
             for m in range(n_features - 1):
                 # Coordinate descent on y
 
                 # T(k) -> n_samples[k]
-                # v(k) -> emp_covs[p, p, k]
-                # h_22(k) -> W_inv[m, m, k]
-                # h_12(k) -> W_inv[:m, m, k],  W_inv[m+1:, m, k]
+                # h_22(k) -> W_inv[k, m, m]
+                # h_12(k) -> W_inv[k, :m, m],  W_inv[k, m+1:, m]
                 # y_1(k) -> y[k, :m], y[k, m+1:]
                 # u_2(k) -> u[k, m]
-                h_12[:, :m] = W_inv[:m, m, :].T
-                h_12[:, m:] = W_inv[m + 1 :, m, :].T
-                y_1[:, :m] = y[:, :m]
-                y_1[:, m:] = y[:, m + 1 :]
-
-                c[:] = -n_samples * (
-                    emp_covs[p, p, :] * (h_12 * y_1).sum(axis=1) + u[:, m]
-                )
+                h_22 = W_inv[:, m, m]
+                y_m = y[:, m]
+                c = -n_samples * (v_p * (w_inv_y[:, m] - h_22 * y_m) + u[:, m])
                 c2 = np.sqrt(np.dot(c, c))
 
                 # x -> y[:][m]
                 if c2 <= alpha:
-                    y[:, m] = 0  # x* = 0
+                    if not nonzero[m]:
+                        continue
+                    x = 0.0  # x* = 0
+                    nonzero[m] = False
                 else:
                     # q(k) -> T(k) * v(k) * h_22(k)
                     # \lambda -> gamma   (lambda is a Python keyword)
-                    q[:] = n_samples * emp_covs[p, p, :] * W_inv[m, m, :]
-
-                    if debug:
-                        assert np.all(q > 0)
-                    # x* = \lambda* diag(1 + \lambda q)^{-1} c
-
-                    # Newton-Raphson loop. Loosely based on Scipy's.
-                    # Tolerance does not seem to be important for numerical
-                    # stability (tolerance of 1e-2 works) but has an effect on
-                    # overall convergence rate (the tighter the better.)
-
-                    gamma = 0.0  # initial value
-                    # Precompute some quantities
-                    cc = c * c
-                    two_ccq = 2.0 * cc * q
-                    for _ in itertools.repeat(None, 100):
-                        # Function whose zero must be determined (fval) and
-                        # its derivative (fder).
-                        # Written inplace to save some function calls.
-                        aq = 1.0 + gamma * q
-                        aq2 = aq * aq
-                        fder = (two_ccq / (aq2 * aq)).sum()
-
-                        if fder == 0:
-                            msg = "derivative was zero."
-                            warnings.warn(
-                                msg,
-                                RuntimeWarning,
-                                stacklevel=find_stack_level(),
-                            )
-                            break
-                        fval = -(alpha2 - (cc / aq2).sum()) / fder
-                        gamma = fval + gamma
-                        if abs(fval) < 1.5e-8:
-                            break
-
-                    if abs(fval) > 0.1:
-                        warnings.warn(
-                            "Newton-Raphson step did not converge.\n"
-                            "This may indicate a badly conditioned system.",
-                            stacklevel=find_stack_level(),
-                        )
+                    q = t_v * h_22
+                    x = _solve_coordinate(c, q, alpha2, debug)
+                    nonzero[m] = True
 
-                    if debug:
-                        assert gamma >= 0.0, gamma
-
-                    y[:, m] = (gamma * c) / aq  # x*
+                # W_inv(k) is symmetric: use its m-th row as m-th column
+                w_inv_y += W_inv[:, m, :] * (x - y_m)[:, np.newaxis]
+                y[:, m] = x
 
             # Copy back y in omega (column and row)
-            omega[:p, p, :] = y[:, :p].T
-            omega[p + 1 :, p, :] = y[:, p:].T
-            omega[p, :p, :] = y[:, :p].T
-            omega[p, p + 1 :, :] = y[:, p:].T
+            omega_stack[:, :p, p] = y[:, :p]
+            omega_stack[:, p + 1 :, p] = y[:, p:]
+            omega_stack[:, p, :p] = y[:, :p]
+            omega_stack[:, p, p + 1 :] = y[:, p:]
 
-            for k in range(n_subjects):
-                omega[p, p, k] = 1.0 / emp_covs[p, p, k] + np.dot(
-                    np.dot(y[k, :], W_inv[..., k]), y[k, :]
-                )
+            omega_stack[:, p, p] = 1.0 / v_p + np.einsum(
+                "ki,ki->k", np.matmul(W_inv, y[:, :, np.newaxis])[:, :, 0], y
+            )
 
-                if debug:
+            if debug:
+                for k in range(n_subjects):
                     assert is_spd(omega[..., k])
 
         if probe_function is not None and probe_function(
@@ -463,6 +445,78 @@ def _group_sparse_covariance(
     return omega
 
 
+def _solve_coordinate(c, q, alpha2, debug):
+    """Compute the optimal value of one coefficient for all subjects.
+
+    The coefficient is x* = gamma* diag(1 + gamma* q)^{-1} c, where gamma*
+    is the positive zero of a secular equation, found with a Newton-Raphson
+    loop.
+
+    Parameters
+    ----------
+    c : numpy.ndarray, shape (n_subjects,)
+        Linear term of the coordinate descent subproblem.
+
+    q : numpy.ndarray, shape (n_subjects,)
+        Quadratic term of the coordinate descent subproblem.
+
+    alpha2 : :obj:`float`
+        Square of the regularization parameter.
+
+    debug : :obj:`bool`
+        If True, check that q and gamma* are positive.
+
+    Returns
+    -------
+    x : numpy.ndarray, shape (n_subjects,)
+        Optimal value of the coefficient.
+    """
+    if debug:
+        assert np.all(q > 0)
+
+    # Newton-Raphson loop. Loosely based on Scipy's.
+    # Tolerance does not seem to be important for numerical
+    # stability (tolerance of 1e-2 works) but has an effect on
+    # overall convergence rate (the tighter the better.)
+
+    gamma = 0.0  # initial value
+    # Precompute some quantities
+    cc = c * c
+    two_ccq = 2.0 * cc * q
+    for _ in itertools.repeat(None, 100):
+        # Function whose zero must be determined (fval) and
+        # its derivative (fder).
+        # Written inplace to save some function calls.
+        aq_inv = 1.0 / (1.0 + gamma * q)
+        aq2_inv = aq_inv * aq_inv
+        fder = np.dot(two_ccq, aq2_inv * aq_inv)
+
+        if fder == 0:
+            msg = "derivative was zero."
+            warnings.warn(
+                msg,
+                RuntimeWarning,
+                stacklevel=find_stack_level(),
+            )
+            break
+        fval = -(alpha2 - np.dot(cc, aq2_inv)) / fder
+        gamma = fval + gamma
+        if abs(fval) < 1.5e-8:
+            break
+
+    if abs(fval) > 0.1:
+        warnings.warn(
+            "Newton-Raphson step did not converge.\n"
+            "This may indicate a badly conditioned system.",
+            stacklevel=find_stack_level(),
+        )
+
+    if debug:
+        assert gamma >= 0.0, gamma
+
+    return gamma * c * aq_inv  # x*
+
+
 def _init_omega(emp_covs, precisions_init):
     """Initialize omega value."""
     if precisions_init is None:
@@ -474,7 +528,7 @@ def _init_omega(emp_covs, precisions_init):
             # are timeseries energy.
             omega[..., k] = np.diag(1.0 / np.diag(emp_covs[..., k]))
     else:
-        omega = precisions_init.copy()
+        omega = np.array(precisions_init, dtype=np.float64, order="F")
 
     return omega
 
@@ -502,35 +556,40 @@ def _check_diagonal_normalization(emp_covs, n_subjects) -> None:
 
 
 def _set_initial_state_w_and_w_inv(omega, debug, p):
-    """Set initial state by removing first col/row."""
-    W = omega[1:, 1:, :].copy()  # stack of W(k)
-    W_inv = np.ndarray(shape=W.shape, dtype=np.float64)
-    for k in range(W.shape[2]):
-        # stack of W^-1(k)
-        W_inv[..., k] = scipy.linalg.inv(W[..., k])
-
-        if debug:
+    """Set initial state by removing first col/row.
+
+    omega is the stack of precision matrices,
+    of shape (n_subjects, n_features, n_features).
+    """
+    W = omega[:, 1:, 1:].copy()  # stack of W(k)
+    W_inv = np.linalg.inv(W)  # stack of W^-1(k)
+    # Make W_inv symmetric: its rows are used as columns in the main loop
+    W_inv += W_inv.swapaxes(1, 2).copy()
+    W_inv /= 2.0
+
+    if debug:
+        for k in range(W.shape[0]):
             np.testing.assert_almost_equal(
-                np.dot(W_inv[..., k], W[..., k]),
-                np.eye(W_inv[..., k].shape[0]),
+                np.dot(W_inv[k], W[k]),
+                np.eye(W_inv[k].shape[0]),
                 decimal=10,
             )
-            _assert_submatrix(omega[..., k], W[..., k], p)
-            assert is_spd(W_inv[..., k])
+            _assert_submatrix(omega[k], W[k], p)
+            assert is_spd(W_inv[k])
 
     return W, W_inv
 
 
-def _update_w_and_w_inv(omega, debug, W, W_inv, n_subjects, p, h, v):
-    for k in range(n_subjects):
-        _update_submatrix(omega[..., k], W[..., k], W_inv[..., k], p, h, v)
+def _update_w_and_w_inv(omega, debug, W, W_inv, p, h, v):
+    _update_submatrix(omega, W, W_inv, p, h, v)
 
-        if debug:
-            _assert_submatrix(omega[..., k], W[..., k], p)
-            assert is_spd(W_inv[..., k], decimal=14)
+    if debug:
+        for k in range(W.shape[0]):
+            _assert_submatrix(omega[k], W[k], p)
+            assert is_spd(W_inv[k], decimal=14)
             np.testing.assert_almost_equal(
-                np.dot(W[..., k], W_inv[..., k]),
-                np.eye(W_inv[..., k].shape[0]),
+                np.dot(W[k], W_inv[k]),
+                np.eye(W_inv[k].shape[0]),
                 decimal=10,
             )
 
@@ -791,11 +850,11 @@ def group_sparse_scores(
     """
     n_features, _, n_subjects = emp_covs.shape
 
-    log_lik = 0
-    for k in range(n_subjects):
-        log_lik_k = -np.sum(emp_covs[..., k] * precisions[..., k])
-        log_lik_k += fast_logdet(precisions[..., k])
-        log_lik += n_samples[k] * log_lik_k
+    # Same as fast_logdet for each subject
+    signs, logdets = np.linalg.slogdet(precisions.transpose(2, 0, 1))
+    logdets[signs <= 0] = -np.inf
+    log_lik_k = logdets - np.einsum("ijk,ijk->k", emp_covs, precisions)
+    log_lik = np.dot(n_samples, log_lik_k)
 
     l2 = np.sqrt((precisions**2).sum(axis=-1))
     l12 = l2.sum() - np.diag(l2).sum()  # Do not count diagonal terms
@@ -909,6 +968,9 @@ def group_sparse_covariance_path(
         - current value of precisions (ndarray).
         - previous value of precisions (ndarray). None before first iteration.
 
+        ``nilearn.connectome.group_sparse_cov.TimingProbe`` can be used
+        to record the time spent in each iteration.
+
     Returns
     -------
     precisions_list : :obj:`list` of numpy.ndarray
@@ -926,6 +988,11 @@ def group_sparse_covariance_path(
         train_subjs, assume_centered=False, standardize=True
     )
 
+    if test_subjs is not None:
+        test_covs, _ = empirical_covariances(
+            test_subjs, assume_centered=False, standardize=True
+        )
+
     scores = []
     precisions_list = []
     for alpha in alphas:
@@ -943,9 +1010,6 @@ def group_sparse_covariance_path(
 
         # Compute log-likelihood
         if test_subjs is not None:
-            test_covs, _ = empirical_covariances(
-                test_subjs, assume_centered=False, standardize=True
-            )
             scores.append(
                 group_sparse_scores(precisions, train_n_samples, test_covs, 0)[
                     0
@@ -998,6 +1062,61 @@ class EarlyStopProbe:
         self.last_log_lik = log_lik
 
 
+@fill_doc
+class TimingProbe:
+    """Callable probe recording the time spent in each iteration.
+
+    Can be used to profile group_sparse_covariance(): an instance of this
+    class is supposed to be passed in the probe_function argument of
+    group_sparse_covariance() or group_sparse_covariance_path().
+    Iterations of all the calls are recorded, which gives one record per
+    iteration and per value of alpha on a path.
+
+    .. nilearn_versionadded:: 0.14.0dev
+
+    Parameters
+    ----------
+    %(verbose0)s
+
+    Attributes
+    ----------
+    alphas : :obj:`list` of :obj:`float`
+        Regularization parameter of each recorded iteration.
+
+    times : :obj:`list` of :obj:`float`
+        Duration of each recorded iteration, in seconds.
+
+    """
+
+    def __init__(self, verbose=0):
+        self.verbose = verbose
+        self.alphas = []
+        self.times = []
+
+    def __call__(  # noqa: D102
+        self,
+        emp_covs,  # noqa: ARG002
+        n_samples,  # noqa: ARG002
+        alpha,
+        max_iter,  # noqa: ARG002
+        tol,  # noqa: ARG002
+        iter_n,
+        omega,  # noqa: ARG002
+        prev_omega,  # noqa: ARG002
+    ):
+        now = time.perf_counter()
+        if iter_n > -1:
+            self.alphas.append(alpha)
+            self.times.append(now - self._last_time)
+            logger.log(
+                f"iteration {iter_n:d} (alpha={alpha:.3e}): "
+                f"{self.times[-1]:.3f} s",
+                verbose=self.verbose,
+            )
+        # Do not count the time spent in this probe.
+        self._last_time = time.perf_counter()
+
+
 @fill_doc
 class GroupSparseCovarianceCV(NilearnBaseEstimator):
     """Sparse inverse covariance w/ cross-validated choice of the parameter.
@@ -23,6 +23,7 @@ from nilearn.connectome.connectivity_matrices import (
     _check_square,
     _form_symmetric,
     _geometric_mean,
+    _ledoit_wolf_covariances,
     _map_eigenvalues,
     prec_to_partial,
     sym_matrix_to_vec,
@@ -621,6 +622,67 @@ def test_prec_to_partial():
 
     assert_array_almost_equal(prec_to_partial(precision), partial)
 
+    # stacks of matrices are processed matrix by matrix
+    assert_array_almost_equal(
+        prec_to_partial(np.stack([precision, 2 * precision])),
+        np.stack([partial, partial]),
+    )
+
+
+@pytest.mark.parametrize("assume_centered", [True, False])
+def test_ledoit_wolf_covariances(rng, assume_centered):
+    signals = rng.standard_normal((4, 30, 6)) + 1.0
+    signals[1] *= 10.0
+
+    covariances = _ledoit_wolf_covariances(
+        signals, assume_centered=assume_centered
+    )
+
+    estimator = LedoitWolf(assume_centered=assume_centered)
+    for signal_, covariance in zip(signals, covariances, strict=True):
+        assert_array_almost_equal(
+            covariance, estimator.fit(signal_).covariance_, decimal=12
+        )
+
+
+@pytest.mark.thread_unsafe
+@pytest.mark.parametrize("kind", CONNECTIVITY_KINDS)
+def test_connectivity_measure_batches(monkeypatch, kind, signals):
+    """Check that batched covariances match fitting each subject."""
+    # subjects with the same number of samples are split in several batches
+    signals = signals + [s[:200] for s in signals]
+    monkeypatch.setattr(
+        "nilearn.connectome.connectivity_matrices._MAX_BATCH_SIZE",
+        2 * 200 * N_FEATURES,
+    )
+
+    connectivities = ConnectivityMeasure(
+        kind=kind, standardize="zscore_sample"
+    ).fit_transform(signals)
+
+    # a subclass of LedoitWolf is fitted on each subject
+    class _LedoitWolf(LedoitWolf):
+        pass
+
+    expected = ConnectivityMeasure(
+        kind=kind,
+        cov_estimator=_LedoitWolf(store_precision=False),
+        standardize="zscore_sample",
+    ).fit_transform(signals)
+
+    assert_array_almost_equal(connectivities, expected)
+
+
+def test_connectivity_measure_n_jobs(signals):
+    conn_measure = ConnectivityMeasure(
+        cov_estimator=EmpiricalCovariance(), standardize="zscore_sample"
+    )
+    expected = conn_measure.fit_transform(signals)
+
+    connectivities = conn_measure.set_params(n_jobs=2).fit_transform(signals)
+
+    assert_array_almost_equal(connectivities, expected)
+
 
 def test_connectivity_measure_errors():
     # Raising error for input subjects not iterable
@@ -888,6 +950,45 @@ def test_connectivity_measure_check_vectorization_option(kind, signals):
     )
 
 
+@pytest.mark.parametrize("kind", CONNECTIVITY_KINDS)
+def test_connectivity_measure_partial_fit(kind, signals):
+    """Check that streaming subjects with partial_fit gives the mean of fit."""
+    expected = ConnectivityMeasure(kind=kind, standardize="zscore_sample").fit(
+        signals
+    )
+
+    conn_measure = ConnectivityMeasure(kind=kind, standardize="zscore_sample")
+    for start in range(0, N_SUBJECTS, 2):
+        conn_measure.partial_fit(signals[start : start + 2])
+
+    assert conn_measure.n_subjects_seen_ == N_SUBJECTS
+    if kind == "tangent":
+        # the geometric mean is refined batch by batch
+        assert np.linalg.norm(
+            conn_measure.mean_ - expected.mean_
+        ) < 0.05 * np.linalg.norm(expected.mean_)
+        assert is_spd(conn_measure.whitening_, decimal=7)
+    else:
+        assert_array_almost_equal(conn_measure.mean_, expected.mean_)
+        assert conn_measure.whitening_ is None
+
+    # partial_fit continues from fit
+    conn_measure = ConnectivityMeasure(kind=kind, standardize="zscore_sample")
+    conn_measure.fit(signals[:3]).partial_fit(signals[3:])
+
+    assert conn_measure.n_subjects_seen_ == N_SUBJECTS
+    if kind != "tangent":
+        assert_array_almost_equal(conn_measure.mean_, expected.mean_)
+
+
+def test_connectivity_measure_partial_fit_errors(signals):
+    conn_measure = ConnectivityMeasure(standardize="zscore_sample")
+    conn_measure.partial_fit(signals[:2])
+
+    with pytest.raises(ValueError, match="features"):
+        conn_measure.partial_fit([s[:, :-1] for s in signals[2:]])
+
+
 @pytest.mark.parametrize(
     "kind",
     ["covariance", "correlation", "precision", "partial correlation"],
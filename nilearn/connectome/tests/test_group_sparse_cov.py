@@ -12,7 +12,10 @@ from nilearn._utils.estimator_checks import (
 from nilearn._utils.versions import SKLEARN_LT_1_6
 from nilearn.connectome import GroupSparseCovariance, GroupSparseCovarianceCV
 from nilearn.connectome.group_sparse_cov import (
+    TimingProbe,
+    _update_submatrix,
     group_sparse_covariance,
+    group_sparse_covariance_path,
     group_sparse_scores,
 )
 
@@ -151,6 +154,52 @@ def test_group_sparse_covariance_with_probe_function(rng, duality_gap):
     assert omega.shape == (10, 10, 5)
 
 
+def test_update_submatrix(rng):
+    """Check the inverses of the submatrices updated for all subjects."""
+    n_subjects, n_features = 3, 6
+    full = rng.standard_normal((n_subjects, n_features, n_features))
+    full = full @ full.swapaxes(1, 2) + n_features * np.eye(n_features)
+
+    sub = full[:, 1:, 1:].copy()
+    sub_inv = np.linalg.inv(sub)
+    h = np.empty((n_subjects, n_features - 1))
+    v = np.empty((n_subjects, n_features - 1))
+    for p in range(1, n_features):
+        _update_submatrix(full, sub, sub_inv, p, h, v)
+
+        expected = np.delete(np.delete(full, p, axis=1), p, axis=2)
+        np.testing.assert_almost_equal(sub, expected)
+        np.testing.assert_almost_equal(sub_inv, np.linalg.inv(expected))
+
+
+def test_timing_probe(rng):
+    signals, _, _ = generate_group_sparse_gaussian_graphs(
+        density=0.1,
+        n_subjects=5,
+        n_features=10,
+        min_n_samples=100,
+        max_n_samples=151,
+        random_state=rng,
+    )
+
+    probe = TimingProbe()
+    group_sparse_covariance(
+        signals, 0.1, max_iter=3, tol=None, probe_function=probe
+    )
+
+    assert len(probe.times) == 3
+    assert all(t >= 0 for t in probe.times)
+    assert probe.alphas == [0.1] * 3
+
+    # one record per iteration and per alpha on a path
+    probe = TimingProbe()
+    group_sparse_covariance_path(
+        signals, [0.2, 0.1], max_iter=2, tol=None, probe_function=probe
+    )
+
+    assert probe.alphas == [0.2, 0.2, 0.1, 0.1]
+
+
 def test_group_sparse_covariance_check_consistency_between_classes(rng):
     signals, _, _ = generate_group_sparse_gaussian_graphs(
         density=0.1,
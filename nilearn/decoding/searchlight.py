@@ -7,13 +7,19 @@ in the neighborhood of each location of a domain.
 import time
 import warnings
 from copy import deepcopy
+from numbers import Real
+from pathlib import Path
 from typing import Any
 
+import joblib
 import numpy as np
 from joblib import Parallel, cpu_count, delayed
-from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.base import BaseEstimator, TransformerMixin, is_classifier
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 from sklearn.exceptions import ConvergenceWarning
-from sklearn.model_selection import KFold, cross_val_score
+from sklearn.linear_model import Ridge, RidgeClassifier
+from sklearn.model_selection import KFold, check_cv, cross_val_score
+from sklearn.naive_bayes import GaussianNB
 from sklearn.utils import check_array
 from sklearn.utils.estimator_checks import check_is_fitted
 from sklearn.utils.validation import has_fit_parameter
@@ -94,6 +100,7 @@ def search_light(
     cv=None,
     n_jobs=-1,
     verbose=0,
+    checkpoint_dir=None,
 ):
     """Compute a search_light.
 
@@ -128,32 +135,147 @@ def search_light(
 
     %(verbose0)s
 
+    %(checkpoint_dir)s
+
     Returns
     -------
     scores : array-like of shape (number of rows in A)
         search_light scores
+
+    Notes
+    -----
+    Rows of ``A`` are distributed across jobs
+    so that each job gets about the same number of features.
+    If ``checkpoint_dir`` is not None, rows are instead processed
+    by groups of a fixed number of spheres, which do not depend on ``n_jobs``.
+
+    The cross-validation of
+    :class:`~sklearn.linear_model.Ridge`,
+    :class:`~sklearn.linear_model.RidgeClassifier`
+    (with a scalar ``alpha``),
+    :class:`~sklearn.naive_bayes.GaussianNB`
+    and :class:`~sklearn.discriminant_analysis.LinearDiscriminantAnalysis`
+    (with ``solver="lsqr"`` and a float ``shrinkage``)
+    is computed in closed form for batches of spheres at once,
+    when ``y`` is 1D and ``scoring`` is None, ``"accuracy"``
+    for classifiers or ``"r2"`` for regressors.
     """
     check_params(locals())
 
-    group_iter = GroupIterator(A.shape[0], n_jobs)
-    scores = Parallel(n_jobs=n_jobs, verbose=verbose)(
-        delayed(_group_iter_search_light)(
-            A.rows[list_i],
-            estimator,
-            X,
-            y,
-            groups,
-            scoring,
-            cv,
-            thread_id + 1,
+    A = A.tocsr()
+    checkpoint_dir = _checkpoint_dir(
+        checkpoint_dir, X, y, estimator, A, groups, scoring, cv
+    )
+    if checkpoint_dir is None:
+        list_groups = list(
+            GroupIterator(A.shape[0], n_jobs, sizes=np.diff(A.indptr))
+        )
+    else:
+        # Small groups that do not depend on n_jobs,
+        # so that an interruption loses little work
+        # and the search light can be resumed with other resources.
+        list_groups = [
+            np.arange(start, min(start + _CHECKPOINT_GROUP_SIZE, A.shape[0]))
+            for start in range(0, A.shape[0], _CHECKPOINT_GROUP_SIZE)
+        ]
+
+    if _has_closed_form_cv(estimator, scoring, y):
+        y = np.asarray(y)
+        if isinstance(cv, KFold):
+            groups = None
+        folds = list(
+            check_cv(cv, y, classifier=is_classifier(estimator)).split(
+                X, y, groups
+            )
+        )
+        group_function = _closed_form_search_light
+        group_args = [
+            (A[list_i], estimator, X, y, folds) for list_i in list_groups
+        ]
+    else:
+        group_function = _group_iter_search_light
+        group_args = [
+            (
+                [A.indices[A.indptr[i] : A.indptr[i + 1]] for i in list_i],
+                estimator,
+                X,
+                y,
+                groups,
+                scoring,
+                cv,
+            )
+            for list_i in list_groups
+        ]
+
+    checkpoint_files = [
+        _checkpoint_file(checkpoint_dir, list_i) for list_i in list_groups
+    ]
+    scores = [
+        np.load(path) if path is not None and path.exists() else None
+        for path in checkpoint_files
+    ]
+    todo = [i for i, group_scores in enumerate(scores) if group_scores is None]
+    new_scores = Parallel(n_jobs=n_jobs, verbose=verbose)(
+        delayed(_run_and_save)(
+            checkpoint_files[i],
+            group_function,
+            *group_args[i],
+            i + 1,
             A.shape[0],
             verbose,
         )
-        for thread_id, list_i in enumerate(group_iter)
+        for i in todo
     )
+    for i, group_scores in zip(todo, new_scores, strict=True):
+        scores[i] = group_scores
     return np.concatenate(scores)
 
 
+# Number of spheres of each group of a checkpointed search light.
+_CHECKPOINT_GROUP_SIZE = 1000
+
+
+def _checkpoint_dir(checkpoint_dir, *inputs):
+    """Return the directory holding the checkpoints \
+    of a search light with the given inputs.
+    """
+    if checkpoint_dir is None:
+        return None
+    directory = Path(checkpoint_dir) / f"search_light_{joblib.hash(inputs)}"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _checkpoint_file(checkpoint_dir, list_i):
+    """Return the file holding the scores of a group of spheres."""
+    if checkpoint_dir is None or len(list_i) == 0:
+        return None
+    return checkpoint_dir / f"scores_{list_i[0]}_{list_i[-1] + 1}.npy"
+
+
+def _run_and_save(path, function, *args):
+    """Compute the scores of a group of spheres and save them to path."""
+    scores = function(*args)
+    if path is not None:
+        # Write to a temporary file first,
+        # so that an interruption never leaves a truncated file.
+        temporary_path = path.with_name(f"tmp_{path.name}")
+        np.save(temporary_path, scores)
+        temporary_path.replace(path)
+    return scores
+
+
+def _load_checkpoint(checkpoint_dir, n_rows):
+    """Return the scores saved in a checkpoint directory, \
+    with NaN for the spheres whose scores were not saved.
+    """
+    scores = np.full(n_rows, np.nan)
+    for path in checkpoint_dir.glob("scores_*.npy"):
+        start, stop = (int(i) for i in path.stem.split("_")[1:])
+        scores[start:stop] = np.load(path)
+    return scores
+
+
 @fill_doc
 class GroupIterator:
     """Group iterator.
@@ -167,17 +289,38 @@ class GroupIterator:
         Total number of features
     %(n_jobs)s
 
+    sizes : array-like of shape (n_features,) or None, default=None
+        Cost of processing each feature,
+        for example the number of voxels of each searchlight sphere.
+        If given, groups are split so that their total sizes are balanced.
+        Otherwise groups have the same number of features.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     """
 
-    def __init__(self, n_features, n_jobs=1):
+    def __init__(self, n_features, n_jobs=1, sizes=None):
         self.n_features = n_features
         if n_jobs == -1:
             n_jobs = cpu_count()
         self.n_jobs = n_jobs
+        self.sizes = sizes
         check_params(self.__dict__)
 
     def __iter__(self):
-        yield from np.array_split(np.arange(self.n_features), self.n_jobs)
+        if self.sizes is None:
+            yield from np.array_split(np.arange(self.n_features), self.n_jobs)
+            return
+        cumulative_sizes = np.cumsum(self.sizes)
+        targets = (
+            cumulative_sizes[-1] * np.arange(1, self.n_jobs) / self.n_jobs
+            if self.n_features
+            else []
+        )
+        yield from np.split(
+            np.arange(self.n_features),
+            np.searchsorted(cumulative_sizes, targets, side="right"),
+        )
 
 
 @fill_doc
@@ -280,22 +423,280 @@ def _group_iter_search_light(
             # One can't print less than each 10 iterations
             step = 11 - min(verbose, 10)
             if i % step == 0:
-                # If there is only one job, progress information is fixed
-                crlf = "\r" if total == len(list_rows) else "\n"
-                percent = float(i) / len(list_rows)
-                percent = round(percent * 100, 2)
-                dt = time.time() - t0
-                # We use a max to avoid a division by zero
-                remaining = (100.0 - percent) / max(0.01, percent) * dt
-                logger.log(
-                    f"Job #{thread_id}, processed {i}/{len(list_rows)} steps "
-                    f"({percent:0.2f}%, "
-                    f"{readable_time(remaining)} remaining){crlf}",
-                    verbose,
-                )
+                _log_progress(i, len(list_rows), t0, thread_id, total, verbose)
     return par_scores
 
 
+def _log_progress(i, n_rows, t0, thread_id, total, verbose):
+    """Log the progress of a searchlight job."""
+    # If there is only one job, progress information is fixed
+    crlf = "\r" if total == n_rows else "\n"
+    percent = float(i) / n_rows
+    percent = round(percent * 100, 2)
+    dt = time.time() - t0
+    # We use a max to avoid a division by zero
+    remaining = (100.0 - percent) / max(0.01, percent) * dt
+    logger.log(
+        f"Job #{thread_id}, processed {i}/{n_rows} steps "
+        f"({percent:0.2f}%, "
+        f"{readable_time(remaining)} remaining){crlf}",
+        verbose,
+    )
+
+
+# Maximum size of the arrays holding the data of a batch of spheres
+# in the closed-form cross-validation of linear estimators.
+_SEARCHLIGHT_BATCH_BYTES = 2**26
+
+
+def _has_closed_form_cv(estimator, scoring, y):
+    """Check whether the cross-validation of an estimator \
+    can be computed in closed form by _closed_form_search_light.
+    """
+    if y is None or np.ndim(y) != 1:
+        return False
+    if not getattr(estimator, "nilearn_searchlight_uses_cv", True):
+        return False
+    if scoring not in (None, "accuracy" if is_classifier(estimator) else "r2"):
+        return False
+
+    # Subclasses may change the model: only accept exact types.
+    if type(estimator) in (Ridge, RidgeClassifier):
+        return (
+            isinstance(estimator.alpha, Real)
+            and estimator.alpha > 0
+            and not estimator.positive
+            and estimator.solver in ("auto", "cholesky", "svd")
+            and getattr(estimator, "class_weight", None) is None
+        )
+    if type(estimator) is GaussianNB:
+        return True
+    if type(estimator) is LinearDiscriminantAnalysis:
+        return (
+            estimator.solver == "lsqr"
+            and estimator.covariance_estimator is None
+            and isinstance(estimator.shrinkage, Real)
+            and 0 < estimator.shrinkage <= 1
+        )
+    return False
+
+
+@fill_doc
+def _closed_form_search_light(
+    rows, estimator, X, y, folds, thread_id, total, verbose=0
+):
+    """Compute the cross-validated scores of linear estimators \
+    on batches of spheres.
+
+    The data of the spheres of a batch is gathered
+    in an array of shape (n_spheres, n_samples, max_sphere_size),
+    zero-padded for smaller spheres,
+    so that all spheres are fitted with batched linear algebra.
+    Padded features do not change the predictions.
+
+    Parameters
+    ----------
+    rows : scipy.sparse.csr_matrix
+        adjacency rows of the spheres to process.
+
+    estimator : scikit-learn estimator object
+        estimator accepted by _has_closed_form_cv.
+
+    X : array-like of shape (n_samples, n_features)
+        data to fit.
+
+    y : numpy.ndarray of shape (n_samples,)
+        target variable to predict.
+
+    folds : list of tuples of arrays
+        train and test indices of each cross-validation fold.
+
+    thread_id : int
+        process id, used for display.
+
+    total : int
+        Total number of voxels, used for display
+
+    %(verbose0)s
+
+    Returns
+    -------
+    par_scores : numpy.ndarray
+        mean score across folds for each sphere. dtype: float64.
+    """
+    # X is shared between jobs: only the spheres of a batch
+    # are converted to float64.
+    X = np.asarray(X)
+    n_rows = rows.shape[0]
+    sizes = np.diff(rows.indptr)
+    max_size = int(sizes.max(initial=1))
+    batch_size = max(
+        1,
+        _SEARCHLIGHT_BATCH_BYTES
+        // (8 * max_size * (X.shape[0] + 2 * max_size)),
+    )
+
+    fold_scores = np.empty((len(folds), n_rows))
+    t0 = time.time()
+    for start in range(0, n_rows, batch_size):
+        batch = slice(start, start + batch_size)
+        batch_sizes = sizes[batch]
+        valid = np.arange(batch_sizes.max()) < batch_sizes[:, np.newaxis]
+        features = np.zeros(valid.shape, dtype=np.intp)
+        features[valid] = rows.indices[
+            rows.indptr[start] : rows.indptr[min(batch.stop, n_rows)]
+        ]
+        # (n_spheres, n_samples, max_sphere_size)
+        X_spheres = np.multiply(
+            np.moveaxis(X[:, features], 0, 1),
+            valid[:, np.newaxis],
+            dtype=np.float64,
+        )
+
+        for i_fold, (train, test) in enumerate(folds):
+            y_pred = _closed_form_predict(
+                estimator,
+                X_spheres[:, train],
+                y[train],
+                X_spheres[:, test],
+                valid,
+            )
+            fold_scores[i_fold, batch] = _closed_form_score(
+                y[test], y_pred, is_classifier(estimator)
+            )
+
+        if verbose > 0:
+            _log_progress(
+                min(batch.stop, n_rows), n_rows, t0, thread_id, total, verbose
+            )
+    return fold_scores.mean(axis=0)
+
+
+def _batched_solve(a, b):
+    """Solve a batch of linear systems, even singular ones."""
+    try:
+        return np.linalg.solve(a, b)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(a) @ b
+
+
+def _closed_form_predict(estimator, X_train, y_train, X_test, valid):
+    """Fit a linear estimator on a batch of spheres \
+    and predict the test targets.
+
+    X_train and X_test are of shape (n_spheres, n_samples, max_sphere_size),
+    valid of shape (n_spheres, max_sphere_size)
+    and the predictions of shape (n_spheres, n_test_samples).
+    """
+    if isinstance(estimator, (Ridge, RidgeClassifier)):
+        if isinstance(estimator, RidgeClassifier):
+            # Targets in {-1, 1} as in RidgeClassifier.fit,
+            # with a single column for binary problems.
+            classes, y_index = np.unique(y_train, return_inverse=True)
+            if classes.size <= 2:
+                targets = np.where(y_index == 1, 1.0, -1.0)[:, np.newaxis]
+            else:
+                targets = -np.ones((y_index.size, classes.size))
+                targets[np.arange(y_index.size), y_index] = 1.0
+        else:
+            targets = y_train[:, np.newaxis].astype(np.float64)
+
+        X_offset = 0.0
+        y_offset = 0.0
+        if estimator.fit_intercept:
+            X_offset = X_train.mean(axis=1, keepdims=True)
+            y_offset = targets.mean(axis=0)
+            X_train = X_train - X_offset
+            targets = targets - y_offset
+
+        n_train, n_features = X_train.shape[1:]
+        if n_features <= n_train:
+            gram = np.swapaxes(X_train, 1, 2) @ X_train
+            gram[:, np.arange(n_features), np.arange(n_features)] += (
+                estimator.alpha
+            )
+            coef = _batched_solve(gram, np.swapaxes(X_train, 1, 2) @ targets)
+        else:
+            # Dual formulation with fewer samples than features.
+            kernel = X_train @ np.swapaxes(X_train, 1, 2)
+            kernel[:, np.arange(n_train), np.arange(n_train)] += (
+                estimator.alpha
+            )
+            coef = np.swapaxes(X_train, 1, 2) @ _batched_solve(kernel, targets)
+        decision = (X_test - X_offset) @ coef + y_offset
+
+        if isinstance(estimator, Ridge):
+            return decision[..., 0]
+        if decision.shape[2] == 1:
+            positive = (decision[..., 0] > 0) & (classes.size == 2)
+            return classes[positive.astype(int)]
+        return classes[decision.argmax(axis=2)]
+
+    classes, y_index = np.unique(y_train, return_inverse=True)
+    if estimator.priors is None:
+        priors = np.bincount(y_index) / y_index.size
+    else:
+        priors = np.asarray(estimator.priors, dtype=np.float64)
+        priors = priors / priors.sum()
+
+    if isinstance(estimator, GaussianNB):
+        # Same epsilon for all classes, computed from the variance
+        # of all training samples, as in GaussianNB.fit.
+        epsilon = estimator.var_smoothing * X_train.var(axis=1).max(axis=1)
+        log_likelihood = np.empty((*X_test.shape[:2], classes.size))
+        for k in range(classes.size):
+            X_class = X_train[:, y_index == k]
+            mean = X_class.mean(axis=1, keepdims=True)
+            var = (
+                X_class.var(axis=1, keepdims=True)
+                + epsilon[:, np.newaxis, np.newaxis]
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                terms = np.log(2.0 * np.pi * var) + (X_test - mean) ** 2 / var
+            log_likelihood[..., k] = np.log(priors[k]) - 0.5 * np.sum(
+                np.where(valid[:, np.newaxis], terms, 0), axis=2
+            )
+        return classes[log_likelihood.argmax(axis=2)]
+
+    # LinearDiscriminantAnalysis with the lsqr solver
+    # and a shrunk covariance of each class.
+    n_features = valid.sum(axis=1)
+    shrinkage = estimator.shrinkage
+    means = np.empty((X_train.shape[0], classes.size, X_train.shape[2]))
+    covariance = np.zeros((X_train.shape[0],) + (X_train.shape[2],) * 2)
+    diagonal = np.arange(X_train.shape[2])
+    for k in range(classes.size):
+        X_class = X_train[:, y_index == k]
+        means[:, k] = X_class.mean(axis=1)
+        X_class = X_class - means[:, k, np.newaxis]
+        class_covariance = (
+            np.swapaxes(X_class, 1, 2) @ X_class / X_class.shape[1]
+        )
+        mu = np.trace(class_covariance, axis1=1, axis2=2) / n_features
+        class_covariance *= 1.0 - shrinkage
+        class_covariance[:, diagonal, diagonal] += (
+            shrinkage * mu[:, np.newaxis]
+        )
+        covariance += priors[k] * class_covariance
+    coef = _batched_solve(covariance, np.swapaxes(means, 1, 2))
+    intercept = -0.5 * np.einsum("bkp,bpk->bk", means, coef) + np.log(priors)
+    decision = X_test @ coef + intercept[:, np.newaxis]
+    return classes[decision.argmax(axis=2)]
+
+
+def _closed_form_score(y_true, y_pred, classifier):
+    """Compute the accuracy or the coefficient of determination \
+    of the predictions of a batch of spheres.
+    """
+    if classifier:
+        return np.mean(y_pred == y_true, axis=1)
+    residuals = np.sum((y_true - y_pred) ** 2, axis=1)
+    total = np.sum((y_true - y_true.mean()) ** 2)
+    if total == 0:
+        return np.where(residuals == 0, 1.0, 0.0)
+    return 1 - residuals / total
+
+
 ##############################################################################
 # Class for search_light #####################################################
 ##############################################################################
@@ -351,6 +752,10 @@ class SearchLight(TransformerMixin, NilearnBaseEstimator):
 
     %(estimator_args)s
 
+    %(checkpoint_dir)s
+
+        See :meth:`load_checkpoint` to get the scores saved so far.
+
     Attributes
     ----------
     mask_img_ : Nifti1Image or :obj:`~nilearn.surface.SurfaceImage`
@@ -391,6 +796,12 @@ class SearchLight(TransformerMixin, NilearnBaseEstimator):
     fine-grained information, that can be used for assessing hypothesis
     on the local spatial layout of the neural code under investigation.
 
+    The cross-validation of some linear estimators, such as
+    :class:`~sklearn.linear_model.RidgeClassifier` or
+    :class:`~sklearn.naive_bayes.GaussianNB`,
+    is computed in closed form for many spheres at once,
+    which is much faster than fitting each sphere.
+
     Nikolaus Kriegeskorte, Rainer Goebel & Peter Bandettini.
     Information-based functional brain mapping.
     Proceedings of the National Academy of Sciences
@@ -410,6 +821,7 @@ class SearchLight(TransformerMixin, NilearnBaseEstimator):
         verbose=0,
         random_state=0,
         estimator_args=None,
+        checkpoint_dir=None,
     ):
         self.mask_img = mask_img
         self.process_mask_img = process_mask_img
@@ -421,6 +833,7 @@ class SearchLight(TransformerMixin, NilearnBaseEstimator):
         self.verbose = verbose
         self.random_state = random_state
         self.estimator_args = estimator_args
+        self.checkpoint_dir = checkpoint_dir
 
     def __sklearn_tags__(self):
         """Return estimator tags.
@@ -491,6 +904,72 @@ class SearchLight(TransformerMixin, NilearnBaseEstimator):
             group label for each sample for cross validation. Must have
             exactly as many elements as 3D images in img.
         """
+        X, A, estimator = self._prepare_search_light(imgs, y)
+
+        scores = search_light(
+            X,
+            y,
+            estimator,
+            A,
+            groups,
+            self.scoring,
+            self.cv,
+            self.n_jobs,
+            self.verbose,
+            self.checkpoint_dir,
+        )
+        self._set_scores(scores)
+        return self
+
+    def load_checkpoint(self, imgs, y, groups=None):
+        """Load the scores saved so far in ``checkpoint_dir``.
+
+        This gives partial results of a call to :meth:`fit`
+        with the same inputs
+        that is still running, for example in another process,
+        or that was interrupted.
+        Spheres whose scores have not been saved yet get a NaN score.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
+        Parameters
+        ----------
+        imgs : Niimg-like object
+            See :ref:`extracting_data`.
+            4D image.
+
+        y : 1D array-like
+            Target variable to predict. Must have exactly as many elements as
+            3D images in img.
+
+        groups : array-like, default=None
+            group label for each sample for cross validation. Must have
+            exactly as many elements as 3D images in img.
+        """
+        if self.checkpoint_dir is None:
+            raise ValueError(
+                "'checkpoint_dir' must be set to load a checkpoint."
+            )
+        X, A, estimator = self._prepare_search_light(imgs, y)
+
+        A = A.tocsr()
+        checkpoint_dir = _checkpoint_dir(
+            self.checkpoint_dir,
+            X,
+            y,
+            estimator,
+            A,
+            groups,
+            self.scoring,
+            self.cv,
+        )
+        self._set_scores(_load_checkpoint(checkpoint_dir, A.shape[0]))
+        return self
+
+    def _prepare_search_light(self, imgs, y):
+        """Check the inputs of fit \
+        and compute the data and adjacency of the spheres.
+        """
         check_params(self.__dict__)
 
         # check if image is 4D
@@ -548,21 +1027,12 @@ class SearchLight(TransformerMixin, NilearnBaseEstimator):
 
         _check_searchlight_estimator(estimator, scoring=self.scoring, y=y)
 
-        scores = search_light(
-            X,
-            y,
-            estimator,
-            A,
-            groups,
-            self.scoring,
-            self.cv,
-            self.n_jobs,
-            self.verbose,
-        )
+        return X, A, estimator
+
+    def _set_scores(self, scores):
         self.masked_scores_ = scores
-        self.scores_ = np.zeros(process_mask.shape)
-        self.scores_[np.where(process_mask)] = scores
-        return self
+        self.scores_ = np.zeros(self.process_mask_.shape)
+        self.scores_[np.where(self.process_mask_)] = scores
 
     def __sklearn_is_fitted__(self) -> bool:
         return (
@@ -3,8 +3,13 @@
 import numpy as np
 import pytest
 from nibabel import Nifti1Image
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from scipy import sparse
 from sklearn.base import BaseEstimator
-from sklearn.model_selection import KFold, LeaveOneGroupOut
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+from sklearn.linear_model import Ridge, RidgeClassifier
+from sklearn.model_selection import KFold, LeaveOneGroupOut, cross_val_score
+from sklearn.naive_bayes import GaussianNB
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
 from nilearn._utils.estimator_checks import (
@@ -499,3 +504,280 @@ def test_searchlight_estimator_type_plain_base_estimator():
     assert not searchlight.SearchLight(
         estimator=_NoCVEstimator()
     )._estimator_type
+
+
+# ---------------------------------------------------------------------------
+# Load balancing and closed-form cross-validation
+# ---------------------------------------------------------------------------
+
+
+def test_group_iterator_sizes():
+    """Check that groups are balanced by the size of the features."""
+    sizes = np.array([10, 10, 10, 10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1])
+
+    groups = list(searchlight.GroupIterator(sizes.size, n_jobs=2, sizes=sizes))
+
+    assert len(groups) == 2
+    assert_array_equal(np.concatenate(groups), np.arange(sizes.size))
+    assert [sizes[group].sum() for group in groups] == [20, 32]
+
+    groups = list(searchlight.GroupIterator(sizes.size, n_jobs=2))
+
+    assert [sizes[group].sum() for group in groups] == [44, 8]
+
+
+def _random_adjacency(rng, n_features, density):
+    adjacency = sparse.random(
+        n_features, n_features, density=density, random_state=rng
+    ).tolil()
+    adjacency.setdiag(1)
+    return adjacency
+
+
+@pytest.mark.parametrize(
+    "estimator, classes",
+    [
+        (Ridge(), None),
+        (Ridge(alpha=3.0, fit_intercept=False), None),
+        (RidgeClassifier(), 2),
+        (RidgeClassifier(alpha=0.5), 3),
+        (GaussianNB(), 2),
+        (GaussianNB(), 3),
+        (LinearDiscriminantAnalysis(solver="lsqr", shrinkage=0.3), 2),
+        (LinearDiscriminantAnalysis(solver="lsqr", shrinkage=0.7), 3),
+    ],
+)
+@pytest.mark.parametrize("cv", [KFold(n_splits=4), LeaveOneGroupOut()])
+@pytest.mark.parametrize("density", [0.1, 0.8])
+def test_search_light_closed_form(rng, estimator, classes, cv, density):
+    """Check closed-form scores against cross_val_score for each sphere."""
+    n_samples, n_features = 40, 50
+    X = rng.normal(size=(n_samples, n_features))
+    if classes is None:
+        y = X[:, 0] + rng.normal(size=n_samples)
+    else:
+        y = rng.integers(0, classes, n_samples)
+    groups = np.arange(n_samples) % 4
+    adjacency = _random_adjacency(rng, n_features, density)
+
+    assert searchlight._has_closed_form_cv(estimator, None, y)
+
+    scores = searchlight.search_light(
+        X, y, estimator, adjacency, groups=groups, cv=cv, n_jobs=1
+    )
+
+    expected = [
+        np.mean(
+            cross_val_score(
+                estimator,
+                X[:, row],
+                y,
+                cv=cv,
+                groups=None if isinstance(cv, KFold) else groups,
+            )
+        )
+        for row in adjacency.rows
+    ]
+    assert_array_almost_equal(scores, expected)
+
+
+def test_search_light_closed_form_batches(rng, monkeypatch):
+    """Check that batches of spheres and jobs do not change scores."""
+    X = rng.normal(size=(30, 40))
+    y = rng.integers(0, 2, 30)
+    adjacency = _random_adjacency(rng, 40, 0.2)
+    estimator = RidgeClassifier()
+
+    scores = searchlight.search_light(
+        X, y, estimator, adjacency, cv=3, n_jobs=1
+    )
+
+    monkeypatch.setattr(searchlight, "_SEARCHLIGHT_BATCH_BYTES", 1)
+    assert_array_almost_equal(
+        searchlight.search_light(X, y, estimator, adjacency, cv=3, n_jobs=2),
+        scores,
+    )
+
+
+def test_search_light_closed_form_float32(rng):
+    """Check that single precision data is fitted in double precision."""
+    X = rng.normal(size=(30, 40)).astype(np.float32)
+    y = X[:, 0] + rng.normal(size=30)
+    adjacency = _random_adjacency(rng, 40, 0.2)
+
+    scores = searchlight.search_light(X, y, Ridge(), adjacency, cv=3, n_jobs=1)
+
+    assert scores.dtype == np.float64
+    assert_array_equal(
+        scores,
+        searchlight.search_light(
+            X.astype(np.float64), y, Ridge(), adjacency, cv=3, n_jobs=1
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "estimator, scoring, y",
+    [
+        (Ridge(), "neg_mean_squared_error", np.ones(5)),
+        (Ridge(), None, np.ones((5, 2))),
+        (Ridge(), None, None),
+        (Ridge(alpha=[1.0]), None, np.ones(5)),
+        (Ridge(positive=True), None, np.ones(5)),
+        (Ridge(solver="sag"), None, np.ones(5)),
+        (RidgeClassifier(class_weight="balanced"), None, np.ones(5)),
+        (LinearDiscriminantAnalysis(), None, np.ones(5)),
+        (
+            LinearDiscriminantAnalysis(solver="lsqr", shrinkage="auto"),
+            None,
+            np.ones(5),
+        ),
+        (_NoCVEstimator(), None, np.ones(5)),
+    ],
+)
+def test_has_closed_form_cv_false(estimator, scoring, y):
+    """Check estimators whose cross-validation is not in closed form."""
+    assert not searchlight._has_closed_form_cv(estimator, scoring, y)
+
+
+def test_searchlight_closed_form_estimator():
+    """Check SearchLight with an estimator using the closed form."""
+    frames = 30
+    data_img, cond, mask_img = _make_searchlight_test_data(frames)
+    cv, n_jobs = define_cross_validation()
+
+    sl = searchlight.SearchLight(
+        mask_img,
+        process_mask_img=mask_img,
+        radius=1,
+        n_jobs=n_jobs,
+        scoring="accuracy",
+        cv=cv,
+        estimator=GaussianNB(),
+    )
+    with pytest.warns(UserWarning, match="Use a custom estimator"):
+        sl.fit(data_img, cond)
+
+    assert sl.scores_[2, 2, 2] == 1.0
+    assert np.where(sl.scores_ == 1)[0].size == 7
+
+
+# ---------------------------------------------------------------------------
+# Checkpointing
+# ---------------------------------------------------------------------------
+
+
+def test_search_light_checkpoint(rng, tmp_path, monkeypatch):
+    """Check that saved groups of spheres are not computed again."""
+    monkeypatch.setattr(searchlight, "_CHECKPOINT_GROUP_SIZE", 10)
+    X = rng.normal(size=(20, 40))
+    y = rng.integers(0, 2, 20)
+    adjacency = _random_adjacency(rng, 40, 0.1)
+    estimator = _EstimatorWithDecisionFunction()
+
+    scores = searchlight.search_light(
+        X, y, estimator, adjacency, cv=2, n_jobs=1, checkpoint_dir=tmp_path
+    )
+
+    (checkpoint_dir,) = tmp_path.iterdir()
+    files = sorted(checkpoint_dir.iterdir())
+    assert len(files) == 4
+
+    # all groups are loaded
+    def _fail(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError("group computed again")
+
+    monkeypatch.setattr(searchlight, "_group_iter_search_light", _fail)
+    assert_array_equal(
+        searchlight.search_light(
+            X, y, estimator, adjacency, cv=2, n_jobs=1, checkpoint_dir=tmp_path
+        ),
+        scores,
+    )
+
+    # other inputs use another directory
+    with pytest.raises(AssertionError, match="group computed again"):
+        searchlight.search_light(
+            X,
+            1 - y,
+            estimator,
+            adjacency,
+            cv=2,
+            n_jobs=1,
+            checkpoint_dir=tmp_path,
+        )
+
+
+def test_search_light_checkpoint_n_jobs(rng, tmp_path, monkeypatch):
+    """Check that a search light can be resumed with another n_jobs."""
+    monkeypatch.setattr(searchlight, "_CHECKPOINT_GROUP_SIZE", 10)
+    X = rng.normal(size=(20, 45))
+    y = rng.integers(0, 2, 20)
+    adjacency = _random_adjacency(rng, 45, 0.1)
+    estimator = _EstimatorWithDecisionFunction()
+
+    scores = searchlight.search_light(
+        X, y, estimator, adjacency, cv=2, n_jobs=1, checkpoint_dir=tmp_path
+    )
+
+    (checkpoint_dir,) = tmp_path.iterdir()
+    files = sorted(checkpoint_dir.iterdir())
+    assert len(files) == 5
+    files[-1].unlink()
+
+    # more jobs than groups: only the missing group is computed again
+    resumed_scores = searchlight.search_light(
+        X, y, estimator, adjacency, cv=2, n_jobs=6, checkpoint_dir=tmp_path
+    )
+
+    assert sorted(checkpoint_dir.iterdir()) == files
+    assert_array_equal(resumed_scores, scores)
+
+
+def test_searchlight_load_checkpoint(tmp_path, monkeypatch):
+    """Check partial scores and resuming of SearchLight.fit."""
+    monkeypatch.setattr(searchlight, "_CHECKPOINT_GROUP_SIZE", 50)
+    frames = 30
+    data_img, cond, mask_img = _make_searchlight_test_data(frames)
+    cv, n_jobs = define_cross_validation()
+
+    sl = searchlight.SearchLight(
+        mask_img,
+        process_mask_img=mask_img,
+        radius=1,
+        n_jobs=n_jobs,
+        scoring="accuracy",
+        cv=cv,
+        checkpoint_dir=tmp_path,
+    )
+    sl.fit(data_img, cond)
+    scores = sl.scores_.copy()
+
+    (checkpoint_dir,) = tmp_path.iterdir()
+    files = sorted(checkpoint_dir.iterdir())
+    assert len(files) == 3
+    n_missing = np.load(files[0]).size
+    files[0].unlink()
+
+    sl.load_checkpoint(data_img, cond)
+
+    missing = np.isnan(sl.masked_scores_)
+    assert missing.sum() == n_missing
+    assert_array_equal(
+        sl.masked_scores_[~missing],
+        scores[np.where(sl.process_mask_)][~missing],
+    )
+
+    # only the missing group is computed again
+    sl.fit(data_img, cond)
+
+    assert_array_equal(sl.scores_, scores)
+    assert len(list(checkpoint_dir.iterdir())) == 3
+
+
+def test_searchlight_load_checkpoint_error():
+    """Check that load_checkpoint requires a checkpoint directory."""
+    data_img, cond, mask_img = _make_searchlight_test_data(10)
+
+    with pytest.raises(ValueError, match="'checkpoint_dir' must be set"):
+        searchlight.SearchLight(mask_img).load_checkpoint(data_img, cond)
@@ -13,7 +13,7 @@ from string import Template
 from typing import get_args
 
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from nibabel import Nifti1Image
 from scipy import linalg
 from sklearn.base import TransformerMixin
@@ -207,32 +207,13 @@ def _mask_and_reduce(
     if not hasattr(imgs, "__iter__"):
         imgs = [imgs]
 
-    if reduction_ratio == "auto":
-        if n_components is None:
-            # Reduction ratio is 1 if
-            # neither n_components nor ratio is provided
-            reduction_ratio = 1
-    else:
-        reduction_ratio = (
-            1 if reduction_ratio is None else float(reduction_ratio)
-        )
-        if not 0 <= reduction_ratio <= 1:
-            raise ValueError(
-                "Reduction ratio should be between 0.0 and 1.0, "
-                f"got {reduction_ratio:.2f}"
-            )
+    reduction_ratio, n_samples = _check_reduction_ratio(
+        reduction_ratio, n_components
+    )
 
     if confounds is None:
         confounds = itertools.repeat(confounds)
 
-    if reduction_ratio == "auto":
-        n_samples = n_components
-        reduction_ratio = None
-    else:
-        # We'll let _mask_and_reduce_single decide on the number of
-        # samples based on the reduction_ratio
-        n_samples = None
-
     data_list = Parallel(n_jobs=n_jobs)(
         delayed(_mask_and_reduce_single)(
             masker,
@@ -267,6 +248,178 @@ def _mask_and_reduce(
     return data
 
 
+def _check_reduction_ratio(reduction_ratio, n_components):
+    """Return the reduction ratio and number of samples kept per subject.
+
+    Exactly one of the returned values is None: either each subject is
+    reduced to ``n_samples`` samples, or its number of samples is
+    multiplied by ``reduction_ratio``.
+    """
+    if reduction_ratio == "auto":
+        if n_components is None:
+            # Reduction ratio is 1 if
+            # neither n_components nor ratio is provided
+            reduction_ratio = 1
+    else:
+        reduction_ratio = (
+            1 if reduction_ratio is None else float(reduction_ratio)
+        )
+        if not 0 <= reduction_ratio <= 1:
+            raise ValueError(
+                "Reduction ratio should be between 0.0 and 1.0, "
+                f"got {reduction_ratio:.2f}"
+            )
+
+    if reduction_ratio == "auto":
+        return None, n_components
+    # We'll let _mask_and_reduce_single decide on the number of
+    # samples based on the reduction_ratio
+    return reduction_ratio, None
+
+
+def _mask_and_reduce_incremental(
+    masker,
+    imgs,
+    n_dimensions,
+    confounds=None,
+    reduction_ratio="auto",
+    n_components=None,
+    random_state=None,
+    n_jobs=1,
+    normalize=False,
+):
+    """Mask, reduce and incrementally merge provided 4D images.
+
+    Same as :func:`_mask_and_reduce`, but instead of concatenating the
+    reduced data of all subjects, each subject is merged into a group
+    principal subspace of ``n_dimensions`` dimensions as soon as it is
+    reduced (MELODIC's Incremental Group-PCA, MIGP). Only ``n_jobs``
+    subjects are held in memory at the same time.
+
+    Parameters
+    ----------
+    masker : :obj:`~nilearn.maskers.NiftiMasker` or \
+        :obj:`~nilearn.maskers.MultiNiftiMasker` or \
+        :obj:`~nilearn.maskers.SurfaceMasker`
+        Instance used to mask provided data.
+
+    imgs : list of 4D Niimg-like objects or list of \
+        :obj:`~nilearn.surface.SurfaceImage`
+        See :ref:`extracting_data`.
+        List of subject data to mask, reduce and merge.
+
+    n_dimensions : :obj:`int`
+        Number of dimensions of the group principal subspace.
+
+    confounds : CSV file path, numpy ndarray, pandas DataFrame, or None \
+            default=None
+        This parameter is passed to signal.clean. Please see the
+        corresponding documentation for details.
+
+    reduction_ratio : 'auto' or float between 0.0 and 1.0, default='auto'
+        See :func:`_mask_and_reduce`.
+
+    n_components : integer or None, default=None
+        Number of components per subject to be extracted by dimension reduction
+
+    %(random_state)s
+        default=0
+
+    n_jobs : integer, default=1
+        The number of CPUs to use to do the computation. -1 means
+        'all CPUs', -2 'all CPUs but one', and so on.
+
+    normalize : :obj:`bool` or "rms", default=False
+        Whether to normalize the rows of the reduced data of each subject
+        before merging it, as done by :class:`_MultiPCA` when ``do_cca``.
+        If "rms", the merged data is then multiplied by the root mean
+        square of the norms of the rows before normalization,
+        so that its overall scale does not change.
+
+    Returns
+    -------
+    data : ndarray of shape (n_samples, n_features)
+        Reduced group data, with ``n_samples <= n_dimensions``.
+    """
+    if not hasattr(imgs, "__iter__"):
+        imgs = [imgs]
+    imgs = list(imgs)
+
+    reduction_ratio, n_samples = _check_reduction_ratio(
+        reduction_ratio, n_components
+    )
+
+    if confounds is None:
+        confounds = itertools.repeat(confounds)
+    imgs_and_confounds = list(zip(imgs, confounds, strict=False))
+
+    # Reduce n_jobs subjects at a time so that the memory used does not
+    # depend on the total number of subjects
+    batch_size = effective_n_jobs(n_jobs)
+    data = None
+    squared_norms, n_rows = 0.0, 0
+    for start in range(0, len(imgs_and_confounds), batch_size):
+        data_list = Parallel(n_jobs=n_jobs)(
+            delayed(_mask_and_reduce_single)(
+                masker,
+                img,
+                confound,
+                reduction_ratio=reduction_ratio,
+                n_samples=n_samples,
+                random_state=random_state,
+            )
+            for img, confound in imgs_and_confounds[start : start + batch_size]
+        )
+        for subject_data in data_list:
+            if normalize:
+                S = np.sqrt(np.sum(subject_data**2, axis=1))
+                squared_norms += np.sum(S**2)
+                n_rows += S.shape[0]
+                S[S == 0] = 1
+                subject_data /= S[:, np.newaxis]
+            data = _incremental_group_pca(data, subject_data, n_dimensions)
+    if normalize == "rms" and squared_norms > 0:
+        data *= np.sqrt(squared_norms / n_rows)
+    return data
+
+
+def _incremental_group_pca(group_data, subject_data, n_dimensions):
+    """Merge the data of one subject into the group principal subspace.
+
+    The rows of both arrays are stacked and, if there are more than
+    ``n_dimensions`` of them, projected onto their ``n_dimensions``
+    first principal directions. As the number of rows is small, these
+    are obtained from the eigendecomposition of the Gram matrix.
+
+    Parameters
+    ----------
+    group_data : ndarray of shape (n_group_samples, n_features) or None
+        Current group data. None if no subject was merged yet.
+
+    subject_data : ndarray of shape (n_subject_samples, n_features)
+        Reduced data of the subject to merge.
+
+    n_dimensions : :obj:`int`
+        Number of dimensions of the group principal subspace.
+
+    Returns
+    -------
+    group_data : ndarray of shape (n_samples, n_features)
+        Updated group data, with ``n_samples <= n_dimensions``. Its rows
+        are the principal directions scaled by the singular values.
+    """
+    if group_data is not None:
+        subject_data = np.concatenate([group_data, subject_data])
+    n_samples = subject_data.shape[0]
+    if n_samples <= n_dimensions:
+        return subject_data
+    _, U = linalg.eigh(
+        subject_data @ subject_data.T,
+        subset_by_index=[n_samples - n_dimensions, n_samples - 1],
+    )
+    return U[:, ::-1].T @ subject_data
+
+
 def _mask_and_reduce_single(
     masker,
     img,
@@ -375,6 +528,8 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, NilearnBaseEstimator):
         to fine-tune mask computation.
         Please see the related documentation for details.
 
+    %(incremental_group_pca)s
+
     memory : instance of joblib.Memory or str, default=None
         Used to cache the masking process.
         By default, no caching is done.
@@ -411,6 +566,7 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, NilearnBaseEstimator):
         target_shape=None,
         mask_strategy="epi",
         mask_args=None,
+        incremental_group_pca=None,
         memory=None,
         memory_level=0,
         n_jobs=1,
@@ -432,6 +588,7 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, NilearnBaseEstimator):
         self.target_shape = target_shape
         self.mask_strategy = mask_strategy
         self.mask_args = mask_args
+        self.incremental_group_pca = incremental_group_pca
         self.memory = memory
         self.memory_level = memory_level
         self.n_jobs = n_jobs
@@ -528,6 +685,16 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, NilearnBaseEstimator):
                 f"must match number of images ({len(imgs)=})."
             )
 
+        if (
+            self.incremental_group_pca is not None
+            and self.incremental_group_pca < self.n_components
+        ):
+            raise ValueError(
+                "'incremental_group_pca' must be greater than or equal to "
+                f"'n_components', got {self.incremental_group_pca=} and "
+                f"{self.n_components=}."
+            )
+
         self._fit_cache()
 
         self._validate_mask()
@@ -572,15 +739,14 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, NilearnBaseEstimator):
         # _mask_and_reduce step for decomposition estimators i.e.
         # MultiPCA, CanICA and Dictionary Learning
         logger.log("Loading data", self.verbose)
-        data = _mask_and_reduce(
-            self.masker_,
-            imgs,
-            confounds=confounds,
-            n_components=self.n_components,
-            random_state=self.random_state,
-            n_jobs=self.n_jobs,
+        data = self._reduce_data(imgs, confounds)
+        # With incremental_group_pca, the data of each subject
+        # is normalized by _reduce_data before being merged
+        self._raw_fit(
+            data,
+            normalized=self.incremental_group_pca is not None
+            and bool(self._normalize_subject_data()),
         )
-        self._raw_fit(data)
 
         # Create and fit appropriate MapsMasker for transform
         # and inverse_transform
@@ -615,6 +781,37 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, NilearnBaseEstimator):
 
         return self
 
+    def _normalize_subject_data(self):
+        """Return how the rows of the reduced data of each subject \
+        are normalized before being merged with incremental_group_pca.
+
+        See the ``normalize`` parameter of
+        :func:`_mask_and_reduce_incremental`.
+        """
+        return getattr(self, "do_cca", False)
+
+    def _reduce_data(self, imgs, confounds):
+        """Mask and reduce the data of all subjects with the fitted masker."""
+        if self.incremental_group_pca is None:
+            return _mask_and_reduce(
+                self.masker_,
+                imgs,
+                confounds=confounds,
+                n_components=self.n_components,
+                random_state=self.random_state,
+                n_jobs=self.n_jobs,
+            )
+        return _mask_and_reduce_incremental(
+            self.masker_,
+            imgs,
+            self.incremental_group_pca,
+            confounds=confounds,
+            n_components=self.n_components,
+            random_state=self.random_state,
+            n_jobs=self.n_jobs,
+            normalize=self._normalize_subject_data(),
+        )
+
     @property
     def n_elements_(self) -> int:
         return self.maps_masker_.n_elements_
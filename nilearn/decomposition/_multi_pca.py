@@ -48,6 +48,8 @@ class _MultiPCA(_BaseDecomposition):
         to fine-tune mask computation.
         Please see the related documentation for details.
 
+    %(incremental_group_pca)s
+
     %(standardize_false)s
 
     standardize_confounds : boolean, default=True
@@ -127,6 +129,7 @@ class _MultiPCA(_BaseDecomposition):
         target_shape=None,
         mask_strategy="epi",
         mask_args=None,
+        incremental_group_pca=None,
         memory=None,
         memory_level=0,
         n_jobs=1,
@@ -148,6 +151,7 @@ class _MultiPCA(_BaseDecomposition):
             target_shape=target_shape,
             mask_strategy=mask_strategy,
             mask_args=mask_args,
+            incremental_group_pca=incremental_group_pca,
             memory=memory,
             memory_level=memory_level,
             n_jobs=n_jobs,
@@ -156,11 +160,23 @@ class _MultiPCA(_BaseDecomposition):
 
         self.do_cca = do_cca
 
-    def _raw_fit(self, data):
-        """Process unmasked data directly."""
+    def _raw_fit(self, data, normalized=False):
+        """Process unmasked data directly.
+
+        Parameters
+        ----------
+        data : ndarray
+            Shape (n_samples, n_features)
+
+        normalized : :obj:`bool`, default=False
+            Whether the data of each subject was already normalized
+            before being merged in the group data,
+            in which case ``do_cca`` does not normalize it again.
+        """
         self._fit_cache()
 
-        if self.do_cca:
+        normalize = self.do_cca and not normalized
+        if normalize:
             S = np.sqrt(np.sum(data**2, axis=1))
             S[S == 0] = 1
             data /= S[:, np.newaxis]
@@ -173,7 +189,7 @@ class _MultiPCA(_BaseDecomposition):
             random_state=self.random_state,
             n_iter=3,
         )
-        if self.do_cca:
+        if normalize:
             data *= S[:, np.newaxis]
         self.components_ = components_.T
         if hasattr(self, "masker_"):
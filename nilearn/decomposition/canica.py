@@ -1,15 +1,17 @@
 """Canonical Independent Component Analysis."""
 
+import time
 import warnings as _warnings
-from operator import itemgetter
 from typing import get_args
 
 import numpy as np
 from joblib import Parallel, delayed
+from scipy.optimize import linear_sum_assignment
 from scipy.stats import scoreatpercentile
 from sklearn.decomposition import fastica
 from sklearn.utils import check_random_state
 
+from nilearn._utils import logger
 from nilearn._utils.docs import fill_doc
 from nilearn._utils.logger import find_stack_level
 from nilearn._utils.param_validation import check_is_of_allowed_type
@@ -18,6 +20,58 @@ from nilearn.maskers import MultiNiftiMasker, MultiSurfaceMasker
 from nilearn.nilearn_typing import NiimgLike
 from nilearn.surface import SurfaceImage
 
+# Number of fastICA restarts compared with the previous ones at once
+# for early stopping. It does not depend on n_jobs, so that the restarts
+# stop at the same point whatever the number of jobs.
+_STABILITY_WINDOW = 5
+
+
+def _run_fastica(fastica_func, components, seed):
+    """Run fastICA once and return the maps, their sparsity and duration."""
+    t0 = time.perf_counter()
+    _, _, sources = fastica_func(
+        components,
+        whiten="arbitrary-variance",
+        fun="cube",
+        random_state=seed,
+    )
+    ica_maps = sources.T
+    sparsity = np.sum(np.abs(ica_maps), axis=1).max()
+    return ica_maps, sparsity, time.perf_counter() - t0
+
+
+def _match_components(reference, ica_maps):
+    """Pair independent components with reference components.
+
+    The pairs maximize the sum of the absolute correlations.
+
+    Parameters
+    ----------
+    reference : numpy array (n_components, n_features)
+        Reference components.
+
+    ica_maps : numpy array (n_components, n_features)
+        Components to pair with the reference.
+
+    Returns
+    -------
+    matched_maps : numpy array (n_components, n_features)
+        ``ica_maps`` reordered and with signs flipped
+        to be positively correlated with the reference.
+
+    correlations : numpy array (n_components,)
+        Absolute correlations between each reference component
+        and its pair.
+    """
+    n_components = reference.shape[0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlations = np.corrcoef(reference, ica_maps)
+    correlations = np.nan_to_num(correlations[:n_components, n_components:])
+    _, order = linear_sum_assignment(-np.abs(correlations))
+    correlations = correlations[np.arange(n_components), order]
+    signs = np.where(correlations < 0, -1.0, 1.0)
+    return ica_maps[order] * signs[:, np.newaxis], np.abs(correlations)
+
 
 @fill_doc
 class CanICA(_MultiPCA):
@@ -51,6 +105,21 @@ class CanICA(_MultiPCA):
     n_init : :obj:`int`, default=10
         The number of times the fastICA algorithm is restarted
 
+    stability_tol : :obj:`float` or None, default=None
+        If not None, stop restarting the fastICA algorithm
+        before ``n_init`` restarts
+        when the mean absolute correlation of the components
+        of a window of 5 restarts with the components
+        of the previous restarts changes by less than ``stability_tol``
+        from the one of the previous window.
+        As it does not average over all restarts, this criterion does not
+        depend on the number of restarts already done.
+        It does not depend on ``n_jobs`` either.
+        Note that the correlation can converge at a low value
+        if the components are not stable: check ``stability_``.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     %(random_state)s
 
     %(standardize_true)s
@@ -103,6 +172,8 @@ class CanICA(_MultiPCA):
         to fine-tune mask computation.
         Please see the related documentation for details.
 
+    %(incremental_group_pca)s
+
     %(memory)s
 
     %(memory_level)s
@@ -119,6 +190,28 @@ class CanICA(_MultiPCA):
         The amount of variance explained
         by each of the selected components.
 
+    n_init_ : :obj:`int`
+        The number of times the fastICA algorithm was run.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
+    init_times_ : numpy array (n_init_,)
+        The duration in seconds of each run of the fastICA algorithm.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
+    stability_ : :obj:`float` or None
+        Stability index of the independent components across runs,
+        between 0 and 1.
+        The components of each run are paired
+        with the ones of the previous runs,
+        and the index is the mean absolute correlation of the pairs.
+        A low value means that the components differ across runs,
+        even if the restarts were stopped by ``stability_tol``.
+        None if the fastICA algorithm was run only once.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     References
     ----------
     .. footbibliography::
@@ -133,6 +226,7 @@ class CanICA(_MultiPCA):
         do_cca=True,
         threshold="auto",
         n_init=10,
+        stability_tol=None,
         random_state=None,
         standardize=True,
         standardize_confounds=True,
@@ -145,6 +239,7 @@ class CanICA(_MultiPCA):
         target_shape=None,
         mask_strategy="epi",
         mask_args=None,
+        incremental_group_pca=None,
         memory=None,
         memory_level=0,
         n_jobs=1,
@@ -167,6 +262,7 @@ class CanICA(_MultiPCA):
             target_shape=target_shape,
             mask_strategy=mask_strategy,
             mask_args=mask_args,
+            incremental_group_pca=incremental_group_pca,
             memory=memory,
             memory_level=memory_level,
             n_jobs=n_jobs,
@@ -175,6 +271,7 @@ class CanICA(_MultiPCA):
 
         self.threshold = threshold
         self.n_init = n_init
+        self.stability_tol = stability_tol
 
     def _unmix_components(self, components) -> None:
         """Core function of CanICA than rotate components_ to maximize \
@@ -183,23 +280,64 @@ class CanICA(_MultiPCA):
         random_state = check_random_state(self.random_state)
 
         seeds = random_state.randint(np.iinfo(np.int32).max, size=self.n_init)
-        # Note: fastICA is very unstable, hence we use 64bit on it
-        results = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
-            delayed(self._cache(fastica, func_memory_level=2))(
-                components.astype(np.float64),
-                whiten="arbitrary-variance",
-                fun="cube",
-                random_state=seed,
-            )
-            for seed in seeds
-        )
-
-        ica_maps_gen_ = (result[2].T for result in results)
-        ica_maps_and_sparsities = (
-            (ica_map, np.sum(np.abs(ica_map), axis=1).max())
-            for ica_map in ica_maps_gen_
+        # Note: fastICA is very unstable, hence we use 64bit on it.
+        # The array is converted once and shared by all the runs:
+        # joblib memory maps it for worker processes.
+        components = components.astype(np.float64)
+        fastica_func = self._cache(fastica, func_memory_level=2)
+
+        # Runs are done by windows of _STABILITY_WINDOW restarts, so that
+        # only the best maps and the ones of the current window are held in
+        # memory. Each window is run by batches of n_jobs restarts.
+        # The workers and the memory mapped array are reused across windows.
+        ica_maps, best_sparsity = None, np.inf
+        centroids, correlations = None, []
+        init_times, window_stability = [], None
+        with Parallel(n_jobs=self.n_jobs, verbose=self.verbose) as parallel:
+            for start in range(0, self.n_init, _STABILITY_WINDOW):
+                results = parallel(
+                    delayed(_run_fastica)(fastica_func, components, seed)
+                    for seed in seeds[start : start + _STABILITY_WINDOW]
+                )
+                window_correlations = []
+                for maps, sparsity, duration in results:
+                    init_times.append(duration)
+                    logger.log(
+                        f"FastICA run {len(init_times)}/{self.n_init} "
+                        f"done in {duration:.2f}s",
+                        self.verbose,
+                    )
+                    if ica_maps is None or sparsity < best_sparsity:
+                        ica_maps, best_sparsity = maps, sparsity
+                    if centroids is None:
+                        centroids = maps.copy()
+                        continue
+                    matched_maps, matched_correlations = _match_components(
+                        centroids, maps
+                    )
+                    centroids += matched_maps
+                    window_correlations.append(matched_correlations.mean())
+                correlations.extend(window_correlations)
+
+                # The stop compares consecutive windows: a running mean over
+                # all the restarts would change by less than 1 / n_restarts
+                # whatever the stability of the components.
+                previous_stability = window_stability
+                if window_correlations:
+                    window_stability = float(np.mean(window_correlations))
+                if (
+                    self.stability_tol is not None
+                    and previous_stability is not None
+                    and abs(window_stability - previous_stability)
+                    < self.stability_tol
+                ):
+                    break
+
+        self.n_init_ = len(init_times)
+        self.init_times_ = np.asarray(init_times)
+        self.stability_ = (
+            float(np.mean(correlations)) if correlations else None
         )
-        ica_maps, _ = min(ica_maps_and_sparsities, key=itemgetter(-1))
 
         # Thresholding
         ratio = None
@@ -242,7 +380,7 @@ class CanICA(_MultiPCA):
             )
 
     # Overriding _MultiPCA._raw_fit overrides _MultiPCA.fit behavior
-    def _raw_fit(self, data):
+    def _raw_fit(self, data, normalized=False):
         """Process unmasked data directly.
 
         Useful when called by another estimator that has already
@@ -253,6 +391,10 @@ class CanICA(_MultiPCA):
         data : ndarray or memmap
             Unmasked data to process
 
+        normalized : :obj:`bool`, default=False
+            Whether the data of each subject was already normalized
+            before being merged in the group data.
+
         """
         if (
             isinstance(self.threshold, float)
@@ -264,7 +406,13 @@ class CanICA(_MultiPCA):
                 f"and you provided threshold={self.threshold}."
             )
 
-        components = _MultiPCA._raw_fit(self, data)
+        if self.stability_tol is not None and self.stability_tol <= 0:
+            raise ValueError(
+                "'stability_tol' must be None or a positive float. "
+                f"You provided {self.stability_tol=}."
+            )
+
+        components = _MultiPCA._raw_fit(self, data, normalized=normalized)
 
         self._unmix_components(components)
         return self
@@ -142,6 +142,15 @@ class DictLearning(_BaseDecomposition):
         to fine-tune mask computation.
         Please see the related documentation for details.
 
+    %(incremental_group_pca)s
+
+        .. note::
+            Unless ``dict_init`` is given, the rows of the reduced data
+            of each subject are then normalized before being merged,
+            as required by the initialization with
+            :class:`~nilearn.decomposition.CanICA`,
+            and the merged data is rescaled to their mean norm.
+
     %(n_jobs)s
 
     %(verbose0)s
@@ -189,6 +198,7 @@ class DictLearning(_BaseDecomposition):
         target_shape=None,
         mask_strategy="epi",
         mask_args=None,
+        incremental_group_pca=None,
         n_jobs=1,
         verbose=0,
         memory=None,
@@ -210,6 +220,7 @@ class DictLearning(_BaseDecomposition):
             target_shape=target_shape,
             mask_strategy=mask_strategy,
             mask_args=mask_args,
+            incremental_group_pca=incremental_group_pca,
             memory=memory,
             memory_level=memory_level,
             n_jobs=n_jobs,
@@ -222,7 +233,13 @@ class DictLearning(_BaseDecomposition):
         self.reduction_ratio = reduction_ratio
         self.dict_init = dict_init
 
-    def _init_dict(self, data):
+    def _normalize_subject_data(self):
+        # The initial components are computed by CanICA with do_cca=True,
+        # which cannot normalize the subjects once they are merged.
+        # The scale of the data the dictionary is learnt on is kept.
+        return "rms" if self.dict_init is None else False
+
+    def _init_dict(self, data, normalized=False):
         if self.dict_init is not None:
             components = self.masker_.transform(self.dict_init)
         else:
@@ -235,6 +252,7 @@ class DictLearning(_BaseDecomposition):
                 # mask parameter is not useful as we bypass masking
                 mask=self.masker_,
                 random_state=self.random_state,
+                incremental_group_pca=self.incremental_group_pca,
                 memory=self.memory,
                 memory_level=self.memory_level,
                 n_jobs=self.n_jobs,
@@ -244,7 +262,7 @@ class DictLearning(_BaseDecomposition):
                 warnings.simplefilter("ignore", UserWarning)
                 # We use protected function _raw_fit as data
                 # has already been unmasked
-                canica._raw_fit(data)
+                canica._raw_fit(data, normalized=normalized)
             components = canica.components_
         S = (components**2).sum(axis=1)
         S[S == 0] = 1
@@ -256,7 +274,7 @@ class DictLearning(_BaseDecomposition):
             self.components_init_, data
         )
 
-    def _raw_fit(self, data):
+    def _raw_fit(self, data, normalized=False):
         """Process unmasked data directly.
 
         Parameters
@@ -264,9 +282,13 @@ class DictLearning(_BaseDecomposition):
         data : ndarray,
             Shape (n_samples, n_features)
 
+        normalized : :obj:`bool`, default=False
+            Whether the data of each subject was already normalized
+            before being merged in the group data.
+
         """
         logger.log("Learning initial components", self.verbose)
-        self._init_dict(data)
+        self._init_dict(data, normalized=normalized)
 
         _, n_features = data.shape
 
@@ -4,7 +4,12 @@ from numpy.testing import assert_array_almost_equal
 from scipy import linalg
 
 from nilearn.conftest import _rng
-from nilearn.decomposition._base import _fast_svd, _mask_and_reduce
+from nilearn.decomposition._base import (
+    _fast_svd,
+    _incremental_group_pca,
+    _mask_and_reduce,
+    _mask_and_reduce_incremental,
+)
 from nilearn.decomposition.tests.conftest import (
     N_SAMPLES,
     N_SUBJECTS,
@@ -195,3 +200,105 @@ def test_mask_reducer_reduced_reproducible(
         )
 
     assert_array_almost_equal(np.tile(data1, (2, 1)), data2)
+
+
+def test_incremental_group_pca():
+    """Merging subjects keeps the principal subspace of their concatenation.
+
+    When the group subspace is large enough,
+    no information is lost and the gram matrix is unchanged.
+    Otherwise the first singular values are kept.
+    """
+    rng = _rng()
+    n_features = 50
+    subjects_data = [rng.normal(size=(4, n_features)) for _ in range(3)]
+    concatenated = np.concatenate(subjects_data)
+
+    data = None
+    for subject_data in subjects_data:
+        data = _incremental_group_pca(data, subject_data, 12)
+
+    assert data.shape == (12, n_features)
+    assert_array_almost_equal(data.T @ data, concatenated.T @ concatenated)
+
+    data = _incremental_group_pca(subjects_data[0], subjects_data[1], 3)
+
+    assert data.shape == (3, n_features)
+    # rows are orthogonal and sorted by decreasing singular values
+    gram = data @ data.T
+    assert_array_almost_equal(gram, np.diag(np.diag(gram)))
+    assert_array_almost_equal(
+        np.sqrt(np.diag(gram)),
+        linalg.svdvals(np.concatenate(subjects_data[:2]))[:3],
+    )
+
+
+@pytest.mark.thread_unsafe
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_mask_reducer_incremental(
+    data_type,  # noqa: ARG001
+    n_jobs,
+    decomposition_masker,
+    decomposition_images,
+):
+    """Incremental reduction matches the concatenated reduced data."""
+    n_components = 3
+    data = _mask_and_reduce(
+        masker=decomposition_masker,
+        imgs=decomposition_images,
+        n_components=n_components,
+        random_state=RANDOM_STATE,
+    )
+    data_incremental = _mask_and_reduce_incremental(
+        masker=decomposition_masker,
+        imgs=decomposition_images,
+        n_dimensions=N_SUBJECTS * n_components,
+        n_components=n_components,
+        random_state=RANDOM_STATE,
+        n_jobs=n_jobs,
+    )
+
+    assert data_incremental.shape == data.shape
+    assert_array_almost_equal(
+        data_incremental.T @ data_incremental, data.T @ data
+    )
+
+    data_incremental = _mask_and_reduce_incremental(
+        masker=decomposition_masker,
+        imgs=decomposition_images,
+        n_dimensions=n_components,
+        n_components=n_components,
+        random_state=RANDOM_STATE,
+        n_jobs=n_jobs,
+    )
+
+    assert data_incremental.shape == (n_components, data.shape[1])
+
+
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+def test_mask_reducer_incremental_normalize(
+    data_type,  # noqa: ARG001
+    decomposition_masker,
+    decomposition_images,
+):
+    """Rows are normalized before the merge, \
+       and "rms" rescales them to their mean norm.
+    """
+    n_components = 3
+    kwargs = {
+        "masker": decomposition_masker,
+        "imgs": decomposition_images,
+        "n_dimensions": N_SUBJECTS * n_components,
+        "n_components": n_components,
+        "random_state": RANDOM_STATE,
+    }
+    data = _mask_and_reduce_incremental(**kwargs)
+    data_normalized = _mask_and_reduce_incremental(normalize=True, **kwargs)
+    data_rms = _mask_and_reduce_incremental(normalize="rms", **kwargs)
+
+    norms = np.linalg.norm(data, axis=1)
+    assert_array_almost_equal(data_normalized, data / norms[:, np.newaxis])
+    assert_array_almost_equal(
+        data_rms, data_normalized * np.sqrt(np.mean(norms**2))
+    )
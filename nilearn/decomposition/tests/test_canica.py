@@ -5,7 +5,7 @@ import pytest
 from numpy.testing import assert_array_almost_equal
 
 from nilearn._utils.helpers import is_windows_platform
-from nilearn.decomposition.canica import CanICA
+from nilearn.decomposition.canica import CanICA, _match_components
 from nilearn.decomposition.tests.conftest import (
     RANDOM_STATE,
     check_decomposition_estimator,
@@ -29,6 +29,19 @@ def test_threshold_bound_error(canica_data_single_img):
         canica.fit(canica_data_single_img)
 
 
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+def test_stability_tol_error(canica_data_single_img):
+    """Test that an error is raised when stability_tol is not positive."""
+    with pytest.raises(ValueError, match="'stability_tol' must be None"):
+        canica = CanICA(
+            n_components=4,
+            stability_tol=0,
+            smoothing_fwhm=None,
+            standardize="zscore_sample",
+        )
+        canica.fit(canica_data_single_img)
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize("data_type", ["nifti", "surface"])
 def test_percentile_range(rng, canica_data_single_img):
@@ -115,3 +128,86 @@ def test_component_sign(canica_data, data_type):
             mp = get_data(mp) if data_type == "nifti" else get_surface_data(mp)
 
             assert -mp.min() <= mp.max()
+
+
+def test_match_components(rng):
+    """Components are paired whatever their order and sign."""
+    reference = rng.standard_normal((4, 100))
+    order = [2, 0, 3, 1]
+    signs = np.array([1, -1, -1, 1])[:, np.newaxis]
+
+    matched_maps, correlations = _match_components(
+        reference, signs * reference[order]
+    )
+
+    assert_array_almost_equal(matched_maps, reference)
+    assert_array_almost_equal(correlations, np.ones(4))
+
+
+@pytest.mark.parametrize("data_type", ["nifti"])
+def test_canica_restarts(decomposition_mask_img, canica_data):
+    """Check attributes describing the restarts of fastICA \
+    and early stopping when the stability index is stable.
+    """
+    canica = CanICA(
+        n_components=4,
+        random_state=RANDOM_STATE,
+        mask=decomposition_mask_img,
+        smoothing_fwhm=None,
+        n_init=12,
+        standardize="zscore_sample",
+    )
+    canica.fit(canica_data)
+
+    assert canica.n_init_ == 12
+    assert canica.init_times_.shape == (12,)
+    assert np.all(canica.init_times_ >= 0)
+    assert 0 <= canica.stability_ <= 1
+
+    # the correlation of the restarts of the first window of 5 restarts
+    # is compared with the one of the next window
+    canica.set_params(stability_tol=1.0).fit(canica_data)
+
+    assert canica.n_init_ == 10
+    assert canica.init_times_.shape == (10,)
+
+    canica.set_params(n_init=1, stability_tol=None).fit(canica_data)
+
+    assert canica.n_init_ == 1
+    assert canica.stability_ is None
+
+
+@pytest.mark.single_process
+@pytest.mark.parametrize("data_type", ["nifti"])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_canica_restarts_unstable(
+    monkeypatch, n_jobs, decomposition_mask_img, canica_data
+):
+    """Check that early stopping does not converge with the number of \
+    restarts when the components are not stable, whatever n_jobs.
+    """
+    # the mean correlation of windows of 5 restarts alternates
+    # between 0.2 and 0.8, while consecutive restarts can be equal
+    correlations = [0.2] * 4 + [0.8] * 5 + [0.2] * 5 + [0.8] * 5
+    values = iter(correlations)
+
+    def match_components(_, ica_maps):
+        return ica_maps, np.full(len(ica_maps), next(values))
+
+    monkeypatch.setattr(
+        "nilearn.decomposition.canica._match_components", match_components
+    )
+    canica = CanICA(
+        n_components=4,
+        random_state=RANDOM_STATE,
+        mask=decomposition_mask_img,
+        smoothing_fwhm=None,
+        n_init=20,
+        stability_tol=0.1,
+        standardize="zscore_sample",
+        n_jobs=n_jobs,
+    )
+    canica.fit(canica_data)
+
+    assert canica.n_init_ == 20
+    assert canica.stability_ == pytest.approx(np.mean(correlations))
@@ -124,6 +124,13 @@ def test_fit_errors(
     ):
         est.fit(decomposition_images, confounds=confounds)
 
+    est.set_params(incremental_group_pca=2)
+    with pytest.raises(
+        ValueError,
+        match=r"'incremental_group_pca' must be greater than or equal to",
+    ):
+        est.fit(decomposition_images)
+
 
 @pytest.mark.slow
 @pytest.mark.parametrize("estimator", [CanICA, DictLearning])
@@ -171,6 +178,29 @@ def test_masker_attributes_with_fit_masker(
     check_decomposition_estimator(est, data_type)
 
 
+@pytest.mark.slow
+@pytest.mark.parametrize("estimator", [CanICA, DictLearning])
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+def test_incremental_group_pca(
+    data_type,
+    canica_data,
+    decomposition_mask_img,
+    estimator,
+):
+    """Smoke test fitting with an incremental group PCA."""
+    est = estimator(
+        n_components=3,
+        mask=decomposition_mask_img,
+        incremental_group_pca=5,
+        random_state=RANDOM_STATE,
+        smoothing_fwhm=None,
+        standardize="zscore_sample",
+    )
+    est.fit(canica_data)
+
+    check_decomposition_estimator(est, data_type)
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize("estimator", [CanICA, DictLearning])
 @pytest.mark.parametrize("data_type", ["nifti", "surface"])
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 from nibabel import Nifti1Image
 
+from nilearn.decomposition.canica import _match_components
 from nilearn.decomposition.dict_learning import DictLearning
 from nilearn.decomposition.tests.conftest import (
     RANDOM_STATE,
@@ -139,3 +140,43 @@ def test_component_sign(
             else get_surface_data(mp)
         )
         assert np.sum(data[data <= 0]) <= np.sum(data[data > 0])
+
+
+@pytest.mark.parametrize("data_type", ["nifti"])
+@pytest.mark.parametrize("n_dimensions_per_component", [2, 3])
+def test_dict_learning_incremental_group_pca(
+    data_type,
+    n_dimensions_per_component,
+    decomposition_mask_img,
+    decomposition_images,
+):
+    """Incremental group PCA gives the same initial components \
+       when the group subspace is larger than n_components.
+
+    With 3 subjects of 3 reduced samples, a group subspace of 6 dimensions
+    projects the merged data, while one of 9 dimensions keeps all of it.
+    """
+    n_components = 3
+    kwargs = {
+        "mask": decomposition_mask_img,
+        "n_components": n_components,
+        "random_state": RANDOM_STATE,
+        "standardize": "zscore_sample",
+        "n_epochs": 1,
+        "alpha": 1,
+    }
+    dict_learning = DictLearning(**kwargs).fit(decomposition_images)
+    dict_learning_incremental = DictLearning(
+        incremental_group_pca=n_dimensions_per_component * n_components,
+        **kwargs,
+    ).fit(decomposition_images)
+
+    check_decomposition_estimator(dict_learning_incremental, data_type)
+
+    # initial components are equal up to their order and sign
+    _, correlations = _match_components(
+        dict_learning.components_init_,
+        dict_learning_incremental.components_init_,
+    )
+
+    assert np.all(correlations > 0.99)
@@ -118,3 +118,35 @@ def test_multi_pca_score_single_subject_n_components(
     assert s.shape == (5,)
     assert np.all(s <= 1)
     assert np.all(s >= 0)
+
+
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+def test_multi_pca_incremental_group_pca(
+    data_type,
+    decomposition_mask_img,
+    decomposition_images,
+):
+    """Incremental group PCA gives the same components \
+       when the group subspace keeps all the reduced data.
+    """
+    n_components = 3
+    kwargs = {
+        "mask": decomposition_mask_img,
+        "n_components": n_components,
+        "random_state": RANDOM_STATE,
+        "standardize": "zscore_sample",
+    }
+    multi_pca = _MultiPCA(**kwargs).fit(decomposition_images)
+    multi_pca_incremental = _MultiPCA(
+        incremental_group_pca=len(decomposition_images) * n_components,
+        **kwargs,
+    ).fit(decomposition_images)
+
+    check_decomposition_estimator(multi_pca_incremental, data_type)
+
+    # components are equal up to their sign
+    assert_array_almost_equal(
+        np.abs(multi_pca_incremental.components_ @ multi_pca.components_.T),
+        np.eye(n_components),
+        decimal=3,
+    )
@@ -4,6 +4,7 @@ from nilearn.glm import first_level, second_level
 from nilearn.glm.contrasts import (
     Contrast,
     compute_contrast,
+    compute_contrasts,
     compute_fixed_effects,
     expression_to_contrast_vector,
 )
@@ -15,6 +16,7 @@ from nilearn.glm.model import (
 )
 from nilearn.glm.regression import (
     ARModel,
+    ColumnarRegressionResults,
     OLSModel,
     RegressionResults,
     SimpleRegressionResults,
@@ -27,6 +29,7 @@ from nilearn.glm.thresholding import (
 
 __all__ = [
     "ARModel",
+    "ColumnarRegressionResults",
     "Contrast",
     "FContrastResults",
     "LikelihoodModelResults",
@@ -36,6 +39,7 @@ __all__ = [
     "TContrastResults",
     "cluster_level_inference",
     "compute_contrast",
+    "compute_contrasts",
     "compute_fixed_effects",
     "expression_to_contrast_vector",
     "fdr_threshold",
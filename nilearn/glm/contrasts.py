@@ -12,6 +12,7 @@ from nilearn._utils import logger
 from nilearn._utils.logger import find_stack_level
 from nilearn._utils.param_validation import check_parameter_in_allowed
 from nilearn.glm._utils import pad_contrast, z_score
+from nilearn.glm.regression import ColumnarRegressionResults
 from nilearn.maskers import NiftiMasker, SurfaceMasker
 from nilearn.surface import SurfaceImage
 
@@ -83,8 +84,11 @@ def compute_contrast(labels, regression_result, con_val, stat_type=None):
     labels : array of shape (n_voxels,)
         A map of values on voxels used to identify the corresponding model
 
-    regression_result : :obj:`dict`
-        With keys corresponding to the different labels
+    regression_result : \
+        :class:`~nilearn.glm.regression.ColumnarRegressionResults` \
+        or :obj:`dict`
+        Results of :func:`~nilearn.glm.first_level.run_glm`,
+        or dictionary with keys corresponding to the different labels
         values are RegressionResults instances corresponding to the voxels.
 
     con_val : numpy.ndarray of shape (p) or (q, p)
@@ -104,14 +108,12 @@ def compute_contrast(labels, regression_result, con_val, stat_type=None):
 
     """
     con_val = np.asarray(con_val)
-    dim = 1
-    if con_val.ndim > 1:
-        dim = con_val.shape[0]
-
-    if stat_type is None:
-        stat_type = "t" if dim == 1 else "F"
+    dim, stat_type = _contrast_dim_and_type(con_val, stat_type)
 
-    check_parameter_in_allowed(stat_type, ["t", "F"], "stat_type")
+    if isinstance(regression_result, ColumnarRegressionResults):
+        return _compute_columnar_contrast(
+            regression_result, con_val, dim, stat_type
+        )
 
     if stat_type == "t":
         effect_ = np.zeros(labels.size)
@@ -156,6 +158,165 @@ def compute_contrast(labels, regression_result, con_val, stat_type=None):
     )
 
 
+def _contrast_dim_and_type(con_val, stat_type):
+    """Return the dimension and the type of a contrast vector or matrix."""
+    dim = 1
+    if con_val.ndim > 1:
+        dim = con_val.shape[0]
+
+    if stat_type is None:
+        stat_type = "t" if dim == 1 else "F"
+
+    check_parameter_in_allowed(stat_type, ["t", "F"], "stat_type")
+    return dim, stat_type
+
+
+def _prepare_columnar_contrast(results, con_val, dim, stat_type):
+    """Check a contrast and pad it to a 2D array of shape (dim, p)."""
+    if stat_type == "t":
+        if con_val.size == 0:
+            raise ValueError(f"t contrasts cannot be empty: got {con_val}")
+        if dim != 1:
+            raise ValueError(
+                f"t contrasts should have only one row: got {con_val}."
+            )
+    return pad_contrast(
+        con_val=np.atleast_2d(con_val),
+        theta=results.theta,
+        stat_type=stat_type,
+    )
+
+
+def _compute_columnar_contrast(results, con_val, dim, stat_type):
+    """Compute a contrast on all voxels at once.
+
+    The covariance of the contrast is computed once per model
+    and gathered for all voxels.
+    """
+    con_val = _prepare_columnar_contrast(results, con_val, dim, stat_type)
+    if stat_type == "t":
+        effect_ = np.dot(con_val, results.theta).ravel()
+        var_ = results.vcov_contrast(con_val.ravel()) * results.dispersion
+
+    elif stat_type == "F":
+        from scipy.linalg import sqrtm
+
+        cbeta = np.dot(con_val, results.theta)
+        # one whitening matrix of the contrast per model
+        weights = np.stack(
+            [
+                sqrtm(np.linalg.inv(np.atleast_2d(con_val @ cov @ con_val.T)))
+                for cov in results.cov
+            ]
+        )
+        effect_ = np.einsum("vij,jv->iv", weights[results.label_index], cbeta)
+        var_ = results.dispersion
+
+    return Contrast(
+        effect=effect_,
+        variance=var_,
+        dim=dim,
+        dof=results.df_residuals,
+        stat_type=stat_type,
+    )
+
+
+def _compute_columnar_t_contrasts(results, con_vals):
+    """Compute several t contrasts on all voxels at once.
+
+    The contrast vectors are stacked in a matrix
+    so that all effects are obtained with a single matrix product
+    and the variances of all contrasts with one pass per model.
+    """
+    matrix = np.vstack(
+        [
+            _prepare_columnar_contrast(results, con_val, 1, "t")
+            for con_val in con_vals
+        ]
+    )
+    effects = np.dot(matrix, results.theta)
+    # variance of each contrast for each model: shape (n_models, n_contrasts)
+    vcov = np.einsum("kp,bpq,kq->bk", matrix, results.cov, matrix)
+    variances = vcov[results.label_index].T * results.dispersion
+    return [
+        Contrast(
+            effect=effect_,
+            variance=var_,
+            dim=1,
+            dof=results.df_residuals,
+            stat_type="t",
+        )
+        for effect_, var_ in zip(effects, variances, strict=True)
+    ]
+
+
+def compute_contrasts(labels, regression_result, con_vals, stat_type=None):
+    """Compute several :term:`contrasts<contrast>` given an estimated glm.
+
+    When ``regression_result`` is a
+    :class:`~nilearn.glm.regression.ColumnarRegressionResults`,
+    all t contrasts are evaluated together:
+    their vectors are stacked in a matrix
+    and the covariance of each model is only visited once.
+
+    .. nilearn_versionadded:: 0.14.0dev
+
+    Parameters
+    ----------
+    labels : array of shape (n_voxels,)
+        A map of values on voxels used to identify the corresponding model
+
+    regression_result : \
+        :class:`~nilearn.glm.regression.ColumnarRegressionResults` \
+        or :obj:`dict`
+        Results of :func:`~nilearn.glm.first_level.run_glm`,
+        or dictionary with keys corresponding to the different labels
+        values are RegressionResults instances corresponding to the voxels.
+
+    con_vals : :obj:`list` of numpy.ndarray of shape (p) or (q, p)
+        The contrasts to compute,
+        where q = number of :term:`contrast` vectors
+        and p = number of regressors.
+
+    stat_type : {None, 't', 'F'}, default=None
+        Type of the :term:`contrasts<contrast>`.
+        If None, then defaults to 't' for 1D contrasts
+        and 'F' for 2D contrasts.
+
+    Returns
+    -------
+    contrasts : :obj:`list` of Contrast instances
+        One Contrast per element of ``con_vals``, in the same order.
+
+    """
+    con_vals = [np.asarray(con_val) for con_val in con_vals]
+    if not isinstance(regression_result, ColumnarRegressionResults):
+        return [
+            compute_contrast(labels, regression_result, con_val, stat_type)
+            for con_val in con_vals
+        ]
+
+    dims_and_types = [
+        _contrast_dim_and_type(con_val, stat_type) for con_val in con_vals
+    ]
+    t_indices = [
+        i for i, (_, type_) in enumerate(dims_and_types) if type_ == "t"
+    ]
+    contrasts = [None] * len(con_vals)
+    if t_indices:
+        t_contrasts = _compute_columnar_t_contrasts(
+            regression_result, [con_vals[i] for i in t_indices]
+        )
+        for i, contrast in zip(t_indices, t_contrasts, strict=True):
+            contrasts[i] = contrast
+    for i, (dim, type_) in enumerate(dims_and_types):
+        if type_ == "F":
+            contrasts[i] = _compute_columnar_contrast(
+                regression_result, con_vals[i], dim, type_
+            )
+    return contrasts
+
+
 def compute_fixed_effect_contrast(labels, results, con_vals, stat_type=None):
     """Compute the summary contrast assuming fixed effects.
 
@@ -182,6 +343,65 @@ def compute_fixed_effect_contrast(labels, results, con_vals, stat_type=None):
     return contrast * (1.0 / n_contrasts)
 
 
+def compute_fixed_effect_contrasts(labels, results, con_vals, stat_type=None):
+    """Compute several summary contrasts assuming fixed effects.
+
+    This is the batched counterpart of :func:`compute_fixed_effect_contrast`:
+    all the contrasts of a run are computed together
+    with :func:`compute_contrasts`.
+
+    .. nilearn_versionadded:: 0.14.0dev
+
+    Parameters
+    ----------
+    labels : :obj:`list` of array of shape (n_voxels,)
+        One array of labels per run.
+
+    results : :obj:`list`
+        One regression result per run.
+
+    con_vals : :obj:`list` of :obj:`list` of numpy.ndarray
+        For each contrast, the list of its vectors or matrices,
+        one per run.
+
+    stat_type : {None, 't', 'F'}, default=None
+        Type of the :term:`contrasts<contrast>`.
+
+    Returns
+    -------
+    contrasts : :obj:`list` of Contrast instances
+        One fixed effect Contrast per element of ``con_vals``.
+
+    """
+    summed = [None] * len(con_vals)
+    n_contrasts = [0] * len(con_vals)
+    for i, (lab, res) in enumerate(zip(labels, results, strict=False)):
+        run_con_vals = [np.asarray(con_val[i]) for con_val in con_vals]
+        indices = []
+        for j, con_val in enumerate(run_con_vals):
+            if np.all(con_val == 0):
+                warnings.warn(
+                    f"Contrast for run {int(i)} is null.",
+                    stacklevel=find_stack_level(),
+                )
+                continue
+            indices.append(j)
+        run_contrasts = compute_contrasts(
+            lab, res, [run_con_vals[j] for j in indices], stat_type
+        )
+        for j, contrast_ in zip(indices, run_contrasts, strict=True):
+            summed[j] = (
+                contrast_ if summed[j] is None else summed[j] + contrast_
+            )
+            n_contrasts[j] += 1
+    if any(contrast is None for contrast in summed):
+        raise ValueError("All contrasts provided were null contrasts.")
+    return [
+        contrast * (1.0 / n)
+        for contrast, n in zip(summed, n_contrasts, strict=True)
+    ]
+
+
 class Contrast:
     """The contrast class handles the estimation \
     of statistical :term:`contrasts<contrast>` \
@@ -12,7 +12,7 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
-from joblib import Memory, Parallel, delayed
+from joblib import Memory, Parallel, delayed, effective_n_jobs
 from nibabel import Nifti1Image
 from scipy.linalg import toeplitz
 from sklearn.cluster import KMeans
@@ -35,6 +35,7 @@ from nilearn.datasets import load_fsaverage
 from nilearn.glm._base import BaseGLM
 from nilearn.glm.contrasts import (
     compute_fixed_effect_contrast,
+    compute_fixed_effect_contrasts,
     expression_to_contrast_vector,
 )
 from nilearn.glm.first_level.design_matrix import (
@@ -42,9 +43,9 @@ from nilearn.glm.first_level.design_matrix import (
 )
 from nilearn.glm.regression import (
     ARModel,
+    ColumnarRegressionResults,
     OLSModel,
     RegressionResults,
-    SimpleRegressionResults,
 )
 from nilearn.image.image import check_niimg, check_same_fov, get_data
 from nilearn.interfaces.bids import get_bids_files, parse_bids_filename
@@ -61,6 +62,15 @@ from nilearn.nilearn_typing import NiimgLike, Tr
 from nilearn.surface import SurfaceImage
 from nilearn.surface.utils import check_polymesh_equal
 
+_CONTRAST_OUTPUT_TYPES = [
+    "z_score",
+    "stat",
+    "p_value",
+    "effect_size",
+    "effect_variance",
+    "all",  # must be the final entry!
+]
+
 
 def mean_scaling(Y, axis=0):
     """Scaling of the data to have percent of baseline change \
@@ -110,15 +120,71 @@ def mean_scaling(Y, axis=0):
     return Y, mean
 
 
-def _ar_model_fit(X, val, Y):
-    """Wrap fit method of ARModel to allow joblib parallelization."""
-    return ARModel(X, val).fit(Y)
+# Maximum number of voxels fitted at once by a single job in run_glm.
+# It bounds the size of the temporary arrays created by each job.
+_GLM_BLOCK_SIZE = 10_000
+
+
+def _voxel_blocks(columns, n_blocks):
+    """Split an array of voxel indices in at most n_blocks chunks \
+    of at most _GLM_BLOCK_SIZE voxels each.
+    """
+    n_blocks = max(n_blocks, int(np.ceil(len(columns) / _GLM_BLOCK_SIZE)))
+    n_blocks = max(min(n_blocks, len(columns)), 1)
+    return np.array_split(columns, n_blocks)
+
+
+def _ols_yule_walker_on_block(model, Y, columns, order, mean):
+    """Compute the AR coefficients of the OLS residuals \
+    of a block of voxels.
+
+    Y is passed whole, so that joblib only needs to memmap it once
+    for all the jobs, and sliced here.
+    """
+    Y_block = Y[:, columns]
+    residuals = Y_block - np.dot(
+        model.whitened_design, np.dot(model.calc_beta, Y_block)
+    )
+    return _yule_walker(residuals.T, order, mean=mean)
+
+
+def _model_fit_on_block(model, Y, columns):
+    """Fit model on a block of voxels.
+
+    Y is passed whole, so that joblib only needs to memmap it once
+    for all the jobs, and sliced here.
+    Only the parameter estimates and the dispersion are returned,
+    the rest can be recomputed from them.
+    """
+    results = model.fit(Y[:, columns])
+    return results.theta, results.dispersion
 
 
-def _yule_walker(x, order):
+def _collect_blocks(Y, models, label_index, tasks, fitted_blocks):
+    """Gather the parameter estimates and dispersion fitted by blocks \
+    in arrays ordered as the voxels of Y.
+    """
+    n_regressors = next(iter(models.values())).design.shape[1]
+    theta = np.empty((n_regressors, Y.shape[1]))
+    dispersion = np.empty(Y.shape[1])
+    for (_, columns), (theta_, dispersion_) in zip(
+        tasks, fitted_blocks, strict=True
+    ):
+        theta[:, columns] = theta_
+        dispersion[columns] = dispersion_
+    return ColumnarRegressionResults(
+        theta, dispersion, models, label_index, Y=Y
+    )
+
+
+def _yule_walker(x, order, mean=None):
     """Compute Yule-Walker (adapted from MNE and statsmodels).
 
     Operates along the last axis of x.
+
+    If mean is None, the mean of x is removed from x
+    before computing the autocorrelations,
+    otherwise mean is removed.
     """
     if order < 1:
         raise ValueError("AR order must be positive")
@@ -130,7 +196,7 @@ def _yule_walker(x, order):
     denom = x.shape[-1] - np.arange(order + 1)
     n = np.prod(np.array(x.shape[:-1], int))
     r = np.zeros((n, order + 1), np.float64)
-    y = x - x.mean()
+    y = x - (x.mean() if mean is None else mean)
     y = y.reshape(n, x.shape[-1])  # inplace
     r[:, 0] += (y[:, np.newaxis, :] @ y[:, :, np.newaxis])[:, 0, 0]
     for k in range(1, order + 1):
@@ -154,6 +220,12 @@ def run_glm(
 ):
     """:term:`GLM` fit for an :term:`fMRI` data matrix.
 
+    Voxels are fitted by blocks, possibly in parallel.
+    The whitened design and its pseudo-inverse are computed
+    only once per noise model,
+    and the data are shared across jobs (memory-mapped by joblib)
+    rather than copied for each of them.
+
     Parameters
     ----------
     Y : array of shape (n_time_points, n_voxels)
@@ -191,10 +263,17 @@ def run_glm(
     labels : array of shape (n_voxels,),
         A map of values on voxels used to identify the corresponding model.
 
-    results : :obj:`dict`,
-        Keys correspond to the different labels values
+    results : :class:`~nilearn.glm.regression.ColumnarRegressionResults`
+        Parameter estimates and dispersion of all voxels.
+        It can also be used as a :obj:`dict`:
+        keys correspond to the different labels values
         values are RegressionResults instances corresponding to the voxels.
 
+        .. nilearn_versionchanged:: 0.14.0dev
+
+            A ``ColumnarRegressionResults`` is returned
+            instead of a :obj:`dict`.
+
     """
     check_params(locals())
 
@@ -212,68 +291,125 @@ def run_glm(
             f"and Y with shape {Y.shape}."
         )
 
-    # Create the model
-    ols_result = OLSModel(X).fit(Y)
+    n_voxels = Y.shape[1]
+    n_blocks = effective_n_jobs(n_jobs)
+    all_voxels = np.arange(n_voxels)
+    parallel = Parallel(n_jobs=n_jobs, verbose=verbose)
 
-    if noise_model[:2] == "ar":
-        err_msg = (
-            "AR order must be a positive integer specified as arN, "
-            "where N is an integer. E.g. ar3. "
-            f"You provided {noise_model}."
+    # Create the model
+    ols_model = OLSModel(X)
+
+    if noise_model[:2] != "ar":
+        labels = np.zeros(n_voxels)
+        tasks = [(0.0, block) for block in _voxel_blocks(all_voxels, n_blocks)]
+        ols_results = parallel(
+            delayed(_model_fit_on_block)(ols_model, Y, block)
+            for _, block in tasks
+        )
+        return labels, _collect_blocks(
+            Y,
+            {0.0: ols_model},
+            np.zeros(n_voxels, dtype=int),
+            tasks,
+            ols_results,
         )
-        try:
-            ar_order = int(noise_model[2:])
-        except ValueError as e:
-            raise ValueError(err_msg) from e
-
-        # compute the AR coefficients
-        ar_coef_ = _yule_walker(ols_result.residuals.T, ar_order)
-        del ols_result
-        if len(ar_coef_[0]) == 1:
-            ar_coef_ = ar_coef_[:, 0]
-
-        # Either bin the AR1 coefs or cluster ARN coefs
-        if ar_order == 1:
-            for idx in range(len(ar_coef_)):
-                ar_coef_[idx] = (ar_coef_[idx] * bins).astype(int) * 1.0 / bins
-            labels = np.array([str(val) for val in ar_coef_])
-        else:  # AR(N>1) case
-            n_clusters = np.min([bins, Y.shape[1]])
-            kmeans = KMeans(
-                n_clusters=n_clusters, n_init=10, random_state=random_state
-            ).fit(ar_coef_)
-            ar_coef_ = kmeans.cluster_centers_[kmeans.labels_]
-
-            # Create a set of rounded values for the labels with _ between
-            # each coefficient
-            cluster_labels = kmeans.cluster_centers_.copy()
-            cluster_labels = np.array(
-                ["_".join(map(str, np.round(a, 2))) for a in cluster_labels]
-            )
-            # Create labels and coef per voxel
-            labels = np.array([cluster_labels[i] for i in kmeans.labels_])
 
-        unique_labels = np.unique(labels)
-        results = {}
+    err_msg = (
+        "AR order must be a positive integer specified as arN, "
+        "where N is an integer. E.g. ar3. "
+        f"You provided {noise_model}."
+    )
+    try:
+        ar_order = int(noise_model[2:])
+    except ValueError as e:
+        raise ValueError(err_msg) from e
+    if ar_order < 1:
+        raise ValueError("AR order must be positive")
 
-        # Fit the AR model according to current AR(N) estimates
-        ar_result = Parallel(n_jobs=n_jobs, verbose=verbose)(
-            delayed(_ar_model_fit)(
-                X, ar_coef_[labels == val][0], Y[:, labels == val]
+    # compute the AR coefficients of the OLS residuals.
+    # The mean of all residuals removed by _yule_walker
+    # is computed beforehand without computing the residuals,
+    # so that blocks give the same estimates as the full data:
+    # the mean residual of each voxel is a linear function of its data.
+    residual_mean_operator = (
+        np.ones(X.shape[0])
+        - np.dot(
+            np.dot(np.ones(X.shape[0]), ols_model.whitened_design),
+            ols_model.calc_beta,
+        )
+    ) / X.shape[0]
+    residuals_mean = np.dot(residual_mean_operator, Y).mean()
+    ar_coef_ = np.concatenate(
+        parallel(
+            delayed(_ols_yule_walker_on_block)(
+                ols_model, Y, columns, ar_order, residuals_mean
             )
-            for val in unique_labels
+            for columns in _voxel_blocks(all_voxels, n_blocks)
         )
+    )
+    if len(ar_coef_[0]) == 1:
+        ar_coef_ = ar_coef_[:, 0]
+
+    # Either bin the AR1 coefs or cluster ARN coefs
+    if ar_order == 1:
+        ar_coef_ = (ar_coef_ * bins).astype(int) * 1.0 / bins
+        # only convert each distinct value to string once
+        ar_values, label_index = np.unique(ar_coef_, return_inverse=True)
+        str_values = np.array([str(val) for val in ar_values])
+        # sort labels as strings
+        label_order = np.argsort(str_values)
+        unique_labels = str_values[label_order]
+        label_rank = np.empty_like(label_order)
+        label_rank[label_order] = np.arange(len(label_order))
+        label_index = label_rank[label_index]
+    else:  # AR(N>1) case
+        n_clusters = np.min([bins, n_voxels])
+        kmeans = KMeans(
+            n_clusters=n_clusters, n_init=10, random_state=random_state
+        ).fit(ar_coef_)
+        ar_coef_ = kmeans.cluster_centers_[kmeans.labels_]
+
+        # Create a set of rounded values for the labels with _ between
+        # each coefficient
+        cluster_labels = kmeans.cluster_centers_.copy()
+        cluster_labels = np.array(
+            ["_".join(map(str, np.round(a, 2))) for a in cluster_labels]
+        )
+        unique_labels, label_index = np.unique(
+            cluster_labels[kmeans.labels_], return_inverse=True
+        )
+    # Create labels per voxel
+    labels = unique_labels[label_index]
+
+    # Group voxels by label:
+    # a stable sort keeps the voxels of each label in their original order.
+    voxel_order = np.argsort(label_index, kind="stable")
+    bounds = np.cumsum(np.bincount(label_index, minlength=len(unique_labels)))
+    columns_per_label = np.split(voxel_order, bounds[:-1])
+
+    # Whiten the design and compute its pseudo-inverse once per label.
+    # Converting the key to a string is required for AR(N>1) cases
+    models = {
+        label: ARModel(X, ar_coef_[columns[0]])
+        for label, columns in zip(
+            unique_labels, columns_per_label, strict=True
+        )
+    }
+    tasks = [
+        (label, block)
+        for label, columns in zip(
+            unique_labels, columns_per_label, strict=True
+        )
+        for block in _voxel_blocks(columns, 1)
+    ]
 
-        # Converting the key to a string is required for AR(N>1) cases
-        results = dict(zip(unique_labels, ar_result, strict=False))
-        del unique_labels
-        del ar_result
-
-    else:
-        labels = np.zeros(Y.shape[1])
-        results = {0.0: ols_result}
+    # Fit the AR model according to current AR(N) estimates
+    ar_result = parallel(
+        delayed(_model_fit_on_block)(models[label], Y, block)
+        for label, block in tasks
+    )
 
-    return labels, results
+    return labels, _collect_blocks(Y, models, label_index, tasks, ar_result)
 
 
 def _check_trial_type(events: list[str | Path]) -> None:
@@ -463,6 +599,18 @@ class FirstLevelModel(BaseGLM):
 
         .. nilearn_versionadded:: 0.14.0
 
+    %(dtype)s
+        The images are masked and cleaned in this data type,
+        and the :term:`GLM` is fitted on data of this type.
+        With ``"auto"`` or ``"float32"``,
+        the memory used by the data of each run is halved
+        compared to double precision.
+        Parameter estimates and variances
+        are still computed in double precision.
+        Ignored if ``mask_img`` is a masker.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     Attributes
     ----------
     design_matrices_ : :obj:`list` of :obj:`pandas.DataFrame`
@@ -491,7 +639,10 @@ class FirstLevelModel(BaseGLM):
 
         .. nilearn_versionadded:: 0.12.1
 
-    results_ : :obj:`dict`,
+    results_ : :obj:`list` of \
+        :class:`~nilearn.glm.regression.ColumnarRegressionResults`
+        One per run.
+        Each can be used as a :obj:`dict`
         with keys corresponding to the different labels values.
         Values are SimpleRegressionResults corresponding to the voxels,
         if minimize_memory is True,
@@ -530,6 +681,7 @@ class FirstLevelModel(BaseGLM):
         subject_label=None,
         random_state=None,
         reports=True,
+        dtype=None,
     ):
         # design matrix parameters
         self.t_r = t_r
@@ -563,6 +715,8 @@ class FirstLevelModel(BaseGLM):
         self.reports = reports
         self._reset_report()
 
+        self.dtype = dtype
+
     def _is_first_level_glm(self):
         return True
 
@@ -762,9 +916,7 @@ class FirstLevelModel(BaseGLM):
 
         # We save memory if inspecting model details is not necessary
         if self.minimize_memory:
-            results = {
-                k: SimpleRegressionResults(v) for k, v in results.items()
-            }
+            results = results.without_data()
         self.results_.append(results)
         del Y
 
@@ -1120,10 +1272,95 @@ class FirstLevelModel(BaseGLM):
         """
         check_is_fitted(self)
 
+        con_vals = self._contrast_vectors(contrast_def)
+        check_parameter_in_allowed(
+            output_type, _CONTRAST_OUTPUT_TYPES, "output_type"
+        )
+        contrast = compute_fixed_effect_contrast(
+            self.labels_, self.results_, con_vals, stat_type
+        )
+        return self._contrast_outputs(contrast, con_vals, output_type)
+
+    def compute_contrasts(
+        self,
+        contrasts,
+        stat_type=None,
+        output_type="z_score",
+    ):
+        """Generate the outputs of several contrasts in a single pass.
+
+        This gives the same results as calling
+        :meth:`compute_contrast` on each contrast,
+        but the t contrasts of each run are evaluated together:
+        their vectors are stacked in a matrix
+        and the covariance of each autoregressive model is only visited once.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
+        Parameters
+        ----------
+        contrasts : :obj:`dict` or :obj:`list`
+            Contrasts to compute.
+            Each contrast can be anything accepted
+            by the ``contrast_def`` parameter of :meth:`compute_contrast`.
+            If a :obj:`dict` is passed,
+            its keys are used as the names of the contrasts.
+            If a :obj:`list` is passed,
+            the contrasts are named by their position in the list.
+
+        stat_type : {'t', 'F'}, default=None
+            Type of the contrasts.
+
+        output_type : :obj:`str`, default='z_score'
+            Type of the output map. Can be 'z_score', 'stat', 'p_value',
+            :term:`'effect_size'<Parameter Estimate>`, 'effect_variance' or
+            'all'.
+
+        Returns
+        -------
+        outputs : :obj:`dict`
+            The desired output image(s) for each contrast,
+            keyed by the contrast names.
+            See :meth:`compute_contrast` for the content of each value.
+
+        """
+        check_is_fitted(self)
+
+        if isinstance(contrasts, dict):
+            names = list(contrasts)
+            contrast_defs = list(contrasts.values())
+        elif isinstance(contrasts, (list, tuple)):
+            names = list(range(len(contrasts)))
+            contrast_defs = list(contrasts)
+        else:
+            raise TypeError(
+                "'contrasts' must be a dict or a list. "
+                f"Got {type(contrasts).__name__}."
+            )
+        check_parameter_in_allowed(
+            output_type, _CONTRAST_OUTPUT_TYPES, "output_type"
+        )
+
+        all_con_vals = [
+            self._contrast_vectors(contrast_def)
+            for contrast_def in contrast_defs
+        ]
+        fixed_effects = compute_fixed_effect_contrasts(
+            self.labels_, self.results_, all_con_vals, stat_type
+        )
+        return {
+            name: self._contrast_outputs(contrast, con_vals, output_type)
+            for name, contrast, con_vals in zip(
+                names, fixed_effects, all_con_vals, strict=True
+            )
+        }
+
+    def _contrast_vectors(self, contrast_def):
+        """Return one contrast vector or matrix per run."""
         if isinstance(contrast_def, (np.ndarray, str)):
             con_vals = [contrast_def]
         elif isinstance(contrast_def, (list, tuple)):
-            con_vals = contrast_def
+            con_vals = list(contrast_def)
         else:
             raise ValueError(
                 "contrast_def must be an array or str or list of"
@@ -1162,21 +1399,14 @@ class FirstLevelModel(BaseGLM):
                 con_vals[cidx] = expression_to_contrast_vector(
                     con, design_columns
                 )
+        return con_vals
 
-        valid_types = [
-            "z_score",
-            "stat",
-            "p_value",
-            "effect_size",
-            "effect_variance",
-            "all",  # must be the final entry!
-        ]
-        check_parameter_in_allowed(output_type, valid_types, "output_type")
-        contrast = compute_fixed_effect_contrast(
-            self.labels_, self.results_, con_vals, stat_type
-        )
+    def _contrast_outputs(self, contrast, con_vals, output_type):
+        """Turn a Contrast into the requested output image(s)."""
         output_types = (
-            valid_types[:-1] if output_type == "all" else [output_type]
+            _CONTRAST_OUTPUT_TYPES[:-1]
+            if output_type == "all"
+            else [output_type]
         )
         outputs = {}
         for output_type_ in output_types:
@@ -1227,13 +1457,7 @@ class FirstLevelModel(BaseGLM):
 
         """
         del first_level_contrast
-        return {
-            contrast_name: self.compute_contrast(
-                contrast_data,
-                output_type=output_type,
-            )
-            for contrast_name, contrast_data in contrasts.items()
-        }
+        return self.compute_contrasts(contrasts, output_type=output_type)
 
     def _get_element_wise_model_attribute(
         self,
@@ -1289,21 +1513,10 @@ class FirstLevelModel(BaseGLM):
 
         output = []
 
-        for design_matrix, labels, results in zip(
-            self.design_matrices_, self.labels_, self.results_, strict=False
-        ):
-            if result_as_time_series:
-                voxelwise_attribute = np.zeros(
-                    (design_matrix.shape[0], len(labels))
-                )
-            else:
-                voxelwise_attribute = np.zeros((1, len(labels)))
-
-            for label_ in results:
-                label_mask = labels == label_
-                voxelwise_attribute[:, label_mask] = getattr(
-                    results[label_], attribute
-                )
+        for results in self.results_:
+            voxelwise_attribute = getattr(results, attribute)
+            if not result_as_time_series:
+                voxelwise_attribute = voxelwise_attribute[np.newaxis]
 
             output.append(self.masker_.inverse_transform(voxelwise_attribute))
 
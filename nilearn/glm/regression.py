@@ -17,6 +17,8 @@ General reference for regression models:
 
 __docformat__ = "restructuredtext en"
 
+from collections.abc import Mapping
+
 import numpy as np
 import scipy.linalg as spl
 from nibabel.onetime import auto_attr
@@ -26,6 +28,14 @@ from nilearn.glm._utils import positive_reciprocal
 from nilearn.glm.model import LikelihoodModelResults
 
 
+def _as_float_array(X):
+    """Convert X to a float64 array, unless it is already float32."""
+    X = np.asarray(X)
+    if X.dtype == np.float32:
+        return X
+    return X.astype(np.float64, copy=False)
+
+
 class OLSModel:
     """A simple ordinary least squares model.
 
@@ -255,7 +265,7 @@ class ARModel(OLSModel):
             X whitened with order self.order AR.
 
         """
-        X = np.asarray(X, np.float64)
+        X = _as_float_array(X)
         whitened_X = X.copy()
         for i in range(self.order):
             whitened_X[(i + 1) :] = (
@@ -419,3 +429,225 @@ class SimpleRegressionResults(LikelihoodModelResults):
         """Return linear predictor values from a design matrix."""
         beta = self.theta
         return np.dot(X, beta)
+
+
+class ColumnarRegressionResults(Mapping):
+    """Store the results of regression models \
+    fitted on different columns (voxels) of the same data.
+
+    This is what :func:`~nilearn.glm.first_level.run_glm` returns:
+    each column is fitted with one of several models
+    (for example one :class:`ARModel` per bin of AR coefficients),
+    that all share the same design matrix.
+
+    Parameter estimates and dispersions are stored in contiguous arrays,
+    in the order of the columns of the data,
+    and the residuals, predictions... are only computed when requested.
+
+    For backward compatibility, this object behaves as a read-only
+    dictionary mapping each model label to
+    a :class:`RegressionResults` instance
+    (or a :class:`SimpleRegressionResults` instance
+    if the data are not stored) restricted to the columns of this model.
+
+    .. nilearn_versionadded:: 0.14.0dev
+
+    Parameters
+    ----------
+    theta : ndarray of shape (n_regressors, n_columns)
+        Parameter estimates.
+
+    dispersion : ndarray of shape (n_columns,)
+        Dispersion of the whitened residuals.
+
+    models : :obj:`dict`
+        Mapping between labels and the :class:`OLSModel`
+        (or :class:`ARModel`) fitted on the columns with this label.
+
+    label_index : ndarray of shape (n_columns,)
+        For each column, the position in ``models`` of its model.
+
+    Y : ndarray of shape (n_time_points, n_columns) or None, default=None
+        The data. If None, only what is necessary to compute contrasts
+        is available.
+
+    Attributes
+    ----------
+    cov : ndarray of shape (n_models, n_regressors, n_regressors)
+        Normalized covariance of the parameter estimates of each model.
+
+    df_total : :obj:`int`
+        Number of observations.
+
+    df_model : :obj:`int`
+        Degrees of freedom of the model.
+
+    df_residuals : :obj:`int`
+        Degrees of freedom of the residuals.
+    """
+
+    def __init__(self, theta, dispersion, models, label_index, Y=None):
+        self.theta = theta
+        self.dispersion = dispersion
+        self.models = dict(models)
+        self.label_index = np.asarray(label_index)
+        self.Y = Y
+
+        self._positions = {label: i for i, label in enumerate(self.models)}
+        self._models = list(self.models.values())
+        self.cov = np.stack([m.normalized_cov_beta for m in self._models])
+        design = self._models[0].design
+        self.df_total = design.shape[0]
+        self.df_model = self._models[0].df_model
+        self.df_residuals = self.df_total - self.df_model
+
+        # AR coefficients of each model, padded with zeros
+        order = max(getattr(m, "order", 0) for m in self._models)
+        self._rho = np.zeros((len(self._models), order))
+        for i, m in enumerate(self._models):
+            if order and hasattr(m, "rho"):
+                self._rho[i, : m.order] = m.rho
+
+    def __getitem__(self, label):
+        idx = self._positions[label]
+        columns = np.flatnonzero(self.label_index == idx)
+        model = self._models[idx]
+        theta = self.theta[:, columns]
+        dispersion = self.dispersion[columns]
+        if self.Y is None:
+            # SimpleRegressionResults only needs the number of observations
+            results = RegressionResults(
+                theta,
+                np.empty((self.df_total, 0)),
+                model,
+                None,
+                None,
+                cov=model.normalized_cov_beta,
+                dispersion=dispersion,
+            )
+            return SimpleRegressionResults(results)
+        Y = self.Y[:, columns]
+        whitened_Y = model.whiten(Y)
+        return RegressionResults(
+            theta,
+            Y,
+            model,
+            whitened_Y,
+            whitened_Y - np.dot(model.whitened_design, theta),
+            cov=model.normalized_cov_beta,
+            dispersion=dispersion,
+        )
+
+    def __iter__(self):
+        return iter(self.models)
+
+    def __len__(self):
+        return len(self.models)
+
+    @property
+    def labels(self):
+        """Label of the model of each column."""
+        return np.asarray(list(self.models))[self.label_index]
+
+    def without_data(self):
+        """Return the same results without the data.
+
+        Only what is necessary to compute contrasts is kept.
+        """
+        return self.__class__(
+            self.theta, self.dispersion, self.models, self.label_index
+        )
+
+    def whiten(self, X):
+        """Whiten each column of X with the AR model of this column.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_time_points, n_columns)
+            Array to whiten.
+
+        Returns
+        -------
+        whitened_X : ndarray of shape (n_time_points, n_columns)
+        """
+        X = _as_float_array(X)
+        whitened_X = X.copy()
+        rho = self._rho[self.label_index].T
+        for i in range(rho.shape[0]):
+            whitened_X[(i + 1) :] -= rho[i] * X[: -(i + 1)]
+        return whitened_X
+
+    def vcov_contrast(self, matrix):
+        """Return the normalized covariance of a contrast for each column.
+
+        Parameters
+        ----------
+        matrix : ndarray of shape (n_regressors,) or (dim, n_regressors)
+            Contrast.
+
+        Returns
+        -------
+        vcov : ndarray of shape (n_columns,) or (n_columns, dim, dim)
+            Covariance of the contrast, not multiplied by the dispersion.
+        """
+        matrix = np.asarray(matrix)
+        matrix_2d = np.atleast_2d(matrix)
+        vcov = np.einsum("ip,bpq,jq->bij", matrix_2d, self.cov, matrix_2d)
+        if matrix.ndim == 1:
+            vcov = vcov[:, 0, 0]
+        return vcov[self.label_index]
+
+    def _check_data(self, attribute):
+        if self.Y is None:
+            raise ValueError(
+                f"'{attribute}' cannot be computed "
+                "as the data were not stored with the results."
+            )
+
+    @property
+    def predicted(self):
+        """Return linear predictor values from a design matrix."""
+        return self.whiten(np.dot(self._models[0].design, self.theta))
+
+    @property
+    def whitened_Y(self):  # noqa: N802
+        """Whitened data."""
+        self._check_data("whitened_Y")
+        return self.whiten(self.Y)
+
+    @property
+    def whitened_residuals(self):
+        """Whitened residuals."""
+        return self.whitened_Y - self.predicted
+
+    @property
+    def residuals(self):
+        """Residuals from the fit."""
+        self._check_data("residuals")
+        return self.Y - self.predicted
+
+    @property
+    def normalized_residuals(self):
+        """Residuals, normalized to have unit length."""
+        return self.residuals * positive_reciprocal(np.sqrt(self.dispersion))
+
+    @property
+    def SSE(self):  # noqa: N802
+        """Error sum of squares.
+
+        If not from an OLS model this is "pseudo"-SSE.
+        """
+        return (self.whitened_residuals**2).sum(0)
+
+    @property
+    def r_square(self):
+        """Proportion of explained variance.
+
+        If not from an OLS model this is "pseudo"-R2.
+        """
+        return np.var(self.predicted, 0) / np.var(self.whitened_Y, 0)
+
+    @property
+    def MSE(self):  # noqa: N802
+        """Return Mean square (error)."""
+        return self.SSE / self.df_residuals
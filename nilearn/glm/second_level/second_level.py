@@ -37,7 +37,7 @@ from nilearn.glm.first_level import FirstLevelModel, run_glm
 from nilearn.glm.first_level.design_matrix import (
     make_second_level_design_matrix,
 )
-from nilearn.glm.regression import RegressionResults, SimpleRegressionResults
+from nilearn.glm.regression import RegressionResults
 from nilearn.image.image import (
     check_niimg,
     check_same_fov,
@@ -572,7 +572,8 @@ class SecondLevelModel(BaseGLM):
 
         .. nilearn_versionadded:: 0.12.1
 
-    results_ : :obj:`dict`,
+    results_ : :class:`~nilearn.glm.regression.ColumnarRegressionResults`
+        Can be used as a :obj:`dict`
         with keys corresponding to the different labels values.
         Values are SimpleRegressionResults corresponding
         to the voxels or vertices,
@@ -809,8 +810,7 @@ class SecondLevelModel(BaseGLM):
 
         # We save memory if inspecting model details is not necessary
         if self.minimize_memory:
-            for key in results:
-                results[key] = SimpleRegressionResults(results[key])
+            results = results.without_data()
         self.labels_ = labels
         self.results_ = results
 
@@ -945,18 +945,9 @@ class SecondLevelModel(BaseGLM):
                 "The model has no results. No contrast has been computed yet."
             )
 
-        if result_as_time_series:
-            voxelwise_attribute = np.zeros(
-                (self.design_matrix_.shape[0], len(self.labels_))
-            )
-        else:
-            voxelwise_attribute = np.zeros((1, len(self.labels_)))
-
-        for label_ in self.results_:
-            label_mask = self.labels_ == label_
-            voxelwise_attribute[:, label_mask] = getattr(
-                self.results_[label_], attribute
-            )
+        voxelwise_attribute = getattr(self.results_, attribute)
+        if not result_as_time_series:
+            voxelwise_attribute = voxelwise_attribute[np.newaxis]
         return self.masker_.inverse_transform(voxelwise_attribute)
 
 
@@ -977,6 +968,9 @@ def non_parametric_inference(
     verbose=0,
     threshold=None,
     tfce=False,
+    early_stopping_alpha=None,
+    early_stopping_tol=None,
+    callback=None,
 ):
     """Generate p-values corresponding to the contrasts provided \
     based on permutation testing.
@@ -1047,6 +1041,12 @@ def non_parametric_inference(
 
             TFCE analysis are not implemented for surface data.
 
+    %(early_stopping_alpha)s
+
+    %(early_stopping_tol)s
+
+    %(callback_permutations)s
+
     Returns
     -------
     neg_log10_vfwe_pvals_img : :class:`~nibabel.nifti1.Nifti1Image`
@@ -1243,6 +1243,9 @@ def non_parametric_inference(
         masker=masker,
         threshold=threshold,
         tfce=tfce,
+        early_stopping_alpha=early_stopping_alpha,
+        early_stopping_tol=early_stopping_tol,
+        callback=callback,
     )
     neg_log10_vfwe_pvals_img = masker.inverse_transform(
         np.ravel(outputs["logp_max_t"])
@@ -9,7 +9,9 @@ from nilearn.glm.contrasts import (
     Contrast,
     _compute_fixed_effects_params,
     compute_contrast,
+    compute_contrasts,
     compute_fixed_effect_contrast,
+    compute_fixed_effect_contrasts,
     expression_to_contrast_vector,
 )
 from nilearn.glm.first_level import run_glm
@@ -110,6 +112,52 @@ def test_fixed_effect_contrast(set_up_glm, rng):
     assert_almost_equal(z_vals.std(), 1, 0)
 
 
+@pytest.mark.parametrize("model", ["ols", "ar1"])
+def test_compute_contrasts(rng, set_up_glm, model):
+    """Check batched contrasts match contrasts computed one at a time."""
+    labels, results, q = set_up_glm(rng, model, bins=10)
+    con_vals = [np.eye(q)[0], np.eye(q)[:3], np.eye(q)[1] - np.eye(q)[2]]
+
+    contrasts = compute_contrasts(labels, results, con_vals)
+
+    assert len(contrasts) == len(con_vals)
+    for con_val, contrast in zip(con_vals, contrasts, strict=True):
+        expected = compute_contrast(labels, results, con_val)
+        assert contrast.stat_type == expected.stat_type
+        assert contrast.dof == expected.dof
+        assert_almost_equal(contrast.effect, expected.effect)
+        assert_almost_equal(contrast.variance, expected.variance)
+
+    # same results when falling back to a dict of RegressionResults
+    contrasts = compute_contrasts(labels, dict(results), con_vals)
+    for con_val, contrast in zip(con_vals, contrasts, strict=True):
+        expected = compute_contrast(labels, results, con_val)
+        assert_almost_equal(contrast.z_score(), expected.z_score())
+
+
+def test_fixed_effect_contrasts(set_up_glm, rng):
+    labels, results, q = set_up_glm(rng, "ar1", bins=10)
+    c1, c2 = np.eye(q)[0], np.eye(q)[1]
+    null = np.zeros(q)
+
+    with pytest.warns(UserWarning, match="Contrast for run 1 is null"):
+        contrasts = compute_fixed_effect_contrasts(
+            [labels, labels], [results, results], [[c1, c2], [c2, null]]
+        )
+
+    expected = compute_fixed_effect_contrast(
+        [labels, labels], [results, results], [c1, c2]
+    )
+    assert_almost_equal(contrasts[0].z_score(), expected.z_score())
+    expected = compute_contrast(labels, results, c2)
+    assert_almost_equal(contrasts[1].z_score(), expected.z_score())
+
+    with pytest.raises(ValueError, match="All contrasts provided were null"):
+        compute_fixed_effect_contrasts(
+            [labels, labels], [results, results], [[c1, c1], [null, null]]
+        )
+
+
 def test_fixed_effect_contrast_nonzero_effect():
     X, y = make_regression(n_features=5, n_samples=20, random_state=0)
     y = y[:, None]
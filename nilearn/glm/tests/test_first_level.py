@@ -286,6 +286,25 @@ def test_high_level_glm_with_data(shape_3d_default):
     assert get_data(z_image).std() < 3.0
 
 
+def test_high_level_glm_float32(shape_3d_default):
+    """Check that the GLM can be fitted on single precision data."""
+    shapes, rk = [(*shape_3d_default, 20)], 3
+    mask, fmri_data, design_matrices = generate_fake_fmri_data_and_design(
+        shapes, rk=rk
+    )
+
+    z_maps = []
+    for dtype in [None, "float32"]:
+        model = FirstLevelModel(
+            mask_img=mask, dtype=dtype, minimize_memory=False
+        ).fit(fmri_data, design_matrices=design_matrices)
+        z_maps.append(get_data(model.compute_contrast(np.eye(rk)[1])))
+
+    assert model.masker_.dtype == "float32"
+    assert model.results_[0].Y.dtype == np.float32
+    assert_almost_equal(z_maps[1], z_maps[0], decimal=3)
+
+
 @pytest.mark.slow
 def test_glm_target_shape_affine(shape_3d_default, affine_eye):
     """Check that target shape and affine are applied."""
@@ -492,6 +511,40 @@ def test_high_level_glm_different_design_matrices_formulas():
         multi_run_model.compute_contrast(formula, output_type="effect_size")
 
 
+def test_compute_contrasts(shape_4d_default):
+    """Check batched contrasts match contrasts computed one at a time."""
+    shapes, rk = [shape_4d_default, shape_4d_default], 3
+    mask, fmri_data, design_matrices = generate_fake_fmri_data_and_design(
+        shapes, rk
+    )
+    design_matrices[1].columns = design_matrices[0].columns
+    model = FirstLevelModel(mask_img=mask, noise_model="ar1").fit(
+        fmri_data, design_matrices=design_matrices
+    )
+    columns = design_matrices[0].columns
+    contrasts = {
+        "first": [np.eye(rk)[0], np.eye(rk)[0]],
+        "formula": [f"{columns[0]} - {columns[1]}"] * 2,
+        "effects_of_interest": [np.eye(rk)[:2], np.eye(rk)[:2]],
+    }
+
+    outputs = model.compute_contrasts(contrasts, output_type="all")
+
+    assert list(outputs) == list(contrasts)
+    for name, contrast_def in contrasts.items():
+        expected = model.compute_contrast(contrast_def, output_type="all")
+        for output_type, img in expected.items():
+            assert_array_almost_equal(
+                get_data(outputs[name][output_type]), get_data(img)
+            )
+
+    outputs = model.compute_contrasts(list(contrasts.values()))
+    assert list(outputs) == [0, 1, 2]
+
+    with pytest.raises(TypeError, match="must be a dict or a list"):
+        model.compute_contrasts(np.eye(rk)[0])
+
+
 @pytest.mark.slow
 def test_compute_contrast_num_contrasts(shape_4d_default):
     """Check error when computing contrast with invalid contrast matrix."""
@@ -566,6 +619,34 @@ def test_run_glm_ar3(rng):
     assert len(results_ar3[labels_ar3[0]].model.rho) == 3
 
 
+@pytest.mark.single_process
+@pytest.mark.parametrize("noise_model", ["ols", "ar1", "ar2"])
+def test_run_glm_blocks(rng, monkeypatch, noise_model):
+    """Check that fitting voxels by blocks and in parallel \
+    does not change the results.
+    """
+    n, p, q = 150, 80, 10
+    X, Y = rng.standard_normal(size=(p, q)), rng.standard_normal(size=(p, n))
+
+    labels, results = run_glm(Y, X, noise_model, random_state=0)
+
+    monkeypatch.setattr(
+        "nilearn.glm.first_level.first_level._GLM_BLOCK_SIZE", 20
+    )
+    labels_blocks, results_blocks = run_glm(
+        Y, X, noise_model, n_jobs=2, random_state=0
+    )
+
+    assert_array_equal(labels, labels_blocks)
+    assert list(results) == list(results_blocks)
+    for label in results:
+        for attribute in ["theta", "dispersion", "whitened_residuals"]:
+            assert_almost_equal(
+                getattr(results[label], attribute),
+                getattr(results_blocks[label], attribute),
+            )
+
+
 def test_run_glm_errors(rng):
     """Check correct errors are thrown for nonsense noise model requests."""
     n, p, q = 33, 80, 10
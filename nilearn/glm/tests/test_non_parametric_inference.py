@@ -194,6 +194,29 @@ def test_permutation_computation(n_subjects):
     assert get_data(neg_log_pvals_img).shape == SHAPE[:3]
 
 
+def test_permutation_early_stopping(n_subjects):
+    """Check early stopping options are passed to permuted_ols."""
+    func_img, mask = fake_fmri_data()
+
+    Y = [func_img] * n_subjects
+    X = pd.DataFrame([[1]] * n_subjects, columns=["intercept"])
+
+    statistics = []
+    neg_log_pvals_img = non_parametric_inference(
+        Y,
+        design_matrix=X,
+        model_intercept=False,
+        mask=mask,
+        n_perm=1000,
+        early_stopping_alpha=0.05,
+        callback=statistics.append,
+    )
+
+    assert get_data(neg_log_pvals_img).shape == SHAPE[:3]
+    assert statistics
+    assert statistics[-1]["n_perm"] < 1000
+
+
 @pytest.mark.slow
 def test_tfce(n_subjects):
     """Test non-parametric inference with TFCE inference."""
@@ -8,7 +8,13 @@ from numpy.testing import (
     assert_array_equal,
 )
 
-from nilearn.glm import ARModel, OLSModel, SimpleRegressionResults
+from nilearn.glm import (
+    ARModel,
+    ColumnarRegressionResults,
+    OLSModel,
+    RegressionResults,
+    SimpleRegressionResults,
+)
 
 
 @pytest.fixture()
@@ -37,6 +43,17 @@ def test_ar(X, Y):
     assert results.predicted.shape[0] == 40
 
 
+@pytest.mark.parametrize("model", [OLSModel, ARModel])
+def test_fit_float32(X, Y, model):
+    """Check that single precision data are not converted when whitened."""
+    args = () if model is OLSModel else (0.4,)
+    results = model(X, *args).fit(Y.astype(np.float32))
+    expected = model(X, *args).fit(Y)
+
+    assert results.whitened_Y.dtype == np.float32
+    assert_array_almost_equal(results.theta, expected.theta, decimal=5)
+
+
 def test_residuals(X, Y):
     # If design matrix contains an intercept, the
     # mean of the residuals should be 0 (short of
@@ -86,3 +103,69 @@ def test_simple_results(X, Y):
     assert_array_equal(
         results.normalized_residuals, simple_results.normalized_residuals(Y, X)
     )
+
+
+@pytest.fixture()
+def columnar_results(X, Y):
+    """Return results of 2 AR models fitted on alternate columns of Y."""
+    label_index = np.arange(Y.shape[1]) % 2
+    models = {"0.2": ARModel(X, 0.2), "0.5": ARModel(X, 0.5)}
+    theta = np.empty((X.shape[1], Y.shape[1]))
+    dispersion = np.empty(Y.shape[1])
+    for i, model in enumerate(models.values()):
+        results = model.fit(Y[:, label_index == i])
+        theta[:, label_index == i] = results.theta
+        dispersion[label_index == i] = results.dispersion
+    return ColumnarRegressionResults(
+        theta, dispersion, models, label_index, Y=Y
+    )
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "residuals",
+        "normalized_residuals",
+        "predicted",
+        "SSE",
+        "r_square",
+        "MSE",
+        "whitened_residuals",
+    ],
+)
+def test_columnar_results(columnar_results, Y, attribute):
+    """Check that columnar results match the results of each model."""
+    assert list(columnar_results) == ["0.2", "0.5"]
+    assert_array_equal(columnar_results.labels[:2], ["0.2", "0.5"])
+
+    expected = np.zeros_like(getattr(columnar_results, attribute))
+    for i, (label, model) in enumerate(columnar_results.models.items()):
+        columns = columnar_results.label_index == i
+        results = model.fit(Y[:, columns])
+        assert isinstance(columnar_results[label], RegressionResults)
+        assert_array_almost_equal(
+            getattr(columnar_results[label], attribute),
+            getattr(results, attribute),
+        )
+        expected[..., columns] = getattr(results, attribute)
+
+    assert_array_almost_equal(getattr(columnar_results, attribute), expected)
+
+
+def test_columnar_results_without_data(columnar_results):
+    """Check that only contrast related results are kept without data."""
+    results = columnar_results.without_data()
+
+    assert results.Y is None
+    assert isinstance(results["0.2"], SimpleRegressionResults)
+    assert results["0.2"].df_residuals == 30
+    assert_array_equal(results["0.5"].theta, columnar_results["0.5"].theta)
+    assert_array_almost_equal(
+        results.vcov_contrast(np.eye(10)[0])[:2],
+        [
+            columnar_results["0.2"].vcov(column=0, dispersion=1.0),
+            columnar_results["0.5"].vcov(column=0, dispersion=1.0),
+        ],
+    )
+    with pytest.raises(ValueError, match="data were not stored"):
+        results.residuals  # noqa: B018
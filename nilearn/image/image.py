@@ -8,6 +8,7 @@ import collections.abc
 import glob
 import itertools
 import math
+import numbers
 import warnings
 from collections.abc import Iterable, Iterator
 from copy import deepcopy
@@ -15,13 +16,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, TypeGuard, get_args, overload
 
 import numpy as np
-from joblib import Memory, Parallel, delayed
-from nibabel import Nifti1Image, Nifti1Pair, load, spatialimages
+from joblib import Memory, Parallel, delayed, effective_n_jobs
+from nibabel import Nifti1Image, Nifti1Pair, is_proxy, load, spatialimages
 from nibabel.fileslice import is_fancy
 from nibabel.spatialimages import SpatialImage
 from numpy.testing import assert_array_equal
 from scipy.ndimage import gaussian_filter1d, generate_binary_structure, label
 from scipy.stats import scoreatpercentile
+from sklearn.utils import gen_even_slices
 
 from nilearn import EXPAND_PATH_WILDCARDS, signal
 from nilearn._utils import logger
@@ -58,8 +60,8 @@ from nilearn.nilearn_typing import (
 from nilearn.surface.surface import (
     FileMesh,
     SurfaceImage,
+    _smoothing_matrix,
     at_least_2d,
-    compute_adjacency_matrix,
     extract_data,
     find_surface_clusters,
 )
@@ -347,8 +349,41 @@ def _fast_smooth_array(arr):
     return smoothed_arr
 
 
+def _gaussian_filter1d_inplace(arr, sigma, axis, n_jobs=1):
+    """Filter arr in place along one axis.
+
+    As the filter is separable, the array is split
+    along its largest other axis between n_jobs threads.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    if n_jobs == 1 or arr.ndim == 1:
+        gaussian_filter1d(arr, sigma, output=arr, axis=axis)
+        return arr
+
+    split_axis = max(
+        (other for other in range(arr.ndim) if other != axis),
+        key=lambda other: arr.shape[other],
+    )
+    n_jobs = min(n_jobs, arr.shape[split_axis])
+
+    chunks = [
+        (slice(None),) * split_axis + (batch,)
+        for batch in gen_even_slices(arr.shape[split_axis], n_jobs)
+    ]
+    # scipy.ndimage releases the GIL
+    Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(gaussian_filter1d)(
+            arr[chunk], sigma, output=arr[chunk], axis=axis
+        )
+        for chunk in chunks
+    )
+    return arr
+
+
 @fill_doc
-def smooth_array(arr, affine, fwhm=None, ensure_finite=True, copy=True):
+def smooth_array(
+    arr, affine, fwhm=None, ensure_finite=True, copy=True, n_jobs=1
+):
     """Smooth images by applying a Gaussian filter.
 
     Apply a Gaussian filter along the three first dimensions of `arr`.
@@ -374,6 +409,12 @@ def smooth_array(arr, affine, fwhm=None, ensure_finite=True, copy=True):
         If True, input array is not modified. True by default: the filtering
         is not performed in-place.
 
+    %(n_jobs)s
+        The array is filtered in place by several threads.
+        Ignored if `fwhm='fast'`.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     Returns
     -------
     :class:`numpy.ndarray`
@@ -414,29 +455,33 @@ def smooth_array(arr, affine, fwhm=None, ensure_finite=True, copy=True):
         sigma = fwhm / (fwhm_over_sigma_ratio * vox_size)
         for n, s in enumerate(sigma):
             if s > 0.0:
-                gaussian_filter1d(arr, s, output=arr, axis=n)
+                _gaussian_filter1d_inplace(arr, s, axis=n, n_jobs=n_jobs)
     return arr
 
 
 @overload
-def smooth_img(imgs: SurfaceImage, fwhm) -> SurfaceImage: ...
+def smooth_img(imgs: SurfaceImage, fwhm, n_jobs=...) -> SurfaceImage: ...
 
 
 @overload
-def smooth_img(imgs: NiimgLike, fwhm) -> Nifti1Image: ...
+def smooth_img(imgs: NiimgLike, fwhm, n_jobs=...) -> Nifti1Image: ...
 
 
 @overload
-def smooth_img(imgs: Iterable[SurfaceImage], fwhm) -> list[SurfaceImage]: ...
+def smooth_img(
+    imgs: Iterable[SurfaceImage], fwhm, n_jobs=...
+) -> list[SurfaceImage]: ...
 
 
 @overload
-def smooth_img(imgs: Iterable[NiimgLike], fwhm) -> list[Nifti1Image]: ...
+def smooth_img(
+    imgs: Iterable[NiimgLike], fwhm, n_jobs=...
+) -> list[Nifti1Image]: ...
 
 
 @fill_doc
 def smooth_img(
-    imgs, fwhm
+    imgs, fwhm, n_jobs=1
 ) -> NiimgLike | SurfaceImage | list[NiimgLike] | list[SurfaceImage]:
     """Smooth images by applying a Gaussian filter.
 
@@ -453,6 +498,12 @@ def smooth_img(
 
     %(fwhm)s
 
+    %(n_jobs)s
+        Each volume image is filtered in place by several threads.
+        Ignored for :obj:`~nilearn.surface.SurfaceImage`.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     Returns
     -------
     :obj:`~nibabel.nifti1.Nifti1Image`, :obj:`~nilearn.surface.SurfaceImage`, \
@@ -516,6 +567,7 @@ def smooth_img(
                 fwhm=fwhm,
                 ensure_finite=True,
                 copy=True,
+                n_jobs=n_jobs,
             )
             ret.append(new_img_like(img, filtered, affine))
 
@@ -545,13 +597,6 @@ def _smooth_surface_img(
         SurfaceImage with smoothed data at each vertex.
 
     """
-    # First, calculate the center and surround weights for the
-    # center-surround knob.
-    center_weight = 0.5
-    surround_weight = 1 - center_weight
-
-    # Calculate the adjacency matrix either weighting
-    # by inverse distance or not weighting (ones)
     new_data = {}
     for hemi, n_iter in zip(img.mesh.parts, iterations, strict=False):
         mesh = img.mesh.parts[hemi]
@@ -561,24 +606,21 @@ def _smooth_surface_img(
             new_data[hemi] = data
             continue
 
-        matrix = compute_adjacency_matrix(mesh, values="ones")
+        if isinstance(mesh, FileMesh):
+            mesh = mesh.loaded()
 
-        # We need to normalize the matrix columns, and we can do this now by
-        # normalizing everything but the diagonal to the surround weight, then
-        # adding the center weight along the diagonal.
-        colsums = matrix.sum(axis=1)
-        colsums = np.asarray(colsums).flatten()
-        matrix = matrix.multiply(surround_weight / colsums[:, None])
-        # Add in the diagonal.
-        matrix.setdiag(center_weight)
+        # Each iteration replaces the value at each vertex with the average
+        # of its value and of the mean of its neighbors.
+        # The sparse matrix of this operation is shared by all the samples
+        # and by all images on the same mesh.
+        matrix = _smoothing_matrix(mesh, center_weight=0.5)
 
         # Run the iterations of smoothing.
         tmp = data
         for _ in range(n_iter):
-            tmp = matrix.dot(tmp)
+            tmp = matrix @ tmp
 
-        # Convert back into numpy array.
-        new_data[hemi] = np.reshape(np.asarray(tmp), np.shape(data))
+        new_data[hemi] = np.reshape(tmp, np.shape(data))
 
     return new_img_like(img, new_data)
 
@@ -1127,7 +1169,14 @@ def _index_img(img: Nifti1Image, index):
                 f" with size {n}"
             )
 
-    if is_fancy(index):
+    if is_fancy(index) and not img.in_memory:
+        # only read the selected volumes,
+        # as nibabel array proxies do not support fancy indexing
+        volumes = np.arange(img.shape[3])[index]
+        data = np.stack(
+            [np.asanyarray(img.dataobj[..., i]) for i in volumes], axis=-1
+        )
+    elif is_fancy(index):
         data = _get_data(img)[:, :, :, index]
     else:
         # this should be faster
@@ -1319,9 +1368,12 @@ def new_img_like(
 
     if affine is None:
         affine = ref_niimg.affine
-    if data.dtype == bool:
-        data = as_ndarray(data, dtype=np.uint8)
-    data = _downcast_from_int64_if_possible(data)
+    # array proxies are kept as they are so that their data is not read
+    lazy = is_proxy(data)
+    if not lazy:
+        if data.dtype == bool:
+            data = as_ndarray(data, dtype=np.uint8)
+        data = _downcast_from_int64_if_possible(data)
     header = None
     if copy_header and ref_niimg.header is not None:
         header = ref_niimg.header.copy()
@@ -1339,9 +1391,13 @@ def new_img_like(
             if "glmax" in header:
                 header["glmax"] = 0.0
             if "cal_max" in header:
-                header["cal_max"] = np.max(data) if data.size > 0 else 0.0
+                header["cal_max"] = (
+                    np.max(data) if not lazy and data.size > 0 else 0.0
+                )
             if "cal_min" in header:
-                header["cal_min"] = np.min(data) if data.size > 0 else 0.0
+                header["cal_min"] = (
+                    np.min(data) if not lazy and data.size > 0 else 0.0
+                )
     klass = ref_niimg.__class__
     if klass is Nifti1Pair:
         # Nifti1Pair is an internal class, without a to_filename,
@@ -1728,10 +1784,108 @@ def _are_all_surface_images(
     return all(isinstance(x, SurfaceImage) for x in imgs.values())
 
 
+def _eval_formula(formula, data_dict):
+    """Evaluate a math_img formula on a dictionary of arrays."""
+    # Add a reference to numpy in the kwargs of eval so that numpy functions
+    # can be called from there.
+    data_dict["np"] = np
+    try:
+        return eval(formula, data_dict)
+    except Exception as exc:
+        exc.args = (
+            f"Input formula couldn't be processed, you provided '{formula}',",
+            *exc.args,
+        )
+        raise
+
+
+def _eval_formula_by_chunks(formula, niimgs, chunk_size):
+    """Evaluate a math_img formula on blocks of volumes of 4D images.
+
+    Only chunk_size volumes of the 4D images are read at once,
+    while 3D images are loaded once and used for all blocks.
+
+    The formula is first evaluated on a block of the first volumes
+    and on its two halves: if the results differ,
+    the formula combines several volumes and an error is raised.
+    """
+    if (
+        isinstance(chunk_size, bool)
+        or not isinstance(chunk_size, numbers.Integral)
+        or chunk_size < 1
+    ):
+        raise ValueError(
+            f"'chunk_size' must be a positive integer. Got {chunk_size!r}."
+        )
+
+    n_volumes = {img.shape[3] for img in niimgs.values() if img.ndim == 4}
+    if len(n_volumes) != 1:
+        raise ValueError(
+            "'chunk_size' can only be used with 4D images "
+            "with the same number of volumes. "
+            f"Got images of shapes {[img.shape for img in niimgs.values()]}."
+        )
+    n_volumes = n_volumes.pop()
+    shape = (*next(iter(niimgs.values())).shape[:3], n_volumes)
+
+    data_dict = {
+        key: safe_get_data(img) for key, img in niimgs.items() if img.ndim == 3
+    }
+
+    def _eval_block(start, stop):
+        for key, img in niimgs.items():
+            if img.ndim == 4:
+                data_dict[key] = _get_data(img.slicer[..., start:stop])
+        result_block = _eval_formula(formula, data_dict)
+        expected_shape = (*shape[:3], stop - start)
+        if np.shape(result_block) != expected_shape:
+            raise ValueError(
+                "With 'chunk_size', the formula must compute each volume "
+                "from the same volume of the 4D images. "
+                f"Expected a result of shape {expected_shape} "
+                f"for a block of {expected_shape[3]} volumes, "
+                f"got {np.shape(result_block)}. "
+                "Use 'chunk_size=None' for this formula."
+            )
+        return result_block
+
+    n_checked = min(n_volumes, max(chunk_size, 2))
+    first_block = None
+    if n_checked > 1:
+        half = n_checked // 2
+        block = _eval_block(0, n_checked)
+        halves = np.concatenate(
+            (_eval_block(0, half), _eval_block(half, n_checked)), axis=-1
+        )
+        if not np.allclose(block, halves, equal_nan=True):
+            raise ValueError(
+                "With 'chunk_size', the formula must compute each volume "
+                "from the same volume of the 4D images, "
+                "but its results depend on the blocks of volumes, "
+                "for example because it combines several volumes. "
+                "Use 'chunk_size=None' for this formula."
+            )
+        if n_checked == min(chunk_size, n_volumes):
+            first_block = block
+
+    result = None
+    for start in range(0, n_volumes, chunk_size):
+        stop = min(start + chunk_size, n_volumes)
+        if start == 0 and first_block is not None:
+            result_block = first_block
+        else:
+            result_block = _eval_block(start, stop)
+        if result is None:
+            result = np.empty(shape, dtype=result_block.dtype)
+        result[..., start:stop] = result_block
+    return result
+
+
 @overload
 def math_img(
     formula: str,
     copy_header_from: str | None = None,
+    chunk_size: int | None = None,
     **imgs: SurfaceImage,
 ) -> SurfaceImage: ...
 
@@ -1740,6 +1894,7 @@ def math_img(
 def math_img(
     formula: str,
     copy_header_from: str | None = None,
+    chunk_size: int | None = None,
     **imgs: NiimgLike,
 ) -> Nifti1Image: ...
 
@@ -1747,6 +1902,7 @@ def math_img(
 def math_img(
     formula: str,
     copy_header_from: str | None = None,
+    chunk_size: int | None = None,
     **imgs: NiimgLike | SurfaceImage,
 ) -> SurfaceImage | Nifti1Image:
     """Interpret a numpy based string formula using niimg in named parameters.
@@ -1784,6 +1940,33 @@ def math_img(
 
         .. nilearn_versionadded:: 0.10.4
 
+    chunk_size : :obj:`int` or None, default=None
+        Number of volumes on which the formula is evaluated at once.
+        If not None, the data of 4D images are read block by block
+        through their data object, and 3D images are read only once,
+        so that peak memory usage is bounded by ``chunk_size`` volumes
+        rather than by the full 4D images.
+        This requires a formula that computes each volume of the result
+        from the same volume of the 4D inputs,
+        such as ``"np.where(img > 3, img, 0)"``.
+
+        .. warning::
+            Formulas that combine volumes,
+            such as ``"img - img.mean(axis=-1, keepdims=True)"``
+            or ``"img / img.max()"``,
+            give wrong results when evaluated by blocks.
+            An error is raised if the result on the first volumes
+            depends on how they are split in blocks,
+            but this check cannot detect all such formulas.
+
+        Chaining operations in a single formula avoids creating
+        intermediate images.
+        If None, all images are loaded in memory before evaluating
+        the formula.
+        Ignored for :obj:`~nilearn.surface.SurfaceImage`.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     imgs : images (:class:`~nibabel.nifti1.Nifti1Image` or file names \
            or :obj:`~nilearn.surface.SurfaceImage` object)
         Keyword arguments corresponding to the variables in the formula as
@@ -1914,22 +2097,15 @@ def math_img(
             f"{imgs.keys()}"
         )
 
-    # Computing input data as a dictionary of numpy arrays. Keep a reference
-    # niimg for building the result as a new niimg.
-    for key, img in niimgs.items():
-        data_dict[key] = safe_get_data(img)
-
-    # Add a reference to numpy in the kwargs of eval so that numpy functions
-    # can be called from there.
-    data_dict["np"] = np
-    try:
-        result = eval(formula, data_dict)
-    except Exception as exc:
-        exc.args = (
-            f"Input formula couldn't be processed, you provided '{formula}',",
-            *exc.args,
-        )
-        raise
+    # Keep a reference niimg for building the result as a new niimg.
+    img = next(reversed(niimgs.values()))
+    if chunk_size is None:
+        # Computing input data as a dictionary of numpy arrays.
+        for key, niimg in niimgs.items():
+            data_dict[key] = safe_get_data(niimg)
+        result = _eval_formula(formula, data_dict)
+    else:
+        result = _eval_formula_by_chunks(formula, niimgs, chunk_size)
 
     if copy_header_from is None:
         return new_img_like(img, result, img.affine, copy_header=False)
@@ -2065,6 +2241,7 @@ def clean_img(
     t_r: Tr = ...,
     ensure_finite: bool = ...,
     mask_img: SurfaceImage | None = ...,
+    n_jobs: int = ...,
     **kwargs,
 ) -> SurfaceImage: ...
 
@@ -2081,6 +2258,7 @@ def clean_img(
     t_r: Tr = ...,
     ensure_finite: bool = ...,
     mask_img: NiimgLike | None = ...,
+    n_jobs: int = ...,
     **kwargs,
 ) -> Nifti1Image: ...
 
@@ -2097,6 +2275,7 @@ def clean_img(
     t_r: Tr = None,
     ensure_finite: bool = False,
     mask_img: SurfaceImage | NiimgLike | None = None,
+    n_jobs: int = 1,
     **kwargs,
 ) -> SurfaceImage | Nifti1Image:
     """Improve :term:`SNR` on masked :term:`fMRI` signals.
@@ -2175,6 +2354,11 @@ def clean_img(
         If not provided, all voxels / verrices are used.
         See :ref:`extracting_data`.
 
+    %(n_jobs)s
+        Batches of voxels or vertices are cleaned by several threads.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     kwargs : :obj:`dict`
         Keyword arguments to be passed to functions called
         within this function.
@@ -2287,6 +2471,7 @@ def clean_img(
                 high_pass=high_pass,
                 t_r=t_r,
                 ensure_finite=ensure_finite,
+                n_jobs=n_jobs,
                 **clean_kwargs,
             )
             data[p] = data[p].T
@@ -2318,6 +2503,7 @@ def clean_img(
         high_pass=high_pass,
         t_r=t_r,
         ensure_finite=ensure_finite,
+        n_jobs=n_jobs,
         **clean_kwargs,
     )
 
@@ -2371,6 +2557,110 @@ def load_img(
     return check_niimg(img, wildcards=wildcards, dtype=dtype)
 
 
+class _ConcatenatedArrayProxy:
+    """Array proxy concatenating 4D data objects along their last axis.
+
+    Volumes are only read from the data objects (e.g. memory-mapped
+    files or nibabel array proxies) and cast to dtype when sliced
+    or when the whole array is requested.
+    """
+
+    is_proxy = True
+    # volumes are scaled when read from the data objects
+    slope = 1.0
+    inter = 0.0
+
+    def __init__(self, dataobjs, dtype):
+        self._dataobjs = dataobjs
+        self.dtype = np.dtype(dtype)
+        lengths = [dataobj.shape[3] for dataobj in dataobjs]
+        self._stops = np.cumsum(lengths)
+        self._starts = self._stops - lengths
+        self.shape = (*dataobjs[0].shape[:3], int(self._stops[-1]))
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @staticmethod
+    def read_dtype(dataobj):
+        """Return the dtype of the (scaled) data of a data object."""
+        return np.asanyarray(
+            dataobj[(slice(0, 1),) * len(dataobj.shape)]
+        ).dtype
+
+    def __array__(self, dtype=None, copy=None):
+        # data is always copied in a new array, whatever the value of copy
+        data = np.empty(
+            self.shape,
+            dtype=self.dtype if dtype is None else dtype,
+            order="F",
+        )
+        for dataobj, start, stop in zip(
+            self._dataobjs, self._starts, self._stops, strict=True
+        ):
+            data[..., start:stop] = np.asanyarray(dataobj)
+        return data
+
+    def __getitem__(self, slicer):
+        slicer = slicer if isinstance(slicer, tuple) else (slicer,)
+        ellipsis = [i for i, item in enumerate(slicer) if item is Ellipsis]
+        if ellipsis:
+            i = ellipsis[0]
+            slicer = (
+                slicer[:i]
+                + (slice(None),) * (self.ndim - len(slicer) + 1)
+                + slicer[i + 1 :]
+            )
+        slicer = slicer + (slice(None),) * (self.ndim - len(slicer))
+        if len(slicer) != self.ndim or any(item is None for item in slicer):
+            # uncommon slicers: read the whole array
+            return np.asarray(self)[slicer]
+        spatial, volumes = slicer[:3], np.arange(self.shape[3])[slicer[3]]
+
+        if volumes.ndim == 0:
+            index = np.searchsorted(self._stops, volumes, side="right")
+            local = int(volumes - self._starts[index])
+            return np.asarray(
+                self._dataobjs[index][(*spatial, local)], dtype=self.dtype
+            )
+
+        # spatial slices are applied to each block of volumes,
+        # other spatial indices once all volumes are gathered
+        spatial_slices = all(isinstance(item, slice) for item in spatial)
+        block_slicer = (
+            (*spatial, slice(None)) if spatial_slices else (slice(None),) * 4
+        )
+        # shape of the sliced volumes, computed on an empty array
+        shape = np.empty((*self.shape[:3], 0))[block_slicer].shape[:-1]
+        data = np.empty((*shape, volumes.size), dtype=self.dtype)
+        for dataobj, start, stop in zip(
+            self._dataobjs, self._starts, self._stops, strict=True
+        ):
+            positions = np.flatnonzero((volumes >= start) & (volumes < stop))
+            if positions.size == 0:
+                continue
+            local = volumes[positions] - start
+            if np.all(np.diff(local) == 1):
+                # contiguous volumes are read as a slice
+                block = np.asanyarray(dataobj[..., local[0] : local[-1] + 1])
+            else:
+                # nibabel array proxies do not support fancy indexing
+                block = np.stack(
+                    [np.asanyarray(dataobj[..., i]) for i in local], axis=-1
+                )
+            data[..., positions] = block[block_slicer]
+
+        if not spatial_slices:
+            last = (
+                slice(None)
+                if isinstance(slicer[3], slice)
+                else np.arange(volumes.size)
+            )
+            data = data[(*spatial, last)]
+        return data
+
+
 @overload
 def concat_imgs(
     niimgs: SurfaceImage | Iterable[SurfaceImage],
@@ -2380,6 +2670,7 @@ def concat_imgs(
     memory_level=...,
     auto_resample=...,
     verbose=...,
+    copy=...,
 ) -> SurfaceImage: ...
 
 
@@ -2392,6 +2683,7 @@ def concat_imgs(
     memory_level=...,
     auto_resample=...,
     verbose=...,
+    copy=...,
 ) -> Nifti1Image: ...
 
 
@@ -2404,6 +2696,7 @@ def concat_imgs(
     memory_level=0,
     auto_resample=False,
     verbose=0,
+    copy=True,
 ) -> Nifti1Image | SurfaceImage:
     """Concatenate a list of images of varying lengths.
 
@@ -2445,6 +2738,25 @@ def concat_imgs(
     %(memory_level)s
         Ignored for :obj:`~nilearn.surface.SurfaceImage`.
 
+    copy : :obj:`bool`, default=True
+        If False, the data of the input images are not copied
+        into a new array: the concatenated image is backed
+        by the data objects of the input images,
+        and volumes are only read and cast to ``dtype``
+        when they are accessed,
+        for example with :func:`~nilearn.image.index_img`,
+        :func:`~nilearn.image.iter_img`,
+        or by maskers with a ``chunk_size``.
+        For uncompressed NIfTI files, these data objects are
+        memory-mapped, so that the concatenation does not load
+        any data in memory.
+        Loading the data of the whole concatenated image,
+        for example with :func:`~nilearn.image.get_data`,
+        still requires the memory of the full image.
+        Ignored for :obj:`~nilearn.surface.SurfaceImage`.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     Returns
     -------
     concatenated : :obj:`~nibabel.nifti1.Nifti1Image` \
@@ -2555,23 +2867,36 @@ def concat_imgs(
 
     target_shape = first_niimg.shape[:3]
     if dtype is None:
-        dtype = _get_data(first_niimg).dtype
+        dtype = (
+            _get_data(first_niimg).dtype
+            if copy
+            else _ConcatenatedArrayProxy.read_dtype(first_niimg.dataobj)
+        )
+    niimgs_4d = iter_check_niimg(
+        iterator,
+        atleast_4d=True,
+        target_fov=target_fov,
+        memory=memory,
+        memory_level=memory_level,
+    )
+
+    if not copy:
+        dataobjs = []
+        for index, niimg in enumerate(niimgs_4d):
+            logger.log(f"Concatenating {index + 1}: image #{index}", verbose)
+            dataobjs.append(niimg.dataobj)
+        return new_img_like(
+            first_niimg,
+            _ConcatenatedArrayProxy(dataobjs, dtype),
+            first_niimg.affine,
+        )
+
     data: np.ndarray = np.ndarray(
         (*target_shape, sum(lengths)), order="F", dtype=dtype
     )
     cur_4d_index = 0
     for index, (size, niimg) in enumerate(
-        zip(
-            lengths,
-            iter_check_niimg(
-                iterator,
-                atleast_4d=True,
-                target_fov=target_fov,
-                memory=memory,
-                memory_level=memory_level,
-            ),
-            strict=False,
-        )
+        zip(lengths, niimgs_4d, strict=False)
     ):
         nii_str = (
             f"image {niimg}" if isinstance(niimg, str) else f"image #{index}"
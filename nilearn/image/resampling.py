@@ -3,15 +3,18 @@
 See http://nilearn.github.io/stable/manipulating_images/input_output.html
 """
 
+import functools
 import numbers
 import warnings
 
 import numpy as np
-from scipy import linalg
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy import linalg, sparse
 from scipy.ndimage import affine_transform, find_objects
+from sklearn.utils import gen_even_slices
 
 from nilearn._utils.docs import fill_doc
-from nilearn._utils.helpers import stringify_path
+from nilearn._utils.helpers import KeyedLRUCache, stringify_path
 from nilearn._utils.logger import find_stack_level
 from nilearn._utils.niimg import _get_data, has_non_finite, is_binary_data
 from nilearn._utils.numpy_conversions import as_ndarray
@@ -343,6 +346,247 @@ def _resample_one_img(
     return out
 
 
+# Number of volumes resampled at once by a sparse interpolation operator
+_RESAMPLING_BATCH_SIZE = 8
+
+# Largest number of target voxels for which an interpolation operator is
+# computed (a linear operator has up to 8 weights per target voxel)
+_MAX_OPERATOR_SIZE = 2**21
+
+# Operators of the last grids, kept in memory to resample several images
+# on the same grids, such as the runs of a subject.
+# _INTERPOLATION_OPERATORS.clear() releases them.
+_INTERPOLATION_OPERATORS = KeyedLRUCache(
+    max_items=3,
+    max_bytes=2**28,
+    nbytes=lambda value: (
+        value[0].data.nbytes
+        + value[0].indices.nbytes
+        + value[0].indptr.nbytes
+        + value[1].nbytes
+    ),
+)
+
+
+def _interpolation_operator(source_shape, A, b, target_shape, order):
+    """Compute the sparse matrix resampling a 3D volume.
+
+    This is equivalent to :func:`scipy.ndimage.affine_transform`
+    with nearest (order 0) or linear (order 1) interpolation,
+    but the coordinates mapping and interpolation weights
+    are computed only once for all the volumes of images on the same grid.
+
+    A and b are tuples so that operators can be cached:
+    A is either the diagonal or the rows of the transform matrix.
+    Voxels of both grids are indexed in Fortran order.
+
+    Returns
+    -------
+    operator : :class:`scipy.sparse.csr_matrix` \
+               of shape (n_target_voxels, n_source_voxels)
+
+    outside : :class:`numpy.ndarray` of shape (n_target_voxels,)
+        Target voxels that fall outside of the source grid.
+    """
+    A = np.asarray(A)
+    b = np.asarray(b)
+    grid = np.indices(target_shape).reshape(3, -1, order="F")
+    # Coordinates are computed with the same operations as affine_transform
+    # so that points on voxel boundaries are rounded identically.
+    if A.ndim == 1:
+        coords = (grid + (b / A)[:, np.newaxis]) * A[:, np.newaxis]
+    else:
+        coords = np.repeat(b[:, np.newaxis], grid.shape[1], axis=1)
+        for axis in range(3):
+            coords += grid[axis] * A[:, axis, np.newaxis]
+    del grid
+
+    upper = np.asarray(source_shape)[:, np.newaxis] - 1
+    inside = np.all((coords >= 0) & (coords <= upper), axis=0)
+    rows = np.flatnonzero(inside)
+    coords = coords[:, inside]
+
+    if order == 0:
+        corners = [np.floor(coords + 0.5).astype(np.intp)]
+        weights = [np.ones(rows.size)]
+    else:
+        lower = np.floor(coords).astype(np.intp)
+        fraction = coords - lower
+        corners, weights = [], []
+        for shift in np.ndindex(2, 2, 2):
+            shift = np.asarray(shift)[:, np.newaxis]
+            corners.append(lower + shift)
+            weights.append(
+                np.prod(np.where(shift, fraction, 1 - fraction), axis=0)
+            )
+
+    row_indices, column_indices, values = [], [], []
+    for corner, weight in zip(corners, weights, strict=True):
+        # corners beyond the last voxel only happen with zero weights
+        valid = np.all(corner <= upper, axis=0) & (weight != 0)
+        row_indices.append(rows[valid])
+        column_indices.append(
+            np.ravel_multi_index(corner[:, valid], source_shape, order="F")
+        )
+        values.append(weight[valid])
+
+    n_target = int(np.prod(target_shape))
+    operator = sparse.csr_matrix(
+        (
+            np.concatenate(values),
+            (np.concatenate(row_indices), np.concatenate(column_indices)),
+        ),
+        shape=(n_target, int(np.prod(source_shape))),
+    )
+    return operator, ~inside
+
+
+def _resample_with_operator(
+    data,
+    operator,
+    outside,
+    A,
+    b,
+    target_shape,
+    interpolation_order,
+    out,
+    fill_value=0,
+):
+    """Resample 4D float data with an interpolation operator.
+
+    Volumes are processed by batches.
+    Batches with non-finite values are resampled volume by volume
+    with :func:`_resample_one_img`.
+    """
+    all_img = (slice(None),) * 3
+
+    for start in range(0, data.shape[3], _RESAMPLING_BATCH_SIZE):
+        batch = slice(start, start + _RESAMPLING_BATCH_SIZE)
+        batch_data = data[..., batch]
+        if not np.isfinite(batch_data).all():
+            for i in range(batch_data.shape[3]):
+                _resample_one_img(
+                    batch_data[..., i],
+                    A,
+                    b,
+                    target_shape,
+                    interpolation_order,
+                    out=out[(*all_img, start + i)],
+                    fill_value=fill_value,
+                )
+            continue
+
+        resampled = operator.dot(
+            batch_data.reshape((-1, batch_data.shape[3]), order="F")
+        )
+        resampled[outside] = fill_value
+        out[..., batch] = resampled.reshape((*target_shape, -1), order="F")
+    return out
+
+
+def _resample_each_img(
+    data, A, b, target_shape, interpolation_order, out, copy=True, fill_value=0
+):
+    """Resample each 3D volume of data separately."""
+    all_img = (slice(None),) * 3
+    # Iterate over a set of 3D volumes, as the interpolation problem is
+    # separable in the extra dimensions. This reduces the
+    # computational cost
+    for ind in np.ndindex(*data.shape[3:]):
+        _resample_one_img(
+            data[all_img + ind],
+            A,
+            b,
+            target_shape,
+            interpolation_order,
+            out=out[all_img + ind],
+            copy=copy,
+            fill_value=fill_value,
+        )
+    return out
+
+
+def _resample_volumes(
+    data,
+    A,
+    b,
+    target_shape,
+    interpolation_order,
+    out,
+    copy=True,
+    fill_value=0,
+    n_jobs=1,
+):
+    """Resample 3D or 4D data with an affine transform.
+
+    The volumes of 4D data are split between n_jobs threads,
+    which write their results in place in out.
+
+    Do not use: internal function for resample_img.
+    """
+    n_volumes = data.shape[3] if data.ndim == 4 else 1
+    if (
+        interpolation_order < 2
+        and data.dtype in (np.float32, np.float64)
+        and n_volumes > 1
+        and np.prod(target_shape) <= _MAX_OPERATOR_SIZE
+    ):
+        # Nearest and linear interpolations of all volumes
+        # are products with the same sparse matrix.
+        key = (
+            tuple(data.shape[:3]),
+            tuple(map(tuple, A)) if A.ndim == 2 else tuple(A),
+            tuple(b),
+            tuple(target_shape),
+            interpolation_order,
+        )
+        operator, outside = _INTERPOLATION_OPERATORS.get(
+            key, lambda: _interpolation_operator(*key)
+        )
+        if interpolation_order != 0 and is_binary_data(
+            data, accept_non_finite=False
+        ):
+            warnings.warn(
+                "Resampling binary images with continuous or "
+                "linear interpolation. This might lead to "
+                "unexpected results. You might consider using "
+                "nearest interpolation instead.",
+                stacklevel=find_stack_level(),
+            )
+        resample = functools.partial(
+            _resample_with_operator, operator=operator, outside=outside
+        )
+    else:
+        resample = functools.partial(_resample_each_img, copy=copy)
+
+    n_jobs = min(effective_n_jobs(n_jobs), n_volumes)
+    if n_jobs == 1:
+        return resample(
+            data,
+            A=A,
+            b=b,
+            target_shape=target_shape,
+            interpolation_order=interpolation_order,
+            out=out,
+            fill_value=fill_value,
+        )
+
+    # scipy releases the GIL in ndimage and sparse products
+    Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(resample)(
+            data[..., batch],
+            A=A,
+            b=b,
+            target_shape=target_shape,
+            interpolation_order=interpolation_order,
+            out=out[..., batch],
+            fill_value=fill_value,
+        )
+        for batch in gen_even_slices(n_volumes, n_jobs)
+    )
+    return out
+
+
 @fill_doc
 def resample_img(
     img,
@@ -355,6 +599,7 @@ def resample_img(
     fill_value=0,
     force_resample=True,
     copy_header=True,
+    n_jobs=1,
 ):
     """Resample a Niimg-like object.
 
@@ -405,6 +650,11 @@ def resample_img(
 
         .. nilearn_versionadded:: 0.11.0
 
+    %(n_jobs)s
+        The volumes of 4D images are split between threads.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     Returns
     -------
     resampled : nibabel.Nifti1Image
@@ -447,6 +697,13 @@ def resample_img(
     This function handles gracefully NaNs and infinite values in the input
     data, however they make the execution of the function much slower.
 
+    **Interpolation weights of 4D images**
+    With nearest or linear interpolation, the weights mapping 4D float
+    images to the target grid are computed once for all volumes.
+    The weights of the last 3 grids are kept in memory,
+    within at most 256 MB,
+    to resample other images on the same grids faster.
+
     **Handling non-native endian in given Nifti images**
     This function automatically changes the byte-ordering information
     in the image dtype to new byte order. From non-native to native, which
@@ -642,22 +899,17 @@ def resample_img(
         # better algorithm.
         if np.all(np.diag(np.diag(A)) == A):
             A = np.diag(A)
-        all_img = (slice(None),) * 3
-
-        # Iterate over a set of 3D volumes, as the interpolation problem is
-        # separable in the extra dimensions. This reduces the
-        # computational cost
-        for ind in np.ndindex(*other_shape):
-            _resample_one_img(
-                data[all_img + ind],
-                A,
-                b,
-                target_shape,
-                interpolation_order,
-                out=resampled_data[all_img + ind],
-                copy=copy,
-                fill_value=fill_value,
-            )
+        _resample_volumes(
+            data,
+            A,
+            b,
+            target_shape,
+            interpolation_order,
+            out=resampled_data,
+            copy=copy,
+            fill_value=fill_value,
+            n_jobs=n_jobs,
+        )
 
     if clip:
         # force resampled data to have a range contained in the original data
@@ -768,6 +1020,7 @@ def resample_to_img(
     fill_value=0,
     force_resample=True,
     copy_header=True,
+    n_jobs=1,
 ):
     """Resample a Niimg-like source image on a target Niimg-like image.
 
@@ -814,6 +1067,11 @@ def resample_to_img(
 
         .. nilearn_versionadded:: 0.11.0
 
+    %(n_jobs)s
+        The volumes of 4D images are split between threads.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     Returns
     -------
     resampled : nibabel.Nifti1Image
@@ -876,6 +1134,7 @@ def resample_to_img(
         fill_value=fill_value,
         force_resample=force_resample,
         copy_header=copy_header,
+        n_jobs=n_jobs,
     )
 
 
@@ -347,6 +347,18 @@ def test_fast_smooth_array_give_same_result_as_smooth_array(
     )
 
 
+@pytest.mark.parametrize("shape", [(10, 11, 12), (10, 11, 12, 5)])
+def test_smooth_array_n_jobs(rng, shape):
+    """Check that smoothing with several threads gives the same result."""
+    data = rng.standard_normal(shape)
+    affine = AFFINE_TO_TEST[2]
+
+    assert_array_equal(
+        smooth_array(data, affine, fwhm=5, n_jobs=3),
+        smooth_array(data, affine, fwhm=5),
+    )
+
+
 def test_smooth_array_raise_warning_if_fwhm_is_zero(smooth_array_data):
     """See https://github.com/nilearn/nilearn/issues/1537."""
     affine = AFFINE_TO_TEST[2]
@@ -820,6 +832,19 @@ def test_index_img_volume():
         assert_array_equal(this_img.affine, img_4d.affine)
 
 
+def test_index_img_volume_from_file(tmp_path):
+    """Test fancy indexing of a 4D image that is not loaded in memory."""
+    img_4d, _ = generate_fake_fmri(affine=NON_EYE_AFFINE)
+    img_4d.to_filename(tmp_path / "img.nii")
+    img_on_disk = load(tmp_path / "img.nii")
+
+    for i in [[1, 2, 3, 2], (np.arange(img_4d.shape[3]) % 3) == 1]:
+        this_img = index_img(img_on_disk, i)
+
+        assert_array_equal(get_data(this_img), get_data(img_4d)[..., i])
+        assert not img_on_disk.in_memory
+
+
 @pytest.mark.parametrize("length", [20])
 @pytest.mark.parametrize(
     "index, expected_n_samples",
@@ -1574,6 +1599,64 @@ def test_math_img(
         assert result.shape == expected_result.shape
 
 
+@pytest.mark.parametrize("chunk_size", [1, 3, 20])
+@pytest.mark.parametrize("create_files", (False, True))
+def test_math_img_chunk_size(
+    affine_eye, rng, tmp_path, create_files, chunk_size
+):
+    """Check that evaluating a formula by blocks of volumes \
+       gives the same result.
+    """
+    img = Nifti1Image(rng.standard_normal((5, 6, 7, 10)), affine_eye)
+    mask = Nifti1Image(
+        (rng.random((5, 6, 7)) > 0.5).astype("int8"), affine_eye
+    )
+    img, mask = testing.write_imgs_to_path(
+        img, mask, file_path=tmp_path, create_files=create_files
+    )
+    formula = "np.where(img > 0.5, img, 0) * mask[..., np.newaxis]"
+
+    result = math_img(formula, img=img, mask=mask, chunk_size=chunk_size)
+
+    assert_array_equal(
+        get_data(result), get_data(math_img(formula, img=img, mask=mask))
+    )
+
+
+def test_math_img_chunk_size_errors(img_4d_ones_eye, img_3d_ones_eye):
+    with pytest.raises(ValueError, match="formula must compute each volume"):
+        math_img("np.mean(img, axis=-1)", img=img_4d_ones_eye, chunk_size=2)
+
+    with pytest.raises(ValueError, match="can only be used with 4D images"):
+        math_img("img * 2", img=img_3d_ones_eye, chunk_size=2)
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "img - img.mean(axis=-1, keepdims=True)",
+        "np.cumsum(img, axis=-1)",
+        "img / img.max()",
+        "img[..., ::-1]",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 4])
+def test_math_img_chunk_size_combined_volumes(
+    affine_eye, rng, formula, chunk_size
+):
+    """Check that formulas combining volumes are rejected."""
+    img = Nifti1Image(rng.standard_normal((5, 6, 7, 10)), affine_eye)
+
+    with pytest.raises(ValueError, match="depend on the blocks of volumes"):
+        math_img(formula, img=img, chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -2, 1.5, True])
+def test_math_img_chunk_size_invalid(img_4d_ones_eye, chunk_size):
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        math_img("img * 2", img=img_4d_ones_eye, chunk_size=chunk_size)
+
+
 @pytest.mark.thread_unsafe
 def test_math_img_surface(surf_img_2d):
     """Test math_img on surface data."""
@@ -1804,6 +1887,23 @@ def test_clean_img(affine_eye, shape_3d_default, rng):
     assert_almost_equal(get_data(data_img_), get_data(data_img_mask_))
 
 
+def test_clean_img_n_jobs(affine_eye, rng):
+    """Check that cleaning with several threads gives the same result."""
+    data = rng.standard_normal(size=(10, 10, 10, 50)) + 0.5
+    img = Nifti1Image(data, affine_eye)
+
+    cleaned = clean_img(
+        img, standardize="zscore_sample", low_pass=0.1, t_r=1.0, n_jobs=3
+    )
+
+    assert_almost_equal(
+        get_data(cleaned),
+        get_data(
+            clean_img(img, standardize="zscore_sample", low_pass=0.1, t_r=1.0)
+        ),
+    )
+
+
 def test_clean_img_surface(surf_img_2d, surf_img_1d, surf_mask_1d) -> None:
     """Test clean on surface image.
 
@@ -2083,6 +2183,51 @@ def test_concat_niimg_dtype(affine_eye):
     assert get_data(nimg).dtype == np.int16
 
 
+@pytest.mark.parametrize("dtype", [None, np.float32])
+def test_concat_imgs_no_copy(affine_eye, tmp_path, rng, dtype):
+    """Check concat_imgs(copy=False) gives the same image without loading.
+
+    Inputs are 4D images of different lengths saved as uncompressed files.
+    """
+    shape = (4, 5, 6)
+    imgs = [
+        Nifti1Image(
+            rng.integers(0, 10, (*shape, n_scans), dtype=np.int16), affine_eye
+        )
+        for n_scans in [3, 1, 2]
+    ]
+    filenames = []
+    for i, img in enumerate(imgs):
+        filenames.append(tmp_path / f"{i}.nii")
+        img.to_filename(filenames[-1])
+
+    expected = concat_imgs(filenames, dtype=dtype)
+    concatenated = concat_imgs(filenames, dtype=dtype, copy=False)
+
+    assert not concatenated.in_memory
+    assert concatenated.shape == expected.shape
+    assert_array_equal(concatenated.affine, expected.affine)
+
+    for index in [4, slice(1, 5), [5, 0, 3], np.arange(6) % 2 == 0]:
+        assert_array_equal(
+            get_data(index_img(concatenated, index)),
+            get_data(index_img(expected, index)),
+        )
+    for img, expected_img in zip(
+        iter_img(concatenated), iter_img(expected), strict=True
+    ):
+        assert_array_equal(get_data(img), get_data(expected_img))
+    assert_array_equal(
+        concatenated.dataobj[1:3, :, 2, 2:5],
+        get_data(expected)[1:3, :, 2, 2:5],
+    )
+    assert not concatenated.in_memory
+
+    data = get_data(concatenated)
+    assert data.dtype == get_data(expected).dtype
+    assert_array_equal(data, get_data(expected))
+
+
 def test_concat_imgs_surface(surf_img_2d):
     """Check concat_imgs returns a single SurfaceImage.
 
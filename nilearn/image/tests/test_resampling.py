@@ -317,6 +317,77 @@ def test_resampling_continuous_with_affine(
     )
 
 
+@pytest.mark.parametrize("interpolation", ["nearest", "linear"])
+@pytest.mark.parametrize("angle", ANGLES_TO_TEST)
+def test_resampling_4d_matches_3d(affine_eye, rng, angle, interpolation):
+    """Check that resampling volumes in batch gives the same results \
+       as resampling each volume separately.
+    """
+    data = rng.standard_normal((7, 8, 9, 3))
+    target_affine = 1.5 * rotation(angle, angle / 2)
+
+    resampled = resample_img(
+        Nifti1Image(data, affine_eye),
+        target_affine=target_affine,
+        interpolation=interpolation,
+        force_resample=True,
+        copy_header=True,
+    )
+
+    for i in range(data.shape[3]):
+        resampled_3d = resample_img(
+            Nifti1Image(data[..., i], affine_eye),
+            target_affine=target_affine,
+            interpolation=interpolation,
+            force_resample=True,
+            copy_header=True,
+        )
+        assert_array_almost_equal(
+            get_data(resampled)[..., i], get_data(resampled_3d), decimal=12
+        )
+
+
+@pytest.mark.parametrize("interpolation", ["nearest", "linear", "continuous"])
+def test_resample_img_n_jobs(affine_eye, rng, interpolation):
+    """Check that resampling volumes in several threads \
+       gives the same results.
+    """
+    img = Nifti1Image(rng.standard_normal((7, 8, 9, 5)), affine_eye)
+    target_affine = 1.5 * rotation(np.pi / 4, np.pi / 3)
+
+    resampled = [
+        resample_img(
+            img,
+            target_affine=target_affine,
+            interpolation=interpolation,
+            copy_header=True,
+            n_jobs=n_jobs,
+        )
+        for n_jobs in (1, 3)
+    ]
+
+    assert_array_equal(get_data(resampled[0]), get_data(resampled[1]))
+
+
+def test_resampling_4d_nan_volume(affine_eye, rng):
+    """Check that volumes with NaNs are still handled in 4D images."""
+    data = rng.standard_normal((7, 8, 9, 3))
+    data[2, 2, 2, 1] = np.nan
+
+    with pytest.warns(RuntimeWarning, match="NaNs or infinite values"):
+        resampled = resample_img(
+            Nifti1Image(data, affine_eye),
+            target_affine=np.diag([2.0, 2.0, 2.0, 1.0]),
+            interpolation="linear",
+            force_resample=True,
+            copy_header=True,
+        )
+
+    non_finite = ~np.isfinite(get_data(resampled))
+    assert non_finite[..., 1].any()
+    assert not non_finite[..., [0, 2]].any()
+
+
 @pytest.mark.parametrize("force_resample", [False, True])
 def test_resampling_error_checks(tmp_path, force_resample, data, affine_eye):
     img = Nifti1Image(data, affine_eye)
@@ -451,6 +522,25 @@ def test_resampling_warning_binary_image(affine_eye, rng, force_resample):
         )
 
 
+def test_resampling_warning_binary_4d_image(affine_eye, rng):
+    """Check that binary 4D images resampled by batches warn only once."""
+    data_binary = rng.integers(2, size=(4, 4, 4, 20)).astype("float64")
+    img_binary = Nifti1Image(data_binary, affine_eye)
+
+    with pytest.warns(
+        Warning, match="Resampling binary images with"
+    ) as record:
+        resample_img(
+            img_binary,
+            target_affine=rotation(0, np.pi / 4),
+            interpolation="linear",
+        )
+
+    assert (
+        sum("Resampling binary images" in str(w.message) for w in record) == 1
+    )
+
+
 @pytest.mark.parametrize("force_resample", [False, True])
 def test_resample_img_copied_header(img_4d_mni_tr2, force_resample):
     # Test that the header is copied when resampling
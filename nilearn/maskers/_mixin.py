@@ -117,7 +117,15 @@ class _MultiMixin:
         # defined in each child class
         func = self._cache(self.transform_single_imgs)
 
-        region_signals = Parallel(n_jobs=n_jobs)(
+        # surface images are processed in threads that share their data,
+        # rather than copied to worker processes
+        prefer = (
+            "threads"
+            if all(isinstance(img, SurfaceImage) for img in imgs_list)
+            else None
+        )
+
+        region_signals = Parallel(n_jobs=n_jobs, prefer=prefer)(
             delayed(func)(imgs=imgs, confounds=cfs, sample_mask=sms)
             for imgs, cfs, sms in zip(
                 niimg_iter, confounds, sample_mask, strict=False
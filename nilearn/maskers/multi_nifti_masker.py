@@ -149,6 +149,8 @@ class MultiNiftiMasker(_MultiMixin, NiftiMasker):
 
     %(clean_args)s
 
+    %(chunk_size)s
+
     Attributes
     ----------
     affine_ : 4x4 :obj:`numpy.ndarray`
@@ -203,6 +205,7 @@ class MultiNiftiMasker(_MultiMixin, NiftiMasker):
         reports=True,
         cmap="gray",
         clean_args=None,
+        chunk_size=None,
     ):
         super().__init__(
             # Mask is provided or computed
@@ -227,6 +230,7 @@ class MultiNiftiMasker(_MultiMixin, NiftiMasker):
             reports=reports,
             cmap=cmap,
             clean_args=clean_args,
+            chunk_size=chunk_size,
         )
         self.n_jobs = n_jobs
 
@@ -47,16 +47,25 @@ class _ExtractionFunctor:
         strategy,
         keep_masked_labels,
         mask_img,
+        labels_index=None,
     ):
         self.labels_img = labels_img
         self.background_label = background_label
         self.strategy = strategy
         self.keep_masked_labels = keep_masked_labels
         self.mask_img = mask_img
+        self.labels_index = labels_index
 
     def __call__(self, imgs):
         from nilearn.regions.signal_extraction import img_to_signals_labels
 
+        if self.labels_index is not None:
+            signals = self.labels_index.extract(imgs, strategy=self.strategy)
+            return signals, (
+                self.labels_index.labels,
+                self.labels_index.masked_atlas,
+            )
+
         signals, labels, masked_labels_img = img_to_signals_labels(
             imgs,
             self.labels_img,
@@ -482,6 +491,8 @@ class NiftiLabelsMasker(_LabelMaskerMixin, BaseMasker):
         return display
 
     def _fit(self, imgs):
+        from nilearn.regions.signal_extraction import _LabelsIndex
+
         check_reduction_strategy(self.strategy)
         check_parameter_in_allowed(
             self.resampling_target,
@@ -571,6 +582,21 @@ class NiftiLabelsMasker(_LabelMaskerMixin, BaseMasker):
                     "No label left after applying mask to the labels image."
                 )
 
+        # Analyze the labels once
+        # so that transform does not have to do it for each image.
+        # This is only possible if labels and mask are on the same grid,
+        # otherwise they will be resampled at transform time.
+        self._labels_index = None
+        if self.mask_img_ is None or check_same_fov(
+            self.labels_img_, self.mask_img_
+        ):
+            self._labels_index = _LabelsIndex(
+                self.labels_img_,
+                self.mask_img_,
+                self.background_label,
+                keep_masked_labels=self.keep_masked_labels,
+            )
+
         self._report_content["reports_at_fit_time"] = self.reports
         if self.reports:
             self._reporting_data = {
@@ -764,6 +790,10 @@ class NiftiLabelsMasker(_LabelMaskerMixin, BaseMasker):
 
         sklearn_output_config = getattr(self, "_sklearn_output_config", None)
 
+        labels_index = None
+        if labels_img_ is self.labels_img_ and mask_img_ is self.mask_img_:
+            labels_index = getattr(self, "_labels_index", None)
+
         region_signals, (ids, masked_atlas) = self._cache(
             filter_and_extract,
             ignore=["verbose", "memory", "memory_level"],
@@ -776,6 +806,7 @@ class NiftiLabelsMasker(_LabelMaskerMixin, BaseMasker):
                 self.strategy,
                 self.keep_masked_labels,
                 mask_img_,
+                labels_index=labels_index,
             ),
             # Pre-processing
             params,
@@ -37,14 +37,27 @@ from nilearn.masking import (
 class _ExtractionFunctor:
     func_name = "nifti_masker_extractor"
 
-    def __init__(self, mask_img_):
+    def __init__(
+        self, mask_img_, chunk_size=None, smoothing_fwhm=None, dtype=None
+    ):
         self.mask_img_ = mask_img_
+        self.chunk_size = chunk_size
+        self.smoothing_fwhm = smoothing_fwhm
+        self.dtype = dtype
 
     def __call__(self, imgs):
+        # Non float types are converted to float32 by apply_mask,
+        # as after a conversion of the whole image.
+        dtype = get_target_dtype(img_data_dtype(imgs), self.dtype)
+        if dtype is None or np.dtype(dtype).kind != "f":
+            dtype = "f"
         return (
             apply_mask(
                 imgs,
                 self.mask_img_,
+                dtype=dtype,
+                smoothing_fwhm=self.smoothing_fwhm,
+                chunk_size=self.chunk_size,
             ),
             imgs.affine,
         )
@@ -177,9 +190,26 @@ def filter_and_mask(
         parameters["target_shape"] = mask_img_.shape
         parameters["target_affine"] = mask_img_.affine
 
+    chunk_size = parameters.get("chunk_size")
+    smoothing_fwhm = None
+    dtype = parameters.get("dtype")
+    extraction_dtype = None
+    if chunk_size is not None:
+        # smoothing is purely spatial and conversion is voxelwise:
+        # they are applied block by block during the extraction
+        # so that the whole 4D image is never loaded at once
+        parameters = copy_object(parameters)
+        smoothing_fwhm = parameters.pop("smoothing_fwhm", None)
+        dtype, extraction_dtype = None, dtype
+
     data, _ = filter_and_extract(
         imgs,
-        _ExtractionFunctor(mask_img_),
+        _ExtractionFunctor(
+            mask_img_,
+            chunk_size=chunk_size,
+            smoothing_fwhm=smoothing_fwhm,
+            dtype=extraction_dtype,
+        ),
         parameters,
         memory_level=memory_level,
         memory=memory,
@@ -187,6 +217,9 @@ def filter_and_mask(
         confounds=confounds,
         sample_mask=sample_mask,
         copy=copy,
+        # Convert the data as soon as they are loaded,
+        # so that they are extracted and cleaned in the requested type.
+        dtype=dtype,
     )
     # For _later_: missing value removal or imputing of missing data
     # (i.e. we want to get rid of NaNs, if smoothing must be done
@@ -294,6 +327,11 @@ class NiftiMasker(ClassNamePrefixFeaturesOutMixin, BaseMasker):
 
         .. nilearn_versionadded:: 0.12.0
 
+    %(chunk_size)s
+
+        .. note::
+            Chunking is only effective when no resampling is needed,
+            as resampling loads the whole image in memory.
 
     Attributes
     ----------
@@ -354,6 +392,7 @@ class NiftiMasker(ClassNamePrefixFeaturesOutMixin, BaseMasker):
         reports=True,
         cmap="gray",
         clean_args=None,
+        chunk_size=None,
     ):
         # Mask is provided or computed
         self.mask_img = mask_img
@@ -377,6 +416,7 @@ class NiftiMasker(ClassNamePrefixFeaturesOutMixin, BaseMasker):
         self.reports = reports
         self.cmap = cmap
         self.clean_args = clean_args
+        self.chunk_size = chunk_size
 
         self._reset_report()
 
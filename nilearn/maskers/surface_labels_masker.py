@@ -323,6 +323,14 @@ class SurfaceLabelsMasker(_LabelMaskerMixin, _BaseSurfaceMasker):
 
         self.lut_ = self._generate_lut()
 
+        # avoid circular import
+        from nilearn.regions.signal_extraction import _SurfaceLabelsIndex
+
+        self._labels_index = _SurfaceLabelsIndex(
+            self.labels_img_,
+            [x for x in self.labels_ if x != self.background_label],
+        )
+
         if self.clean_args is None:
             self.clean_args_ = {}
         else:
@@ -407,6 +415,35 @@ class SurfaceLabelsMasker(_LabelMaskerMixin, _BaseSurfaceMasker):
 
         imgs = self._smooth(imgs)
 
+        mask_logger("extracting", verbose=self.verbose)
+
+        if self._labels_index.counts.all():
+            region_signals = self._labels_index.extract(
+                imgs, strategy=self.strategy
+            )
+            if imgs.data._dtype == np.float32:
+                region_signals = region_signals.astype(np.float32)
+        else:
+            region_signals = self._reduce_with_ndimage(imgs)
+
+        input_type = (
+            imgs.data._dtype
+            if isinstance(imgs, SurfaceImage)
+            else imgs[0].data._dtype
+        )
+        target_dtype = get_target_dtype(input_type, self.dtype)
+        if target_dtype is None:
+            target_dtype = imgs.data._dtype
+
+        region_signals = self._clean(region_signals, confounds, sample_mask)
+        return region_signals.astype(target_dtype)
+
+    def _reduce_with_ndimage(self, imgs):
+        """Reduce the data of each region, one sample at a time.
+
+        Only used when some labels have no vertex,
+        to keep the output of the ndimage reductions for those labels.
+        """
         img_data = get_data(imgs)
 
         target_datatype = (
@@ -430,25 +467,13 @@ class SurfaceLabelsMasker(_LabelMaskerMixin, _BaseSurfaceMasker):
 
         reduction_function = getattr(ndimage, self.strategy)
 
-        mask_logger("extracting", verbose=self.verbose)
-
         for n, sample in enumerate(np.rollaxis(img_data, -1)):
             tmp = np.asarray(
                 reduction_function(sample, labels=labels_data, index=index)
             )
             region_signals[n] = tmp
 
-        input_type = (
-            imgs.data._dtype
-            if isinstance(imgs, SurfaceImage)
-            else imgs[0].data._dtype
-        )
-        target_dtype = get_target_dtype(input_type, self.dtype)
-        if target_dtype is None:
-            target_dtype = imgs.data._dtype
-
-        region_signals = self._clean(region_signals, confounds, sample_mask)
-        return region_signals.astype(target_dtype)
+        return region_signals
 
     @fill_doc
     def inverse_transform(self, signals):
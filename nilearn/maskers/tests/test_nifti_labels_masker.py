@@ -370,6 +370,24 @@ def test_nifti_labels_masker_reduction_strategies(
     assert default_masker.strategy == "mean"
 
 
+def test_nifti_labels_masker_labels_index(monkeypatch, img_labels, img_fmri):
+    """Check that labels are analyzed at fit time and reused by transform."""
+    masker = NiftiLabelsMasker(img_labels).fit(img_fmri)
+
+    assert masker._labels_index is not None
+
+    expected = masker.transform(img_fmri)
+
+    def _fail(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError("labels should not be analyzed again")
+
+    monkeypatch.setattr(
+        "nilearn.regions.signal_extraction.img_to_signals_labels", _fail
+    )
+
+    assert_array_equal(masker.transform(img_fmri), expected)
+
+
 def test_nifti_labels_masker_reduction_strategies_error(affine_eye):
     """Tests NiftiLabelsMasker invalid strategy."""
     labels_data = np.array([[[0, 0, 0, 0, 0], [1, 1, 1, 1, 1]]], dtype=np.int8)
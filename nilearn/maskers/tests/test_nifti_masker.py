@@ -9,7 +9,7 @@ import warnings
 
 import numpy as np
 import pytest
-from nibabel import Nifti1Image
+from nibabel import Nifti1Image, load
 from numpy.testing import assert_array_equal
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
@@ -456,3 +456,49 @@ def test_filter_and_mask(affine_eye):
     # Test return_affine = False
     data = filter_and_mask(data_img, mask_img, params)
     assert data.shape == (data_shape[3], np.prod(np.array(mask.shape)))
+
+
+@pytest.mark.parametrize("smoothing_fwhm", [None, 3])
+def test_chunk_size(tmp_path, rng, affine_eye, smoothing_fwhm):
+    """Check that transforming by blocks of volumes gives the same result."""
+    data = rng.standard_normal((10, 11, 12, 9))
+    data_img = Nifti1Image(data, affine_eye)
+    data_img.to_filename(tmp_path / "data.nii")
+    mask = np.zeros((10, 11, 12), dtype="int8")
+    mask[2:8, 2:8, 2:8] = 1
+    mask_img = Nifti1Image(mask, affine_eye)
+
+    params = {
+        "mask_img": mask_img,
+        "smoothing_fwhm": smoothing_fwhm,
+        "detrend": True,
+        "standardize": None,
+    }
+    expected = NiftiMasker(**params).fit_transform(tmp_path / "data.nii")
+    signals = NiftiMasker(**params, chunk_size=4).fit_transform(
+        tmp_path / "data.nii"
+    )
+
+    np.testing.assert_allclose(signals, expected)
+
+
+@pytest.mark.parametrize("dtype", ["auto", np.float64])
+def test_chunk_size_dtype(tmp_path, rng, affine_eye, dtype):
+    """Check that images converted by blocks are never loaded at once."""
+    data = rng.standard_normal((10, 11, 12, 9))
+    Nifti1Image(data, affine_eye).to_filename(tmp_path / "data.nii")
+    data_img = load(tmp_path / "data.nii")
+    mask_img = Nifti1Image(np.ones((10, 11, 12), dtype="int8"), affine_eye)
+    params = {
+        "mask_img": mask_img,
+        "smoothing_fwhm": 3,
+        "standardize": None,
+        "dtype": dtype,
+    }
+
+    expected = NiftiMasker(**params).fit_transform(tmp_path / "data.nii")
+    signals = NiftiMasker(**params, chunk_size=4).fit_transform(data_img)
+
+    assert not data_img.in_memory
+    assert signals.dtype == expected.dtype
+    np.testing.assert_allclose(signals, expected, rtol=1e-5)
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from numpy.testing import assert_array_equal
+from scipy import ndimage
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
 from nilearn._utils.estimator_checks import (
@@ -12,6 +13,7 @@ from nilearn._utils.estimator_checks import (
 from nilearn._utils.versions import SKLEARN_LT_1_6
 from nilearn.maskers import SurfaceLabelsMasker
 from nilearn.maskers.tests.conftest import sklearn_surf_label_img
+from nilearn.regions import signal_extraction
 from nilearn.surface import SurfaceImage
 
 ESTIMATORS_TO_CHECK = [
@@ -357,6 +359,52 @@ def test_transform(surf_label_img, surf_img_1d, strategy):
     assert signal.size == 1
 
 
+@pytest.mark.thread_unsafe
+@pytest.mark.parametrize(
+    "strategy",
+    (
+        "variance",
+        "minimum",
+        "mean",
+        "standard_deviation",
+        "sum",
+        "median",
+        "maximum",
+    ),
+)
+def test_transform_matches_ndimage(
+    monkeypatch, surf_mesh, surf_img_2d, strategy
+):
+    """Check signals match scipy.ndimage reductions on the whole data.
+
+    Samples are extracted by blocks of 2 here.
+    """
+    monkeypatch.setattr(signal_extraction, "_MAX_REGION_DATA_SIZE", 16)
+    labels_img = SurfaceImage(
+        surf_mesh,
+        {
+            "left": np.asarray([1, 3, 1, 2]),
+            "right": np.asarray([3, 3, 0, 2, 1]),
+        },
+    )
+    img = surf_img_2d(5)
+    masker = SurfaceLabelsMasker(
+        labels_img=labels_img, strategy=strategy, standardize=None
+    ).fit()
+
+    signals = masker.transform(img)
+
+    data = np.concatenate(list(img.data.parts.values()))
+    labels = np.concatenate(list(labels_img.data.parts.values()))
+    expected = np.asarray(
+        [
+            getattr(ndimage, strategy)(sample, labels=labels, index=[1, 2, 3])
+            for sample in data.T
+        ]
+    )
+    assert_array_equal(signals, expected.astype(signals.dtype))
+
+
 def test_transform_with_mask(surf_mesh, surf_img_2d):
     """Test transform extract signals with a mask and check warning."""
     # create a labels image
@@ -13,9 +13,14 @@ from scipy.ndimage import binary_dilation, binary_erosion
 from nilearn._utils import logger
 from nilearn._utils.cache_mixin import cache
 from nilearn._utils.docs import fill_doc
+from nilearn._utils.helpers import stringify_path
 from nilearn._utils.logger import find_stack_level
 from nilearn._utils.ndimage import get_border_data, largest_connected_component
-from nilearn._utils.niimg import ensure_finite_data, safe_get_data
+from nilearn._utils.niimg import (
+    ensure_finite_data,
+    img_data_dtype,
+    safe_get_data,
+)
 from nilearn._utils.numpy_conversions import as_ndarray
 from nilearn._utils.param_validation import check_params
 from nilearn.datasets import (
@@ -905,7 +910,13 @@ def compute_multi_brain_mask(
 
 @fill_doc
 def apply_mask(
-    imgs, mask_img, dtype="f", smoothing_fwhm=None, ensure_finite=True
+    imgs,
+    mask_img,
+    dtype="f",
+    smoothing_fwhm=None,
+    ensure_finite=True,
+    chunk_size=None,
+    output_file=None,
 ) -> np.ndarray:
     """Extract signals from images using specified mask.
 
@@ -937,6 +948,16 @@ def apply_mask(
         If ensure_finite is True, the non-finite values (NaNs and
         infs) found in the images will be replaced by zeros.
 
+    %(chunk_size)s
+
+    output_file : :obj:`str` or :obj:`pathlib.Path` or None, default=None
+        Only used for volume data when ``chunk_size`` is not None.
+        If not None, the masked series are written
+        to a memory-mapped ``.npy`` file at this location
+        and the returned array is backed by this file.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     Returns
     -------
     run_series : :class:`numpy.ndarray`
@@ -962,11 +983,19 @@ def apply_mask(
         dtype=dtype,
         smoothing_fwhm=smoothing_fwhm,
         ensure_finite=ensure_finite,
+        chunk_size=chunk_size,
+        output_file=output_file,
     )
 
 
 def apply_mask_fmri(
-    imgs, mask_img, dtype="f", smoothing_fwhm=None, ensure_finite=True
+    imgs,
+    mask_img,
+    dtype="f",
+    smoothing_fwhm=None,
+    ensure_finite=True,
+    chunk_size=None,
+    output_file=None,
 ) -> np.ndarray:
     """Perform similar action to :func:`nilearn.masking.apply_mask`.
 
@@ -1013,6 +1042,21 @@ def apply_mask_fmri(
             f"{imgs_img.shape[:3]!s}"
         )
 
+    if chunk_size is not None and len(imgs_img.shape) == 4:
+        if dtype == "f":
+            dtype = img_data_dtype(imgs_img)
+            if np.dtype(dtype).kind != "f":
+                dtype = np.float32
+        return _apply_mask_fmri_chunked(
+            imgs_img,
+            mask_data,
+            dtype=dtype,
+            smoothing_fwhm=smoothing_fwhm,
+            ensure_finite=ensure_finite,
+            chunk_size=chunk_size,
+            output_file=output_file,
+        )
+
     # All the following has been optimized for C order.
     # Time that may be lost in conversion here is regained multiple times
     # afterward, especially if smoothing is applied.
@@ -1037,6 +1081,67 @@ def apply_mask_fmri(
     return series[mask_data].T
 
 
+def _apply_mask_fmri_chunked(
+    imgs_img,
+    mask_data,
+    dtype,
+    smoothing_fwhm=None,
+    ensure_finite=True,
+    chunk_size=100,
+    output_file=None,
+):
+    """Mask a 4D image block of volumes by block of volumes.
+
+    Volumes are read through the data object of the image,
+    so that for images loaded from disk
+    only ``chunk_size`` volumes are held in memory at any time.
+    The masked signals are written into a preallocated array
+    of shape (n_volumes, n_voxels),
+    possibly memory-mapped to ``output_file``.
+    """
+    if chunk_size < 1:
+        raise ValueError(
+            f"'chunk_size' must be a positive integer. Got {chunk_size}."
+        )
+
+    # Delayed import to avoid circular imports
+    from nilearn.image.image import smooth_array
+
+    n_volumes = imgs_img.shape[3]
+    n_voxels = int(mask_data.sum())
+    if output_file is None:
+        series = np.empty((n_volumes, n_voxels), dtype=dtype)
+    else:
+        series = np.lib.format.open_memmap(
+            stringify_path(output_file),
+            mode="w+",
+            dtype=dtype,
+            shape=(n_volumes, n_voxels),
+        )
+
+    affine = imgs_img.affine[:3, :3]
+    for start in range(0, n_volumes, chunk_size):
+        stop = min(start + chunk_size, n_volumes)
+        block = as_ndarray(
+            np.asanyarray(imgs_img.dataobj[..., start:stop]),
+            dtype=dtype,
+            order="C",
+            copy=True,
+        )
+        block = smooth_array(
+            block,
+            affine,
+            fwhm=smoothing_fwhm,
+            ensure_finite=ensure_finite,
+            copy=False,
+        )
+        series[start:stop] = block[mask_data].T
+
+    if isinstance(series, np.memmap):
+        series.flush()
+    return series
+
+
 def _unmask_3d(X, mask, order="C"):
     """Take masked data and bring them back to 3D (space only).
 
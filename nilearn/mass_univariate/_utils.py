@@ -67,72 +67,321 @@ def calculate_tfce(
        threshold dependence and localization in cluster inference.
        Neuroimage, 44(1), 83-98.
     """
+    # Voxels that are zero in all maps never belong to a cluster.
+    mask = np.any(arr4d != 0, axis=3)
+    values = arr4d[mask].T
+
     tfce_4d = np.zeros_like(arr4d)
+    tfce_4d[mask] = calculate_tfce_on_graph(
+        values,
+        grid_edges(mask, bin_struct),
+        E=E,
+        H=H,
+        dh=dh,
+        two_sided_test=two_sided_test,
+    ).T
+    return tfce_4d
 
-    # For each passed t map
-    for i_regressor in range(arr4d.shape[3]):
-        arr3d = arr4d[..., i_regressor]
-
-        signs = [-1, 1] if two_sided_test else [1]
-        score_threshs = _return_score_threshs(arr3d, dh, two_sided_test)
-
-        # If we apply the sign first...
-        for sign in signs:
-            # Init a temp copy of arr3d with the current sign applied,
-            # which can then be reused by incrementally setting more
-            # voxel's to background, by taking advantage that each score_thresh
-            # is incrementally larger
-            temp_arr3d = arr3d * sign
-
-            # Prep step
-            for score_thresh in score_threshs:
-                temp_arr3d[temp_arr3d < score_thresh] = 0
-
-                # Label into clusters - importantly (for the next step)
-                # this returns clusters labeled ordinally
-                # from 1 to n_clusters+1,
-                # which allows us to use bincount to count
-                # frequencies directly.
-                labeled_arr3d, _ = label(temp_arr3d, bin_struct)
-
-                # Next, we want to replace each label with its cluster
-                # extent, that is, the size of the cluster it is part of
-                # To do this, we will first compute a flattened version of
-                # only the non-zero cluster labels.
-                labeled_arr3d_flat = labeled_arr3d.flatten()
-                non_zero_inds = np.where(labeled_arr3d_flat != 0)[0]
-                labeled_non_zero = labeled_arr3d_flat[non_zero_inds]
-
-                # Count the size of each unique cluster, via its label.
-                # The reason why we pass only the non-zero labels to bincount
-                # is because it includes a bin for zeros, and in our labels
-                # zero represents the background,
-                # which we want to have a TFCE value of 0.
-                cluster_counts = np.bincount(labeled_non_zero)
-
-                # Next, we convert each unique cluster count to its TFCE value.
-                # Where each cluster's tfce value is based
-                # on both its cluster extent and z-value
-                # (via the current score_thresh)
-                # NOTE: We do not multiply by dh, based on fslmaths'
-                # implementation. This differs from the original paper.
-                cluster_tfces = sign * (cluster_counts**E) * (score_thresh**H)
-
-                # Before we can add these values to tfce_4d, we need to
-                # map cluster-wise tfce values back to a voxel-wise array,
-                # including any zero / background voxels.
-                tfce_step_values = np.zeros(labeled_arr3d_flat.shape)
-                tfce_step_values[non_zero_inds] = cluster_tfces[
-                    labeled_non_zero
-                ]
-
-                # Now, we just need to reshape these values back to 3D
-                # and they can be incremented to tfce_4d.
-                tfce_4d[..., i_regressor] += tfce_step_values.reshape(
-                    temp_arr3d.shape
-                )
 
-    return tfce_4d
+def grid_edges(mask, bin_struct):
+    """Return the pairs of neighboring voxels of a mask.
+
+    Parameters
+    ----------
+    mask : :obj:`numpy.ndarray` of booleans
+        Mask of the voxels to connect.
+
+    bin_struct : :obj:`numpy.ndarray`
+        Connectivity matrix for defining clusters,
+        with the same number of dimensions as ``mask``.
+
+    Returns
+    -------
+    edges : :obj:`numpy.ndarray` of shape (2, n_edges)
+        Pairs of neighboring voxels,
+        as indices of the voxels in ``mask[mask]``.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    index = np.full(mask.shape, -1, dtype=np.intp)
+    index[mask] = np.arange(np.count_nonzero(mask))
+
+    center = np.array(bin_struct.shape) // 2
+    edges = []
+    for offset in np.argwhere(bin_struct) - center:
+        # only keep one offset of each symmetric pair
+        if tuple(offset) <= (0,) * mask.ndim:
+            continue
+        source = tuple(
+            slice(max(0, -o), n - max(0, o))
+            for o, n in zip(offset, mask.shape, strict=True)
+        )
+        target = tuple(
+            slice(max(0, o), n - max(0, -o))
+            for o, n in zip(offset, mask.shape, strict=True)
+        )
+        pairs = np.stack((index[source].ravel(), index[target].ravel()))
+        edges.append(pairs[:, np.all(pairs >= 0, axis=0)])
+
+    if not edges:
+        return np.empty((2, 0), dtype=np.intp)
+    return np.concatenate(edges, axis=1)
+
+
+def mesh_edges(mask_img):
+    """Return the pairs of neighboring vertices of a surface mask.
+
+    Parameters
+    ----------
+    mask_img : :obj:`~nilearn.surface.SurfaceImage`
+        Mask of the vertices to connect.
+
+    Returns
+    -------
+    edges : :obj:`numpy.ndarray` of shape (2, n_edges)
+        Pairs of neighboring vertices,
+        as indices of the vertices in the data masked by ``mask_img``,
+        with parts concatenated in order.
+    """
+    from scipy import sparse
+
+    from nilearn.surface.surface import compute_adjacency_matrix
+
+    edges = []
+    start = 0
+    for part, mask in mask_img.data.parts.items():
+        mask = np.asarray(mask).ravel().astype(bool)
+        index = np.full(mask.shape, -1, dtype=np.intp)
+        index[mask] = start + np.arange(np.count_nonzero(mask))
+        adjacency = sparse.triu(
+            compute_adjacency_matrix(mask_img.mesh.parts[part]), k=1
+        ).tocoo()
+        pairs = np.stack((index[adjacency.row], index[adjacency.col]))
+        edges.append(pairs[:, np.all(pairs >= 0, axis=0)])
+        start += np.count_nonzero(mask)
+    return np.concatenate(edges, axis=1)
+
+
+# Maximum number of edges processed at once by calculate_tfce_on_graph,
+# summed over the maps of a batch.
+_TFCE_BATCH_EDGES = 2**23
+
+
+def calculate_tfce_on_graph(
+    values,
+    edges,
+    E=0.5,
+    H=2,
+    dh="auto",
+    two_sided_test: bool = True,
+):
+    """Calculate threshold-free cluster enhancement values \
+    for maps defined on the nodes of a graph.
+
+    This gives the same values as :func:`calculate_tfce`,
+    but clusters are defined by the edges of a graph,
+    so it applies to volumes as well as to surface meshes.
+
+    All thresholds are handled in a single sweep:
+    nodes are sorted by the number of thresholds they exceed
+    and, going from the highest to the lowest threshold,
+    the clusters of the previous threshold are merged
+    with the newly supra-threshold nodes.
+    All maps of the batch are processed together.
+
+    Connected components are only computed on the graph
+    between the clusters of the previous threshold
+    and the new nodes, but the cluster of every supra-threshold node
+    is relabeled at each threshold, so the cost of the sweep
+    grows with the number of thresholds times the number of nodes.
+
+    Parameters
+    ----------
+    values : :obj:`numpy.ndarray` of shape (n_maps, n_nodes)
+        Unthresholded t-statistic maps.
+
+    edges : :obj:`numpy.ndarray` of shape (2, n_edges)
+        Pairs of neighboring nodes.
+        See :func:`grid_edges` and :func:`mesh_edges`.
+
+    E : :obj:`float`, default=0.5
+        Extent weight.
+
+    H : :obj:`float`, default=2
+        Height weight.
+
+    dh : 'auto' or :obj:`float`, default='auto'
+        Step size for TFCE calculation.
+        If set to 'auto', use 100 steps, as is done in fslmaths.
+
+    two_sided_test : :obj:`bool`, default=True
+        Whether to assess both positive and negative clusters (True) or just
+        positive ones (False).
+
+    Returns
+    -------
+    tfce : :obj:`numpy.ndarray` of shape (n_maps, n_nodes)
+        :term:`TFCE` values.
+    """
+    values = np.atleast_2d(values)
+    edges = np.asarray(edges, dtype=np.intp).reshape(2, -1)
+    signs = [-1, 1] if two_sided_test else [1]
+    score_threshs = [
+        _return_score_threshs(map_, dh, two_sided_test) for map_ in values
+    ]
+
+    # Positive and negative clusters are handled as separate maps.
+    signed_values = np.concatenate([sign * values for sign in signs])
+    signed_threshs = score_threshs * len(signs)
+    map_signs = np.repeat(signs, len(values))
+
+    tfce = np.zeros(signed_values.shape)
+    batch_size = max(1, _TFCE_BATCH_EDGES // max(1, edges.shape[1]))
+    for start in range(0, len(signed_values), batch_size):
+        batch = slice(start, start + batch_size)
+        tfce[batch] = _tfce_sweep(
+            signed_values[batch],
+            signed_threshs[batch],
+            map_signs[batch],
+            edges,
+            E,
+            H,
+        )
+
+    return tfce.reshape(len(signs), *values.shape).sum(axis=0)
+
+
+def _tfce_sweep(values, score_threshs, signs, edges, E, H):
+    """Compute TFCE values of a batch of maps in one sweep over thresholds.
+
+    The maps are handled as disjoint copies of the graph.
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    n_maps, n_nodes = values.shape
+    n_steps = max(len(thresh) for thresh in score_threshs)
+
+    # Height of each step for each map, zero-padded.
+    heights = np.zeros((n_maps, n_steps))
+    # Step of each node: number of thresholds it exceeds.
+    # A node is zeroed as soon as it is below a threshold,
+    # and NaNs are never zeroed.
+    node_steps = np.zeros((n_maps, n_nodes), dtype=np.intp)
+    for i, (map_, thresh) in enumerate(
+        zip(values, score_threshs, strict=True)
+    ):
+        heights[i, : len(thresh)] = thresh
+        node_steps[i] = np.searchsorted(
+            np.maximum.accumulate(thresh), map_, side="right"
+        )
+        node_steps[i, map_ == 0] = 0
+    node_steps = node_steps.ravel()
+
+    # Sort nodes by decreasing step,
+    # so that the supra-threshold nodes of each step form a prefix.
+    # (steps are small integers: a stable sort of uint16 is a radix sort)
+    order = np.argsort((n_steps - node_steps).astype(np.uint16), kind="stable")
+    node_steps = node_steps[order]
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    node_maps = order // n_nodes
+
+    # An edge joins two clusters from the lowest step of its nodes.
+    offsets = (np.arange(n_maps) * n_nodes)[:, np.newaxis]
+    edge_a = rank[(edges[0] + offsets).ravel()]
+    edge_b = rank[(edges[1] + offsets).ravel()]
+    edge_steps = np.minimum(node_steps[edge_a], node_steps[edge_b])
+    edge_order = np.argsort(
+        (n_steps - edge_steps).astype(np.uint16), kind="stable"
+    )
+    edge_a, edge_b = edge_a[edge_order], edge_b[edge_order]
+    edge_steps = edge_steps[edge_order]
+
+    steps = np.arange(n_steps + 2)
+    n_active_nodes = np.searchsorted(-node_steps, -steps, side="right")
+    n_active_edges = np.searchsorted(-edge_steps, -steps, side="right")
+
+    # Going down from the highest step, merge the clusters of the previous
+    # step with the nodes that become supra-threshold.
+    # NOTE: All supra-threshold nodes are relabeled at each step.
+    # An incremental union-find that only visits the new edges
+    # was slower in practice, as the number of steps is at most 1000.
+    # Current cluster of each supra-threshold node,
+    # and size and map of each cluster.
+    clusters = np.empty(order.size, dtype=np.intp)
+    # cluster of each node at the highest step it reaches
+    birth_clusters = np.empty(order.size, dtype=np.intp)
+    sizes = np.empty(0)
+    cluster_maps = np.empty(0, dtype=np.intp)
+    # For each step: TFCE contribution of its clusters,
+    # and cluster of the lower step containing each of its clusters.
+    cluster_tfces, parents = {}, {}
+    n_old, n_old_edges = 0, 0
+    for step in range(n_steps, 0, -1):
+        n_active = n_active_nodes[step]
+        if n_active == 0:
+            continue
+        n_clusters, n_new = sizes.size, n_active - n_old
+
+        new_a = edge_a[n_old_edges : n_active_edges[step]]
+        new_b = edge_b[n_old_edges : n_active_edges[step]]
+        # Graph between the clusters of the previous step
+        # and the nodes that are supra-threshold from this step.
+        node_ids = np.concatenate(
+            (clusters[:n_old], np.arange(n_clusters, n_clusters + n_new))
+        )
+        n_graph_nodes = n_clusters + n_new
+        graph = coo_matrix(
+            (
+                np.ones(new_a.size, dtype=np.int8),
+                (node_ids[new_a], node_ids[new_b]),
+            ),
+            shape=(n_graph_nodes, n_graph_nodes),
+        )
+        n_labels, labels = connected_components(graph, directed=False)
+
+        graph_node_maps = np.concatenate(
+            (cluster_maps, node_maps[n_old:n_active])
+        )
+        sizes = np.bincount(
+            labels,
+            weights=np.concatenate((sizes, np.ones(n_new))),
+            minlength=n_labels,
+        )
+        cluster_maps = np.empty(n_labels, dtype=np.intp)
+        cluster_maps[labels] = graph_node_maps
+        clusters[:n_active] = labels[node_ids]
+        birth_clusters[n_old:n_active] = clusters[n_old:n_active]
+
+        if step < n_steps:
+            parents[step + 1] = labels[:n_clusters]
+        # NOTE: We do not multiply by dh, based on fslmaths'
+        # implementation. This differs from the original paper.
+        cluster_tfces[step] = (
+            signs[cluster_maps]
+            * (sizes**E)
+            * (heights[cluster_maps, step - 1] ** H)
+        )
+        n_old, n_old_edges = n_active, n_active_edges[step]
+
+    # Going up from the lowest step, accumulate the contributions
+    # of the clusters containing each node,
+    # and assign its total to the node at the highest step it reaches.
+    tfce = np.zeros(order.size)
+    accumulated = np.zeros(0)
+    for step in range(1, n_steps + 1):
+        if step not in cluster_tfces:
+            break
+        if step == 1:
+            accumulated = cluster_tfces[step]
+        else:
+            accumulated = accumulated[parents[step]] + cluster_tfces[step]
+        born = slice(n_active_nodes[step + 1], n_active_nodes[step])
+        tfce[born] = accumulated[birth_clusters[born]]
+
+    tfce_maps = np.empty_like(tfce)
+    tfce_maps[order] = tfce
+    return tfce_maps.reshape(n_maps, n_nodes)
 
 
 def _return_score_threshs(arr3d, dh, two_sided_test):
@@ -439,3 +688,61 @@ def t_score_with_covars_and_normalized_design(
         a2 = np.sum(beta_targetvars_covars**2, 1)
         rss = 1 - a2[:, np.newaxis] - beta_targetvars_testedvars**2
     return beta_targetvars_testedvars * np.sqrt((dof - 1.0) / rss)
+
+
+def batched_t_score_with_covars_and_normalized_design(
+    tested_vars, target_vars, covars_orthonormalized=None
+):
+    """t-scores of the regression of target variates on a batch of designs.
+
+    This is equivalent to calling
+    :func:`t_score_with_covars_and_normalized_design`
+    for each design of the batch,
+    but all products with the target variates
+    are computed with a single matrix multiplication.
+
+    Parameters
+    ----------
+    tested_vars : array-like, shape=(n_batch, n_samples, n_tested_vars)
+        Explanatory variates of each design.
+
+    target_vars : array-like, shape=(n_samples, n_target_vars)
+        Targets variates. F-ordered is better for efficient computation.
+
+    covars_orthonormalized : array-like, \
+            shape=(n_batch, n_samples, n_covars) or None, default=None
+        Confounding variates of each design.
+
+    Returns
+    -------
+    score : numpy.ndarray, shape=(n_batch, n_target_vars, n_tested_vars)
+        t-scores associated with the tests of each explanatory variate against
+        each target variate (in the presence of covars), for each design.
+
+    """
+    n_batch, n_samples, n_tested_vars = tested_vars.shape
+    if covars_orthonormalized is None:
+        design = tested_vars
+        lost_dof = 0
+    else:
+        design = np.concatenate((tested_vars, covars_orthonormalized), axis=2)
+        lost_dof = covars_orthonormalized.shape[2]
+    n_columns = design.shape[2]
+    # Tested variates are fitted independently,
+    # so lost_dof is unrelated to n_tested_vars.
+    dof = target_vars.shape[0] - lost_dof
+
+    # single GEMM for all designs of the batch,
+    # laid out so that the descriptors are contiguous
+    design = design.transpose(0, 2, 1).reshape(-1, n_samples)
+    beta = np.dot(design, target_vars).reshape(n_batch, n_columns, -1)
+
+    beta_targetvars_testedvars = beta[:, :n_tested_vars]
+    score = 1 - beta_targetvars_testedvars**2
+    if covars_orthonormalized is not None:
+        score -= np.sum(beta[:, n_tested_vars:] ** 2, axis=1)[:, np.newaxis]
+    # in place: score = beta * sqrt((dof - 1) / rss)
+    np.divide(dof - 1.0, score, out=score)
+    np.sqrt(score, out=score)
+    score *= beta_targetvars_testedvars
+    return score.transpose(0, 2, 1)
@@ -7,7 +7,6 @@ import warnings
 
 import joblib
 import numpy as np
-from nibabel import Nifti1Image
 from scipy import stats
 from scipy.ndimage import generate_binary_structure, label
 from sklearn.utils import check_random_state
@@ -19,13 +18,17 @@ from nilearn._utils.logger import find_stack_level, readable_time
 from nilearn._utils.param_validation import check_params
 from nilearn.masking import apply_mask
 from nilearn.mass_univariate._utils import (
+    batched_t_score_with_covars_and_normalized_design,
     calculate_cluster_measures,
-    calculate_tfce,
+    calculate_tfce_on_graph,
+    grid_edges,
+    mesh_edges,
     normalize_matrix_on_axis,
     null_to_p,
     orthonormalize_matrix,
     t_score_with_covars_and_normalized_design,
 )
+from nilearn.surface import SurfaceImage
 
 
 def _permuted_ols_on_chunk(
@@ -42,6 +45,7 @@ def _permuted_ols_on_chunk(
     two_sided_test=True,
     tfce=False,
     tfce_original_data=None,
+    tfce_edges=None,
     random_state=None,
     verbose=0,
 ):
@@ -118,6 +122,11 @@ def _permuted_ols_on_chunk(
 
         .. nilearn_versionadded:: 0.9.2
 
+    tfce_edges : None or array-like, shape=(2, n_edges), default=None
+        Pairs of neighboring descriptors defining clusters for TFCE.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     %(random_state)s
 
     %(verbose0)s
@@ -186,28 +195,51 @@ def _permuted_ols_on_chunk(
         h0_csfwe_part = np.empty((n_regressors, n_perm_chunk))
         h0_cmfwe_part = np.empty((n_regressors, n_perm_chunk))
 
-    for i_perm in range(n_perm_chunk):
-        if intercept_test:
-            # sign swap (random multiplication by 1 or -1)
-            target_vars = target_vars * (
-                rng.randint(2, size=(n_samples, 1)) * 2 - 1
-            )
-        else:
-            # shuffle data
-            # Regarding computation costs, we choose to shuffle testvars
-            # and covars rather than fmri_signal.
-            # Also, it is important to shuffle tested_vars and covars
-            # jointly to simplify t-scores computation (null dot product).
-            shuffle_idx = rng.permutation(n_samples)
-            tested_vars = tested_vars[shuffle_idx]
-            if confounding_vars is not None:
-                confounding_vars = confounding_vars[shuffle_idx]
+    n_covars = 0 if confounding_vars is None else confounding_vars.shape[1]
+    batch_size = _permutation_batch_size(
+        n_samples, n_descriptors, n_regressors + n_covars
+    )
+    if threshold is not None:
+        bin_struct = generate_binary_structure(3, 1)
+
+    signs = np.ones((n_samples, 1))
+    step = 11 - min(verbose, 10)
+    for i_start in range(0, n_perm_chunk, batch_size):
+        batch = slice(i_start, min(i_start + batch_size, n_perm_chunk))
+
+        # Draw the permutations of the batch in the same order
+        # as if they were applied one after the other,
+        # and apply them to the design rather than to the data
+        # so that the t-scores of the whole batch
+        # are obtained with a single matrix product.
+        tested_batch, covars_batch = [], []
+        for _ in range(batch.start, batch.stop):
+            if intercept_test:
+                # sign swap (random multiplication by 1 or -1)
+                # Flipping the signs of the samples of the design
+                # is equivalent to flipping the signs of target_vars.
+                signs = signs * (rng.randint(2, size=(n_samples, 1)) * 2 - 1)
+                tested_batch.append(signs * tested_vars)
+                if confounding_vars is not None:
+                    covars_batch.append(signs * confounding_vars)
+            else:
+                # shuffle data
+                # Regarding computation costs, we choose to shuffle testvars
+                # and covars rather than fmri_signal.
+                # Also, it is important to shuffle tested_vars and covars
+                # jointly to simplify t-scores computation (null dot product).
+                shuffle_idx = rng.permutation(n_samples)
+                tested_vars = tested_vars[shuffle_idx]
+                tested_batch.append(tested_vars)
+                if confounding_vars is not None:
+                    confounding_vars = confounding_vars[shuffle_idx]
+                    covars_batch.append(confounding_vars)
 
         # OLS regression on randomized data
-        perm_scores = np.asfortranarray(
-            t_score_with_covars_and_normalized_design(
-                tested_vars, target_vars, confounding_vars
-            )
+        perm_scores_batch = batched_t_score_with_covars_and_normalized_design(
+            np.stack(tested_batch),
+            target_vars,
+            np.stack(covars_batch) if covars_batch else None,
         )
 
         # find the rank of the original scores in h0_fmax_part
@@ -218,70 +250,74 @@ def _permuted_ols_on_chunk(
         # NOTE: This is not done for the cluster-level methods.
         if two_sided_test:
             # Get maximum absolute value for voxel-level FWE
-            h0_fmax_part[:, i_perm] = np.nanmax(np.fabs(perm_scores), axis=0)
-            scores_as_ranks_part += (
-                h0_fmax_part[:, i_perm].reshape((-1, 1))
-                < np.fabs(scores_original_data).T
+            h0_fmax_part[:, batch] = np.nanmax(
+                np.fabs(perm_scores_batch), axis=1
+            ).T
+            scores_as_ranks_part += _count_smaller(
+                h0_fmax_part[:, batch], np.fabs(scores_original_data).T
             )
         else:
             # Get maximum value for voxel-level FWE
-            h0_fmax_part[:, i_perm] = np.nanmax(perm_scores, axis=0)
-            scores_as_ranks_part += (
-                h0_fmax_part[:, i_perm].reshape((-1, 1))
-                < scores_original_data.T
+            h0_fmax_part[:, batch] = np.nanmax(perm_scores_batch, axis=1).T
+            scores_as_ranks_part += _count_smaller(
+                h0_fmax_part[:, batch], scores_original_data.T
             )
 
-        # Prepare data for cluster thresholding
-        if tfce or (threshold is not None):
-            arr4d = masker.inverse_transform(perm_scores.T).get_fdata()
-            bin_struct = generate_binary_structure(3, 1)
-
         if tfce:
+            # TFCE of all the maps of the batch at once.
             # The TFCE map will contain positive and negative values if
             # two_sided_test is True, or positive only if it's False.
             # In either case, the maximum absolute value is the one we want.
-            h0_tfce_part[:, i_perm] = np.nanmax(
-                np.fabs(
-                    calculate_tfce(
-                        arr4d,
-                        bin_struct=bin_struct,
-                        two_sided_test=two_sided_test,
-                    )
+            tfce_batch = calculate_tfce_on_graph(
+                perm_scores_batch.transpose(0, 2, 1).reshape(
+                    -1, n_descriptors
                 ),
-                axis=(0, 1, 2),
-            )
-            tfce_scores_as_ranks_part += h0_tfce_part[:, i_perm].reshape(
-                (-1, 1)
-            ) < np.fabs(tfce_original_data.T)
-
-        if threshold is not None:
-            (
-                h0_csfwe_part[:, i_perm],
-                h0_cmfwe_part[:, i_perm],
-            ) = calculate_cluster_measures(
-                arr4d,
-                threshold,
-                bin_struct,
+                tfce_edges,
                 two_sided_test=two_sided_test,
             )
+            h0_tfce_part[:, batch] = (
+                np.nanmax(np.fabs(tfce_batch), axis=1, initial=0)
+                .reshape(-1, n_regressors)
+                .T
+            )
 
-        step = 11 - min(verbose, 10)
-        if i_perm % step == 0:
-            # If there is only one job, progress information is fixed
-            crlf = "\n"
-            if n_perm == n_perm_chunk:
-                crlf = "\r"
-
-            percent = float(i_perm) / n_perm_chunk
-            percent = round(percent * 100, 2)
-            dt = time.time() - t0
-            remaining = (100.0 - percent) / max(0.01, percent) * dt
-
-            logger.log(
-                f"Job #{thread_id}, processed {i_perm}/{n_perm_chunk} "
-                f"permutations ({percent:0.2f}%, {readable_time(remaining)} "
-                f"remaining){crlf}",
-                verbose=verbose,
+        for i_perm, perm_scores in enumerate(
+            perm_scores_batch, start=batch.start
+        ):
+            if threshold is not None:
+                # Prepare data for cluster thresholding
+                arr4d = masker.inverse_transform(perm_scores.T).get_fdata()
+                (
+                    h0_csfwe_part[:, i_perm],
+                    h0_cmfwe_part[:, i_perm],
+                ) = calculate_cluster_measures(
+                    arr4d,
+                    threshold,
+                    bin_struct,
+                    two_sided_test=two_sided_test,
+                )
+
+            if i_perm % step == 0:
+                # If there is only one job, progress information is fixed
+                crlf = "\n"
+                if n_perm == n_perm_chunk:
+                    crlf = "\r"
+
+                percent = float(i_perm) / n_perm_chunk
+                percent = round(percent * 100, 2)
+                dt = time.time() - t0
+                remaining = (100.0 - percent) / max(0.01, percent) * dt
+
+                logger.log(
+                    f"Job #{thread_id}, processed {i_perm}/{n_perm_chunk} "
+                    f"permutations ({percent:0.2f}%, "
+                    f"{readable_time(remaining)} remaining){crlf}",
+                    verbose=verbose,
+                )
+
+        if tfce:
+            tfce_scores_as_ranks_part += _count_smaller(
+                h0_tfce_part[:, batch], np.fabs(tfce_original_data.T)
             )
 
     return (
@@ -294,6 +330,167 @@ def _permuted_ols_on_chunk(
     )
 
 
+# Memory budget, in bytes, of the products between the data
+# and the permuted designs computed at once by each job.
+_PERMUTATION_BATCH_BYTES = 2**26
+
+
+def _permutation_batch_size(n_samples, n_descriptors, n_columns):
+    """Return the number of permutations to compute at once.
+
+    The batch is as large as possible while the permuted designs
+    and their products with the data fit in _PERMUTATION_BATCH_BYTES.
+    """
+    bytes_per_perm = 8 * n_columns * (n_samples + 2 * n_descriptors)
+    return max(1, _PERMUTATION_BATCH_BYTES // bytes_per_perm)
+
+
+# Number of permutations performed by each job
+# in each round when permutations can stop early.
+_N_PERM_ROUND = 100
+
+# Quantile of the normal distribution
+# for the 99% confidence interval of p-values in early stopping.
+_EARLY_STOPPING_Z = stats.norm.isf(0.005)
+
+
+def _split_permutations(n_perm, n_jobs):
+    """Split permutations in chunks, one per parallel job."""
+    if n_perm > n_jobs:
+        n_perm_chunks = np.asarray([n_perm / n_jobs] * n_jobs, dtype=int)
+        n_perm_chunks[-1] += n_perm % n_jobs
+    else:
+        n_perm_chunks = np.ones(n_perm, dtype=int)
+    return n_perm_chunks
+
+
+def _early_stopping_statistics(
+    scores_as_ranks, n_perm, early_stopping_alpha, early_stopping_tol
+):
+    """Compute Monte-Carlo statistics of the p-values \
+    and whether permutations can stop.
+
+    Parameters
+    ----------
+    scores_as_ranks : numpy.ndarray, shape=(n_regressors, n_descriptors)
+        The ranks of the original scores in the null distribution.
+
+    n_perm : :obj:`int`
+        Number of permutations performed so far.
+
+    early_stopping_alpha : :obj:`float` or None
+        Significance level.
+
+    early_stopping_tol : :obj:`float` or None
+        Tolerance on the standard error of the p-values.
+
+    Returns
+    -------
+    stop : :obj:`bool`
+        Whether the permutations can stop.
+
+    statistics : :obj:`dict`
+        Statistics passed to the callback.
+    """
+    pvals = (n_perm + 1 - scores_as_ranks) / float(1 + n_perm)
+    standard_error = np.sqrt(pvals * (1 - pvals) / (n_perm + 1))
+
+    stop = False
+    n_undecided = None
+    if early_stopping_alpha is not None:
+        n_undecided = int(
+            np.sum(
+                np.abs(pvals - early_stopping_alpha)
+                <= _EARLY_STOPPING_Z * standard_error
+            )
+        )
+        stop = n_undecided == 0
+    if early_stopping_tol is not None:
+        stop = stop or bool(np.max(standard_error) < early_stopping_tol)
+
+    statistics = {
+        "n_perm": n_perm,
+        "pvals": pvals,
+        "standard_error": standard_error,
+        "n_undecided": n_undecided,
+    }
+    return stop, statistics
+
+
+def _stop_permutations(
+    scores_as_ranks,
+    tfce_scores_as_ranks,
+    n_perm_done,
+    n_perm,
+    early_stopping_alpha,
+    early_stopping_tol,
+    callback,
+    elapsed_time,
+    verbose,
+):
+    """Decide after a round of permutations whether to stop.
+
+    When TFCE is computed, its p-values must be decided too.
+    """
+    stop, statistics = _early_stopping_statistics(
+        scores_as_ranks, n_perm_done, early_stopping_alpha, early_stopping_tol
+    )
+    if tfce_scores_as_ranks is not None:
+        tfce_stop, tfce_statistics = _early_stopping_statistics(
+            tfce_scores_as_ranks,
+            n_perm_done,
+            early_stopping_alpha,
+            early_stopping_tol,
+        )
+        stop = stop and tfce_stop
+        for key in ["pvals", "standard_error", "n_undecided"]:
+            statistics[f"tfce_{key}"] = tfce_statistics[key]
+    statistics["elapsed_time"] = elapsed_time
+    if callback is not None and callback(statistics):
+        stop = True
+    if stop and n_perm_done < n_perm:
+        logger.log(
+            f"Stopped after {n_perm_done}/{n_perm} permutations.",
+            verbose=verbose,
+        )
+    return stop
+
+
+def _tfce_edges(masker, bin_struct):
+    """Return the pairs of neighboring descriptors of a fitted masker."""
+    if isinstance(masker.mask_img_, SurfaceImage):
+        return mesh_edges(masker.mask_img_)
+    return grid_edges(
+        image.get_data(masker.mask_img_).astype(bool), bin_struct
+    )
+
+
+def _count_smaller(h0, scores):
+    """Count, for each score, the values of the null distribution \
+    that are strictly smaller.
+
+    Parameters
+    ----------
+    h0 : numpy.ndarray, shape=(n_regressors, n_perm)
+        Null distribution of each regressor.
+
+    scores : numpy.ndarray, shape=(n_regressors, n_descriptors)
+        Scores to rank.
+
+    Returns
+    -------
+    counts : numpy.ndarray, shape=(n_regressors, n_descriptors)
+    """
+    counts = np.zeros(scores.shape)
+    for i_regressor, (h0_, scores_) in enumerate(zip(h0, scores, strict=True)):
+        counts[i_regressor] = np.searchsorted(
+            np.sort(h0_), scores_, side="left"
+        )
+    # nan never compares smaller than anything
+    counts[np.isnan(scores)] = 0
+    return counts
+
+
 @fill_doc
 def permuted_ols(
     tested_vars,
@@ -309,6 +506,9 @@ def permuted_ols(
     tfce=False,
     threshold=None,
     output_type="dict",
+    early_stopping_alpha=None,
+    early_stopping_tol=None,
+    callback=None,
 ):
     """Massively univariate group analysis with permuted OLS.
 
@@ -334,6 +534,9 @@ def permuted_ols(
     Each of them performs a fraction of permutations on the whole dataset.
     Thus, the max t-score amongst data descriptors can be computed directly,
     which avoids storing all the computed t-scores.
+    Within each unit, permutations are processed by batches:
+    the permuted designs of a batch are stacked
+    so that their t-scores are obtained with a single matrix product.
 
     The variates should be given C-contiguous.
     ``target_vars`` are fortran-ordered automatically to speed-up computations.
@@ -379,10 +582,13 @@ def permuted_ols(
     %(verbose0)s
 
     masker : None or :class:`~nilearn.maskers.NiftiMasker` or \
-            :class:`~nilearn.maskers.MultiNiftiMasker`, default=None
+            :class:`~nilearn.maskers.MultiNiftiMasker` or \
+            :class:`~nilearn.maskers.SurfaceMasker`, default=None
         A mask to be used on the data.
         This is required for cluster-level inference, so it must be provided
         if ``threshold`` is not None.
+        With a :class:`~nilearn.maskers.SurfaceMasker`,
+        :term:`TFCE` clusters are defined by the edges of the mesh.
 
         .. nilearn_versionadded:: 0.9.2
 
@@ -421,6 +627,12 @@ def permuted_ols(
 
             The default was changed to ``'dict'``.
 
+    %(early_stopping_alpha)s
+
+    %(early_stopping_tol)s
+
+    %(callback_permutations)s
+
     Returns
     -------
     pvals : array-like, shape=(n_regressors, n_descriptors)
@@ -457,6 +669,8 @@ def permuted_ols(
     h0_fmax : array-like, shape=(n_regressors, n_perm)
         Distribution of the (max) t-statistic under the null hypothesis
         (obtained from the permutations). Array is sorted.
+        If the permutations stopped early,
+        ``n_perm`` is the number of permutations actually performed.
 
         .. note::
 
@@ -583,6 +797,7 @@ def permuted_ols(
     """
     check_params(locals())
     _check_inputs_permuted_ols(n_jobs, tfce, masker, threshold, target_vars)
+    _check_early_stopping(early_stopping_alpha, early_stopping_tol, threshold)
 
     n_jobs, output_type, target_vars, tested_vars = (
         _sanitize_inputs_permuted_ols(
@@ -709,23 +924,13 @@ def permuted_ols(
     # Define connectivity for TFCE and/or cluster measures
     bin_struct = generate_binary_structure(3, 1)
 
-    tfce_original_data = None
+    tfce_original_data, tfce_edges = None, None
     if tfce:
-        scores_4d = masker.inverse_transform(
-            scores_original_data.T
-        ).get_fdata()
-        tfce_original_data = calculate_tfce(
-            scores_4d,
-            bin_struct=bin_struct,
+        tfce_edges = _tfce_edges(masker, bin_struct)
+        tfce_original_data = calculate_tfce_on_graph(
+            scores_original_data.T,
+            tfce_edges,
             two_sided_test=two_sided_test,
-        )
-        tfce_original_data = apply_mask(
-            Nifti1Image(
-                tfce_original_data,
-                masker.mask_img_.affine,
-                masker.mask_img_.header,
-            ),
-            masker.mask_img_,
         ).T
 
     # 0 or negative number of permutations => original data scores only
@@ -740,10 +945,7 @@ def permuted_ols(
 
     # Permutations
     # parallel computing units perform a reduced number of permutations each
-    if n_perm > n_jobs:
-        n_perm_chunks = np.asarray([n_perm / n_jobs] * n_jobs, dtype=int)
-        n_perm_chunks[-1] += n_perm % n_jobs
-    else:
+    if n_perm <= n_jobs:
         warnings.warn(
             f"The specified number of permutations is {n_perm} "
             "and the number of jobs to be performed in parallel "
@@ -754,38 +956,80 @@ def permuted_ols(
             UserWarning,
             stacklevel=find_stack_level(),
         )
-        n_perm_chunks = np.ones(n_perm, dtype=int)
 
     threshold_t = _compute_t_stat_threshold(
         threshold, two_sided_test, tested_vars, confounding_vars
     )
 
-    # actual permutations, seeded from a random integer between 0 and maximum
-    # value represented by np.int32 (to have a large entropy).
-    ret = joblib.Parallel(n_jobs=n_jobs, verbose=verbose)(
-        joblib.delayed(_permuted_ols_on_chunk)(
-            scores_original_data,
-            testedvars_resid_covars,
-            targetvars_resid_covars.T,
-            thread_id=thread_id + 1,
-            threshold=threshold_t,
-            confounding_vars=covars_orthonormalized,
-            masker=masker,
-            n_perm=n_perm,
-            n_perm_chunk=n_perm_chunk,
-            intercept_test=intercept_test,
-            two_sided_test=two_sided_test,
-            tfce=tfce,
-            tfce_original_data=tfce_original_data,
-            random_state=rng.randint(1, np.iinfo(np.int32).max - 1),
-            verbose=verbose,
-        )
-        for thread_id, n_perm_chunk in enumerate(n_perm_chunks)
+    # Without early stopping nor callback,
+    # all permutations are performed in a single round.
+    by_rounds = (
+        early_stopping_alpha is not None
+        or early_stopping_tol is not None
+        or callback is not None
+    )
+    n_perm_round = _N_PERM_ROUND * n_jobs if by_rounds else n_perm
+
+    t0 = time.time()
+    ret = []
+    n_perm_done = 0
+    vfwe_scores_as_ranks = np.zeros((n_regressors, n_descriptors))
+    tfce_scores_as_ranks = (
+        np.zeros((n_regressors, n_descriptors)) if tfce else None
     )
+    while n_perm_done < n_perm:
+        n_perm_chunks = _split_permutations(
+            min(n_perm_round, n_perm - n_perm_done), n_jobs
+        )
+
+        # actual permutations, seeded from a random integer between 0 and
+        # maximum value represented by np.int32 (to have a large entropy).
+        ret_round = joblib.Parallel(n_jobs=n_jobs, verbose=verbose)(
+            joblib.delayed(_permuted_ols_on_chunk)(
+                scores_original_data,
+                testedvars_resid_covars,
+                targetvars_resid_covars.T,
+                thread_id=thread_id + 1,
+                threshold=threshold_t,
+                confounding_vars=covars_orthonormalized,
+                masker=masker,
+                n_perm=n_perm,
+                n_perm_chunk=n_perm_chunk,
+                intercept_test=intercept_test,
+                two_sided_test=two_sided_test,
+                tfce=tfce,
+                tfce_original_data=tfce_original_data,
+                tfce_edges=tfce_edges,
+                random_state=rng.randint(1, np.iinfo(np.int32).max - 1),
+                verbose=verbose,
+            )
+            for thread_id, n_perm_chunk in enumerate(n_perm_chunks)
+        )
+        ret.extend(ret_round)
+        n_perm_done += int(np.sum(n_perm_chunks))
+        for scores_as_ranks_part, *_, tfce_part, _ in ret_round:
+            vfwe_scores_as_ranks += scores_as_ranks_part
+            if tfce:
+                tfce_scores_as_ranks += tfce_part
+
+        if not by_rounds or _stop_permutations(
+            vfwe_scores_as_ranks,
+            tfce_scores_as_ranks,
+            n_perm_done,
+            n_perm,
+            early_stopping_alpha,
+            early_stopping_tol,
+            callback,
+            time.time() - t0,
+            verbose,
+        ):
+            break
+
+    n_perm = n_perm_done
 
     # reduce results
     (
-        vfwe_scores_as_ranks_parts,
+        _,
         h0_vfwe_parts,
         csfwe_h0_parts,
         cmfwe_h0_parts,
@@ -795,10 +1039,6 @@ def permuted_ols(
 
     # Voxel-level FWE
     vfwe_h0 = np.hstack(h0_vfwe_parts)
-    vfwe_scores_as_ranks = np.zeros((n_regressors, n_descriptors))
-    for scores_as_ranks_part in vfwe_scores_as_ranks_parts:
-        vfwe_scores_as_ranks += scores_as_ranks_part
-
     vfwe_pvals = (n_perm + 1 - vfwe_scores_as_ranks) / float(1 + n_perm)
 
     if output_type == "legacy":
@@ -896,6 +1136,31 @@ def _check_inputs_permuted_ols(
         )
 
 
+def _check_early_stopping(
+    early_stopping_alpha, early_stopping_tol, threshold
+) -> None:
+    if threshold is not None and (
+        early_stopping_alpha is not None or early_stopping_tol is not None
+    ):
+        # The cluster-level p-values are only known once
+        # all the permutations are done.
+        raise ValueError(
+            "Early stopping cannot be used with cluster-level inference. "
+            "Set 'threshold' to None or 'early_stopping_alpha' "
+            "and 'early_stopping_tol' to None."
+        )
+    if early_stopping_alpha is not None and not 0 < early_stopping_alpha < 1:
+        raise ValueError(
+            "'early_stopping_alpha' must be between 0 and 1. "
+            f"Got {early_stopping_alpha}."
+        )
+    if early_stopping_tol is not None and early_stopping_tol <= 0:
+        raise ValueError(
+            "'early_stopping_tol' must be strictly positive. "
+            f"Got {early_stopping_tol}."
+        )
+
+
 def _sanitize_inputs_permuted_ols(
     n_jobs, output_type, tfce, threshold, target_vars, tested_vars
 ):
@@ -13,8 +13,8 @@ from numpy.testing import (
 from scipy import stats
 
 from nilearn.conftest import _rng
-from nilearn.maskers import NiftiMasker
-from nilearn.mass_univariate import permuted_ols
+from nilearn.maskers import NiftiMasker, SurfaceMasker
+from nilearn.mass_univariate import permuted_least_squares, permuted_ols
 from nilearn.mass_univariate.permuted_least_squares import (
     _sanitize_inputs_permuted_ols,
 )
@@ -542,6 +542,173 @@ def test_permuted_ols_intercept_statsmodels_withcovar(
     assert output_intercept["t"].shape == (n_regressors, n_descriptors)
 
 
+@pytest.mark.parametrize("intercept_test", [True, False])
+def test_permuted_ols_batch_size(
+    rng, confounding_vars, intercept_test, monkeypatch
+):
+    """Check that batching the permutations does not change the results."""
+    target_var = rng.standard_normal((N_SAMPLES, 20))
+    tested_var = rng.standard_normal((N_SAMPLES, 1))
+    if intercept_test:
+        tested_var = np.ones((N_SAMPLES, 1))
+
+    outputs = []
+    for batch_bytes in [1, 10**8]:
+        # from one permutation at a time to all permutations at once
+        monkeypatch.setattr(
+            permuted_least_squares, "_PERMUTATION_BATCH_BYTES", batch_bytes
+        )
+        outputs.append(
+            permuted_ols(
+                tested_var,
+                target_var,
+                confounding_vars,
+                n_perm=N_PERM,
+                random_state=0,
+            )
+        )
+
+    for key in ["t", "logp_max_t", "h0_max_t"]:
+        assert_array_almost_equal(outputs[0][key], outputs[1][key])
+
+
+def test_permuted_ols_early_stopping_alpha(rng, monkeypatch):
+    """Check permutations stop once all p-values are decided."""
+    monkeypatch.setattr(permuted_least_squares, "_N_PERM_ROUND", 20)
+    tested_var = rng.standard_normal((N_SAMPLES, 1))
+    target_var = rng.standard_normal((N_SAMPLES, 5))
+    # strong effect in the first descriptor
+    target_var[:, 0] += 10 * tested_var[:, 0]
+
+    statistics = []
+    output = permuted_ols(
+        tested_var,
+        target_var,
+        n_perm=10000,
+        random_state=0,
+        early_stopping_alpha=0.5,
+        callback=statistics.append,
+    )
+
+    n_perm = output["h0_max_t"].shape[1]
+    assert n_perm < 10000
+    assert n_perm % 20 == 0
+    assert [stats["n_perm"] for stats in statistics] == list(
+        range(20, n_perm + 1, 20)
+    )
+    assert statistics[-1]["n_undecided"] == 0
+    assert statistics[-1]["pvals"].shape == (1, 5)
+    assert_array_almost_equal(
+        output["logp_max_t"], -np.log10(statistics[-1]["pvals"])
+    )
+
+
+def test_permuted_ols_early_stopping_tol(rng, monkeypatch):
+    """Check permutations stop once the standard error is small enough."""
+    monkeypatch.setattr(permuted_least_squares, "_N_PERM_ROUND", 20)
+    tested_var = rng.standard_normal((N_SAMPLES, 1))
+    target_var = rng.standard_normal((N_SAMPLES, 5))
+
+    statistics = []
+    output = permuted_ols(
+        tested_var,
+        target_var,
+        n_perm=1000,
+        random_state=0,
+        early_stopping_tol=0.05,
+        callback=statistics.append,
+    )
+
+    assert output["h0_max_t"].shape[1] < 1000
+    assert np.max(statistics[-1]["standard_error"]) < 0.05
+    assert np.max(statistics[-2]["standard_error"]) >= 0.05
+    assert statistics[-1]["n_undecided"] is None
+
+
+def test_permuted_ols_early_stopping_tfce(monkeypatch):
+    """Check that TFCE p-values must be decided to stop permutations."""
+    monkeypatch.setattr(permuted_least_squares, "_N_PERM_ROUND", 20)
+    target_var, tested_var, masker, *_ = _tfce_design()
+
+    statistics = []
+    output = permuted_ols(
+        tested_var,
+        target_var,
+        model_intercept=False,
+        two_sided_test=False,
+        n_perm=200,
+        random_state=0,
+        masker=masker,
+        tfce=True,
+        early_stopping_tol=0.05,
+        callback=statistics.append,
+    )
+
+    last = statistics[-1]
+    assert np.max(last["standard_error"]) < 0.05
+    assert np.max(last["tfce_standard_error"]) < 0.05
+    assert last["tfce_pvals"].shape == last["pvals"].shape
+    assert_array_almost_equal(
+        output["logp_max_tfce"], -np.log10(last["tfce_pvals"])
+    )
+    for stats_round in statistics[:-1]:
+        assert (
+            np.max(stats_round["standard_error"]) >= 0.05
+            or np.max(stats_round["tfce_standard_error"]) >= 0.05
+        )
+
+
+def test_permuted_ols_callback_stops(rng, monkeypatch):
+    """Check that permutations stop when the callback returns True."""
+    monkeypatch.setattr(permuted_least_squares, "_N_PERM_ROUND", 5)
+    tested_var = rng.standard_normal((N_SAMPLES, 1))
+    target_var = rng.standard_normal((N_SAMPLES, 5))
+
+    output = permuted_ols(
+        tested_var,
+        target_var,
+        n_perm=100,
+        random_state=0,
+        callback=lambda stats: stats["n_perm"] >= 10,
+    )
+
+    assert output["h0_max_t"].shape == (1, 10)
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({"early_stopping_alpha": 0.0}, "must be between 0 and 1"),
+        ({"early_stopping_alpha": 1.5}, "must be between 0 and 1"),
+        ({"early_stopping_tol": 0.0}, "must be strictly positive"),
+    ],
+)
+def test_permuted_ols_early_stopping_error(dummy_design, kwargs, match):
+    """Check errors for invalid early stopping parameters."""
+    target_var, tested_var, *_ = dummy_design
+
+    with pytest.raises(ValueError, match=match):
+        permuted_ols(tested_var, target_var, n_perm=N_PERM, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"early_stopping_alpha": 0.05}, {"early_stopping_tol": 0.01}]
+)
+def test_permuted_ols_early_stopping_cluster_error(kwargs):
+    """Check that early stopping is not used with cluster-level inference."""
+    target_var, tested_var, masker, *_ = _tfce_design()
+
+    with pytest.raises(ValueError, match="cluster-level inference"):
+        permuted_ols(
+            tested_var,
+            target_var,
+            n_perm=N_PERM,
+            masker=masker,
+            threshold=0.001,
+            **kwargs,
+        )
+
+
 def test_one_sided_versus_two_test(rng):
     """Check that a positive effect is always better \
     recovered with one-sided.
@@ -693,6 +860,48 @@ def test_tfce_smoke_legacy_smoke():
     assert out["h0_max_tfce"].size == n_perm
 
 
+def test_tfce_surface_masker(rng, surf_mask_1d):
+    """Check that TFCE clusters follow the mesh with a SurfaceMasker."""
+    masker = SurfaceMasker(surf_mask_1d).fit()
+    n_descriptors = int(
+        sum(part.sum() for part in surf_mask_1d.data.parts.values())
+    )
+    tested_var = np.arange(0, 20, 2)
+    # positive effect on all vertices
+    target_var = tested_var[:, np.newaxis] + 10 * rng.random(
+        (10, n_descriptors)
+    )
+
+    out = permuted_ols(
+        tested_var,
+        target_var,
+        model_intercept=False,
+        n_perm=N_PERM,
+        random_state=0,
+        masker=masker,
+        tfce=True,
+    )
+
+    assert out["tfce"].shape == (1, n_descriptors)
+    assert out["h0_max_tfce"].shape == (1, N_PERM)
+    assert np.all(out["tfce"] > 0)
+
+    # clusters follow the mesh:
+    # without edges, each vertex would be its own cluster
+    edges = permuted_least_squares._tfce_edges(masker, None)
+    values = out["t"]
+    assert_array_almost_equal(
+        out["tfce"],
+        permuted_least_squares.calculate_tfce_on_graph(values, edges),
+    )
+    assert not np.allclose(
+        out["tfce"],
+        permuted_least_squares.calculate_tfce_on_graph(
+            values, np.empty((2, 0))
+        ),
+    )
+
+
 @pytest.mark.slow
 def test_cluster_level_parameters_smoke(cluster_level_design, masker):
     """Test combinations of parameters related to cluster-level inference."""
@@ -5,7 +5,7 @@ import math
 import numpy as np
 import pytest
 from numpy.testing import assert_array_almost_equal
-from scipy.ndimage import generate_binary_structure
+from scipy.ndimage import generate_binary_structure, label
 
 from nilearn.conftest import _rng
 from nilearn.mass_univariate import _utils
@@ -64,6 +64,92 @@ def test_calculate_tfce(two_sided_test, dh, true_max_tfce):
     assert np.max(np.abs(test_tfce_arr4d)) == true_max_tfce
 
 
+def _naive_tfce(arr3d, bin_struct, score_threshs, sign):
+    """Compute TFCE values by labeling clusters at each threshold."""
+    tfce = np.zeros(arr3d.shape)
+    temp_arr3d = arr3d * sign
+    for score_thresh in score_threshs:
+        temp_arr3d[temp_arr3d < score_thresh] = 0
+        labeled_arr3d, _ = label(temp_arr3d, bin_struct)
+        cluster_counts = np.bincount(labeled_arr3d.ravel())
+        cluster_counts[0] = 0
+        tfce += sign * cluster_counts[labeled_arr3d] ** 0.5 * score_thresh**2
+    return tfce
+
+
+@pytest.mark.parametrize("two_sided_test", [True, False])
+@pytest.mark.parametrize("connectivity", [1, 3])
+def test_calculate_tfce_matches_labeling(rng, two_sided_test, connectivity):
+    """Check TFCE values against a labeling of clusters at each threshold."""
+    arr3d = rng.normal(size=(8, 9, 10))
+    arr3d[rng.random(arr3d.shape) < 0.2] = 0
+    bin_struct = generate_binary_structure(3, connectivity)
+
+    tfce = _utils.calculate_tfce(
+        arr3d[..., np.newaxis],
+        bin_struct=bin_struct,
+        two_sided_test=two_sided_test,
+    )
+
+    score_threshs = _utils._return_score_threshs(arr3d, "auto", two_sided_test)
+    signs = [-1, 1] if two_sided_test else [1]
+    expected = sum(
+        _naive_tfce(arr3d, bin_struct, score_threshs, sign) for sign in signs
+    )
+    assert_array_almost_equal(tfce[..., 0], expected)
+
+
+def test_calculate_tfce_on_graph_batches(rng, monkeypatch):
+    """Check that processing maps in several batches gives the same values."""
+    values = rng.normal(size=(5, 30))
+    # a chain of nodes
+    edges = np.stack((np.arange(29), np.arange(1, 30)))
+
+    tfce = _utils.calculate_tfce_on_graph(values, edges)
+
+    monkeypatch.setattr(_utils, "_TFCE_BATCH_EDGES", 1)
+    assert_array_almost_equal(
+        _utils.calculate_tfce_on_graph(values, edges), tfce
+    )
+    for map_, tfce_map in zip(values, tfce, strict=True):
+        assert_array_almost_equal(
+            _utils.calculate_tfce_on_graph(map_, edges)[0], tfce_map
+        )
+
+
+def test_grid_edges():
+    """Check the pairs of neighbors of a 2D mask."""
+    mask = np.array([[1, 1, 0], [1, 1, 1]], dtype=bool)
+
+    edges = _utils.grid_edges(mask, generate_binary_structure(2, 1))
+
+    assert edges.shape == (2, 5)
+    assert {tuple(sorted(pair)) for pair in edges.T} == {
+        (0, 1),
+        (0, 2),
+        (1, 3),
+        (2, 3),
+        (3, 4),
+    }
+
+    edges = _utils.grid_edges(mask, generate_binary_structure(2, 2))
+
+    assert edges.shape == (2, 8)
+
+
+def test_mesh_edges(surf_mask_1d):
+    """Check that edges only join vertices of the mask within a part."""
+    edges = _utils.mesh_edges(surf_mask_1d)
+
+    n_left = int(surf_mask_1d.data.parts["left"].sum())
+    n_vertices = n_left + int(surf_mask_1d.data.parts["right"].sum())
+    assert edges.shape[0] == 2
+    assert edges.size > 0
+    assert edges.min() >= 0
+    assert edges.max() < n_vertices
+    assert np.all((edges[0] < n_left) == (edges[1] < n_left))
+
+
 @pytest.mark.parametrize(
     "test_values, expected_p_value", [(9, 0.95), (-9, 0.15), (0, 0.4)]
 )
@@ -269,6 +355,43 @@ def test_t_score_with_covars_and_normalized_design_withcovar(rng):
     assert_array_almost_equal(own_score, ref_score)
 
 
+@pytest.mark.parametrize("with_covars", [True, False])
+def test_batched_t_score_with_covars_and_normalized_design(rng, with_covars):
+    """Check batched t-scores match the t-scores of each design."""
+    n_batch, n_samples = 4, 50
+
+    target_vars = _utils.normalize_matrix_on_axis(
+        rng.standard_normal((n_samples, 7))
+    )
+    tested_vars = rng.standard_normal((n_batch, n_samples, 2))
+    tested_vars /= np.sqrt(np.sum(tested_vars**2, axis=1, keepdims=True))
+    covars = None
+    if with_covars:
+        covars = np.stack(
+            [
+                _utils.orthonormalize_matrix(
+                    rng.standard_normal((n_samples, 3))
+                )
+                for _ in range(n_batch)
+            ]
+        )
+
+    scores = _utils.batched_t_score_with_covars_and_normalized_design(
+        tested_vars, target_vars, covars
+    )
+
+    assert scores.shape == (n_batch, 7, 2)
+    for i in range(n_batch):
+        assert_array_almost_equal(
+            scores[i],
+            _utils.t_score_with_covars_and_normalized_design(
+                tested_vars[i],
+                target_vars,
+                None if covars is None else covars[i],
+            ),
+        )
+
+
 @pytest.mark.parametrize("two_sided_test", [True, False])
 @pytest.mark.parametrize(
     "dh",
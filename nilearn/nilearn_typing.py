@@ -34,6 +34,7 @@ Scalar: TypeAlias = NonNullScalar | None
 Annotate: TypeAlias = bool
 BgOnData: TypeAlias = bool
 BorderSize: TypeAlias = Integer
+ChunkSize: TypeAlias = Integer | None
 ColorBar: TypeAlias = bool
 ClusterThreshold: TypeAlias = Integer
 Connected: TypeAlias = bool
@@ -61,6 +62,8 @@ DisplayModeGlassBrain: TypeAlias = Literal[
     "lyrz",
 ]
 DrawCross: TypeAlias = bool
+EarlyStoppingAlpha: TypeAlias = float | np.floating | None
+EarlyStoppingTol: TypeAlias = float | np.floating | None
 ForceResample: TypeAlias = bool
 HeightControl: TypeAlias = Literal[None, "fpr", "fdr", "bonferroni"]
 # Note that for HrfModel
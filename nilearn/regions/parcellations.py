@@ -435,7 +435,7 @@ class Parcellations(_MultiPCA):
             verbose=verbose,
         )
 
-    def _raw_fit(self, data):
+    def _raw_fit(self, data, normalized=False):
         """Fits the parcellation method on this reduced data.
 
         Data are coming from a base decomposition estimator which computes
@@ -447,6 +447,10 @@ class Parcellations(_MultiPCA):
         data : :class:`numpy.ndarray`
             Shape (n_samples, n_features)
 
+        normalized : :obj:`bool`, default=False
+            Whether the data of each subject was already normalized
+            before being merged in the group data.
+
         Returns
         -------
         labels : :class:`numpy.ndarray`
@@ -471,7 +475,7 @@ class Parcellations(_MultiPCA):
         # we delay importing Ward or AgglomerativeClustering and same
         # time import plotting module before that.
 
-        components = _MultiPCA._raw_fit(self, data)
+        components = _MultiPCA._raw_fit(self, data, normalized=normalized)
 
         mask_img_ = self.masker_.mask_img_
 
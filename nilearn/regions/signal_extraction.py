@@ -6,12 +6,11 @@ or as weights in one image per region (maps).
 """
 
 import warnings
-from functools import partial
 
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from nibabel import Nifti1Image
-from scipy import linalg, ndimage
+from scipy import linalg, sparse
 
 from nilearn import masking
 from nilearn._utils.docs import fill_doc
@@ -223,6 +222,215 @@ def _get_labels_data(
     return labels, labels_data
 
 
+# Maximum number of values of the region data extracted at once
+# (64 MB in float64).
+_MAX_REGION_DATA_SIZE = 2**23
+
+
+class _LabelsIndex:
+    """Voxels of each region of a labels image, sorted by region.
+
+    The labels image is analyzed once,
+    so that signals of all regions can then be extracted from images
+    with a few vectorized reductions:
+    a sparse product with the region membership matrix
+    for the mean, sum, variance and standard deviation,
+    and reductions over contiguous segments for the other strategies.
+
+    Parameters
+    ----------
+    labels_img : Niimg-like object
+        See :ref:`extracting_data`.
+        Regions definition as labels.
+
+    mask_img : Niimg-like object, default=None
+        See :ref:`extracting_data`.
+        Mask to apply to labels before extracting signals.
+
+    background_label : number, default=0
+        Number representing background in labels_img.
+
+    keep_masked_labels : :obj:`bool`, default=False
+        Whether to keep the labels removed by the mask,
+        whose signals are then zero.
+    """
+
+    def __init__(
+        self,
+        labels_img,
+        mask_img=None,
+        background_label=0,
+        keep_masked_labels=False,
+    ):
+        self.labels_img = check_niimg_3d(labels_img)
+        self.labels, labels_data = _get_labels_data(
+            self.labels_img,
+            self.labels_img,
+            mask_img,
+            background_label,
+            keep_masked_labels=keep_masked_labels,
+        )
+        self.masked_atlas = Nifti1Image(
+            labels_data.astype(np.int8), self.labels_img.affine
+        )
+        self._sort_by_region(labels_data)
+
+    def _sort_by_region(self, labels_data):
+        """Sort the elements of labels_data that belong to self.labels."""
+        labels = np.asarray(self.labels)
+        voxels = np.nonzero(np.isin(labels_data, labels))
+        regions = np.searchsorted(labels, labels_data[voxels])
+        order = np.argsort(regions, kind="stable")
+        self.voxels = tuple(coordinates[order] for coordinates in voxels)
+        # region of each voxel
+        self.regions = regions[order]
+        self.counts = np.bincount(self.regions, minlength=labels.size)
+        self.starts = np.cumsum(self.counts) - self.counts
+        self.membership = sparse.csr_matrix(
+            (
+                np.ones(self.regions.size),
+                (self.regions, np.arange(self.regions.size)),
+            ),
+            shape=(labels.size, self.regions.size),
+        )
+
+    def extract(self, imgs, strategy="mean", order="F", n_jobs=1):
+        """Extract the signal of each region from 4D images.
+
+        Returns an array of shape (n_scans, n_regions),
+        with zero signals for regions that have no voxel.
+        Scans are processed by blocks to limit the memory used
+        by the data of the regions.
+        """
+        _check_shape_and_affine_compatibility(imgs, self.labels_img)
+        data = safe_get_data(imgs, ensure_finite=True)
+        target_datatype = (
+            np.float32 if data.dtype == np.float32 else np.float64
+        )
+
+        n_scans = data.shape[-1]
+        n_jobs = effective_n_jobs(n_jobs)
+        block_size = max(1, _MAX_REGION_DATA_SIZE // max(1, self.regions.size))
+        # at least one block per job
+        block_size = min(block_size, max(1, -(-n_scans // n_jobs)))
+        blocks = [
+            slice(start, min(start + block_size, n_scans))
+            for start in range(0, n_scans, block_size)
+        ]
+        if n_jobs == 1 or len(blocks) == 1:
+            signals = [
+                self._reduce(self._region_data(data, block), strategy)
+                for block in blocks
+            ]
+        else:
+            # Parallel reduction across samples. The data of the regions
+            # is extracted lazily, as the blocks are dispatched.
+            signals = Parallel(n_jobs=n_jobs)(
+                delayed(self._reduce)(self._region_data(data, block), strategy)
+                for block in blocks
+            )
+        signals = (
+            np.hstack(signals) if signals else np.empty((self.counts.size, 0))
+        )
+        return np.asarray(signals.T, dtype=target_datatype, order=order)
+
+    def _region_data(self, data, block):
+        """Return the data of the voxels of a block of scans in float64."""
+        return data[..., block][self.voxels].astype(np.float64, copy=False)
+
+    def _reduce(self, region_data, strategy):
+        """Reduce the data of the voxels of each region.
+
+        region_data is of shape (n_voxels, n_scans),
+        with voxels sorted by region,
+        and the result of shape (n_regions, n_scans).
+        """
+        counts = np.maximum(self.counts, 1)[:, np.newaxis]
+        if strategy in ("sum", "mean", "variance", "standard_deviation"):
+            sums = self.membership @ region_data
+            if strategy == "sum":
+                return sums
+            means = sums / counts
+            if strategy == "mean":
+                return means
+            centered = region_data - means[self.regions]
+            variances = (self.membership @ (centered * centered)) / counts
+            if strategy == "variance":
+                return variances
+            return np.sqrt(variances)
+
+        signals = np.zeros((self.counts.size, region_data.shape[1]))
+        non_empty = self.counts > 0
+        if strategy in ("minimum", "maximum"):
+            reduction = np.minimum if strategy == "minimum" else np.maximum
+            signals[non_empty] = reduction.reduceat(
+                region_data, self.starts[non_empty], axis=0
+            )
+            return signals
+
+        for region in np.flatnonzero(non_empty):
+            start = self.starts[region]
+            signals[region] = np.median(
+                region_data[start : start + self.counts[region]], axis=0
+            )
+        return signals
+
+
+class _SurfaceLabelsIndex(_LabelsIndex):
+    """Vertices of each region of a surface labels image, sorted by region.
+
+    Same as _LabelsIndex for a :obj:`~nilearn.surface.SurfaceImage`.
+    Vertices are numbered across all parts of the image,
+    but the data of each part is read separately,
+    so images are never concatenated across parts.
+
+    Parameters
+    ----------
+    labels_img : :obj:`~nilearn.surface.SurfaceImage`
+        Regions definition as labels, with 1D data for each part.
+
+    labels : :obj:`list`
+        Sorted labels of the regions to extract, without the background.
+    """
+
+    def __init__(self, labels_img, labels):
+        self.labels = list(labels)
+        parts = labels_img.data.parts
+        self._sort_by_region(
+            np.concatenate([np.ravel(part) for part in parts.values()])
+        )
+        vertices = self.voxels[0]
+        # for each part, position of its vertices in the sorted vertices
+        self.part_positions = {}
+        start = 0
+        for name, part in parts.items():
+            stop = start + part.shape[0]
+            positions = np.flatnonzero((vertices >= start) & (vertices < stop))
+            self.part_positions[name] = (
+                positions,
+                vertices[positions] - start,
+            )
+            start = stop
+
+    def extract(self, imgs, strategy="mean"):
+        """Extract the signal of each region from a 2D surface image.
+
+        Returns an array of shape (n_samples, n_regions).
+        Samples are processed by blocks to limit the memory used
+        by the data of the regions.
+        """
+        n_samples = imgs.shape[1]
+        signals = np.empty((n_samples, self.counts.size))
+        block_size = max(1, _MAX_REGION_DATA_SIZE // max(1, self.regions.size))
+        for start in range(0, n_samples, block_size):
+            block = slice(start, min(start + block_size, n_samples))
+            region_data = np.empty((self.regions.size, block.stop - start))
+            for name, (positions, vertices) in self.part_positions.items():
+                region_data[positions] = imgs.data.parts[name][vertices, block]
+            signals[block] = self._reduce(region_data, strategy).T
+        return signals
+
+
 # FIXME: naming scheme is not really satisfying. Any better idea appreciated.
 @fill_doc
 def img_to_signals_labels(
@@ -315,38 +523,20 @@ def img_to_signals_labels(
     # TODO: Make a special case for list of strings
     # (load one image at a time).
     imgs = check_niimg_4d(imgs)
-    labels, labels_data = _get_labels_data(
-        imgs,
+    _check_shape_and_affine_compatibility(imgs, labels_img)
+    labels_index = _LabelsIndex(
         labels_img,
         mask_img,
         background_label,
         keep_masked_labels=keep_masked_labels,
     )
-
-    data = safe_get_data(imgs, ensure_finite=True)
-    target_datatype = np.float32 if data.dtype == np.float32 else np.float64
-    # Nilearn issue: 2135, PR: 2195 for why this is necessary.
-    reduction_function = partial(
-        getattr(ndimage, strategy), labels=labels_data, index=labels
+    labels = labels_index.labels
+    signals = labels_index.extract(
+        imgs, strategy=strategy, order=order, n_jobs=n_jobs
     )
-    # Parallel reduction across samples
-    signals = Parallel(n_jobs=n_jobs)(
-        delayed(reduction_function)(img) for img in np.rollaxis(data, -1)
-    )
-    signals = np.asarray(signals, dtype=target_datatype, order=order)
-    # Set to zero signals for missing labels. Workaround for Scipy behavior
-    if keep_masked_labels:
-        missing_labels = set(labels) - set(np.unique(labels_data))
-        labels_index = {l: n for n, l in enumerate(labels)}
-        for this_label in missing_labels:
-            signals[:, labels_index[this_label]] = 0
 
     if return_masked_atlas:
-        # finding the new labels image
-        masked_atlas = Nifti1Image(
-            labels_data.astype(np.int8), labels_img.affine
-        )
-        return signals, labels, masked_atlas
+        return signals, labels, labels_index.masked_atlas
     else:
         # TODO (nilearn >= 0.15.0)
         warnings.warn(
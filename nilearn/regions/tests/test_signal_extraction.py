@@ -5,7 +5,8 @@ import warnings
 import numpy as np
 import pytest
 from nibabel import Nifti1Image
-from numpy.testing import assert_almost_equal, assert_equal
+from numpy.testing import assert_almost_equal, assert_array_equal, assert_equal
+from scipy import ndimage
 
 from nilearn._utils.data_gen import (
     generate_fake_fmri,
@@ -17,8 +18,10 @@ from nilearn._utils.testing import write_imgs_to_path
 from nilearn.conftest import _affine_eye, _shape_3d_default
 from nilearn.exceptions import DimensionError
 from nilearn.image import get_data
+from nilearn.regions import signal_extraction
 from nilearn.regions.signal_extraction import (
     _check_shape_and_affine_compatibility,
+    _LabelsIndex,
     _trim_maps,
     img_to_signals_labels,
     img_to_signals_maps,
@@ -815,3 +818,88 @@ def test_img_to_signals_labels_parallel_extraction(fmri_img, labeled_regions):
     )
     np.testing.assert_almost_equal(labels_signals, expected_labels_signals)
     assert np.allclose(labels_labels, expected_labels_labels)
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        "mean",
+        "median",
+        "sum",
+        "minimum",
+        "maximum",
+        "standard_deviation",
+        "variance",
+    ],
+)
+def test_labels_index_matches_ndimage(
+    fmri_img, labeled_regions, mask_img, strategy
+):
+    """Check the labels index against per region reductions of ndimage."""
+    labels_index = _LabelsIndex(
+        labeled_regions, mask_img, keep_masked_labels=False
+    )
+    data = get_data(fmri_img)
+    labels_data = get_data(labels_index.masked_atlas)
+
+    expected = np.array(
+        [
+            getattr(ndimage, strategy)(
+                data[..., t], labels=labels_data, index=labels_index.labels
+            )
+            for t in range(data.shape[-1])
+        ]
+    )
+
+    assert_array_equal(labels_index.extract(fmri_img, strategy), expected)
+    assert_array_equal(
+        labels_index.extract(fmri_img, strategy, n_jobs=2), expected
+    )
+
+
+@pytest.mark.parametrize("strategy", ["mean", "median", "maximum", "variance"])
+def test_labels_index_blocks(
+    monkeypatch, fmri_img, labeled_regions, mask_img, strategy
+):
+    """Check that extracting scans by blocks gives the same signals."""
+    labels_index = _LabelsIndex(
+        labeled_regions, mask_img, keep_masked_labels=False
+    )
+    expected = labels_index.extract(fmri_img, strategy)
+
+    # blocks of 2 scans
+    monkeypatch.setattr(
+        signal_extraction,
+        "_MAX_REGION_DATA_SIZE",
+        2 * labels_index.regions.size,
+    )
+
+    assert_array_equal(labels_index.extract(fmri_img, strategy), expected)
+    assert_array_equal(
+        labels_index.extract(fmri_img, strategy, n_jobs=2), expected
+    )
+
+
+def test_labels_index_empty_region(fmri_img, labeled_regions):
+    """Check that regions removed by the mask have zero signals."""
+    labels_data = get_data(labeled_regions)
+    mask_img = Nifti1Image(
+        (labels_data != 1).astype(np.int8), labeled_regions.affine
+    )
+    with pytest.warns(FutureWarning, match="keep_masked_labels"):
+        labels_index = _LabelsIndex(
+            labeled_regions, mask_img, keep_masked_labels=True
+        )
+
+    with pytest.warns(UserWarning, match="removed"):
+        expected_index = _LabelsIndex(labeled_regions, mask_img)
+
+    region = labels_index.labels.index(1)
+    assert labels_index.counts[region] == 0
+    for strategy in ["mean", "median", "maximum", "variance"]:
+        signals = labels_index.extract(fmri_img, strategy)
+        assert_array_equal(signals[:, region], 0)
+        assert_array_equal(
+            np.delete(signals, region, axis=1),
+            expected_index.extract(fmri_img, strategy),
+        )
@@ -7,10 +7,11 @@ features
 
 import warnings
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import Literal
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from scipy import linalg
 from scipy import signal as sp_signal
 from scipy.interpolate import CubicSpline
@@ -96,18 +97,20 @@ def standardize_signal(
         return signals
 
     # Standardize
+    # Means and standard deviations are accumulated in double precision,
+    # which matters for single precision signals with a large mean.
     if standardize == "zscore_sample":
         if not detrend:
             # remove mean if not already detrended
-            signals = signals - signals.mean(axis=0)
+            signals = signals - _mean_signals(signals)
 
-        std = signals.std(axis=0, ddof=1)
+        std = signals.std(axis=0, ddof=1, dtype=np.float64)
         # avoid numerical problems
         std[std < np.finfo(np.float64).eps] = 1.0
         signals /= std
 
     elif standardize == "psc":
-        mean_signals = signals.mean(axis=0)
+        mean_signals = _mean_signals(signals)
         invalid_ix = np.absolute(mean_signals) < np.finfo(np.float64).eps
         signals = (signals - mean_signals) / np.absolute(mean_signals)
         signals *= 100
@@ -124,6 +127,15 @@ def standardize_signal(
     return signals
 
 
+def _mean_signals(signals):
+    """Compute the mean of each signal in double precision \
+    and return it in the data type of the signals.
+    """
+    return signals.mean(axis=0, dtype=np.float64).astype(
+        signals.dtype, copy=False
+    )
+
+
 def _mean_of_squares(signals, n_batches=20):
     """Compute mean of squares for each signal.
 
@@ -213,7 +225,12 @@ def row_sum_of_squares(signals, n_batches=20):
     return var
 
 
-def _detrend(signals, inplace=False, type="linear", n_batches=10):
+# Default number of batches of features of signal computations,
+# that limit their memory usage.
+_N_BATCHES = 10
+
+
+def _detrend(signals, inplace=False, type="linear", n_batches=_N_BATCHES):
     """Detrend columns of input array.
 
     Signals are supposed to be columns of `signals`.
@@ -259,7 +276,7 @@ def _detrend(signals, inplace=False, type="linear", n_batches=10):
         )
         return signals
 
-    signals -= np.mean(signals, axis=0)
+    signals -= _mean_signals(signals)
     if type == "linear":
         # Keeping "signals" dtype avoids some type conversion further down,
         # and can save a lot of memory if dtype is single-precision.
@@ -318,6 +335,63 @@ def _check_wn(btype, freq, nyq):
     return freq
 
 
+def _butterworth_sos(sampling_rate, low_pass, high_pass, order=5):
+    """Design the Butterworth filter as second-order sections.
+
+    Returns None if no filtering must be done.
+    """
+    if low_pass is None and high_pass is None:
+        return None
+
+    if (
+        low_pass is not None
+        and high_pass is not None
+        and high_pass >= low_pass
+    ):
+        raise ValueError(
+            f"High pass cutoff frequency ({high_pass}) is greater than or "
+            f"equal to low pass filter frequency ({low_pass}). "
+            "This case is not handled by this function."
+        )
+
+    nyq = sampling_rate * 0.5
+
+    critical_freq = []
+    if high_pass is not None:
+        btype = "high"
+        critical_freq.append(_check_wn(btype, high_pass, nyq))
+
+    if low_pass is not None:
+        btype = "low"
+        critical_freq.append(_check_wn(btype, low_pass, nyq))
+
+    if len(critical_freq) == 2:
+        btype = "band"
+        # Inappropriate parameter input might lead to coercion of both
+        # elements of critical_freq to a value just below Nyquist.
+        # Scipy fix now enforces that critical frequencies cannot be equal.
+        # See https://github.com/scipy/scipy/pull/15886.
+        # If this is the case, we return the signals unfiltered.
+        if critical_freq[0] == critical_freq[1]:
+            warnings.warn(
+                "Signals are returned unfiltered because band-pass critical "
+                "frequencies are equal. Please check that inputs for "
+                "sampling_rate, low_pass, and high_pass are valid.",
+                stacklevel=find_stack_level(),
+            )
+            return None
+    else:
+        critical_freq = critical_freq[0]
+
+    return sp_signal.butter(
+        N=order,
+        Wn=critical_freq,
+        btype=btype,
+        output="sos",
+        fs=sampling_rate,
+    )
+
+
 @fill_doc
 def butterworth(
     signals,
@@ -374,56 +448,10 @@ def butterworth(
         Signals filtered according to the given parameters.
     """
     check_params(locals())
-    if low_pass is None and high_pass is None:
+    sos = _butterworth_sos(sampling_rate, low_pass, high_pass, order)
+    if sos is None:
         return signals.copy() if copy else signals
 
-    if (
-        low_pass is not None
-        and high_pass is not None
-        and high_pass >= low_pass
-    ):
-        raise ValueError(
-            f"High pass cutoff frequency ({high_pass}) is greater than or "
-            f"equal to low pass filter frequency ({low_pass}). "
-            "This case is not handled by this function."
-        )
-
-    nyq = sampling_rate * 0.5
-
-    critical_freq = []
-    if high_pass is not None:
-        btype = "high"
-        critical_freq.append(_check_wn(btype, high_pass, nyq))
-
-    if low_pass is not None:
-        btype = "low"
-        critical_freq.append(_check_wn(btype, low_pass, nyq))
-
-    if len(critical_freq) == 2:
-        btype = "band"
-        # Inappropriate parameter input might lead to coercion of both
-        # elements of critical_freq to a value just below Nyquist.
-        # Scipy fix now enforces that critical frequencies cannot be equal.
-        # See https://github.com/scipy/scipy/pull/15886.
-        # If this is the case, we return the signals unfiltered.
-        if critical_freq[0] == critical_freq[1]:
-            warnings.warn(
-                "Signals are returned unfiltered because band-pass critical "
-                "frequencies are equal. Please check that inputs for "
-                "sampling_rate, low_pass, and high_pass are valid.",
-                stacklevel=find_stack_level(),
-            )
-            return signals.copy() if copy else signals
-    else:
-        critical_freq = critical_freq[0]
-
-    sos = sp_signal.butter(
-        N=order,
-        Wn=critical_freq,
-        btype=btype,
-        output="sos",
-        fs=sampling_rate,
-    )
     if signals.ndim == 1:
         # 1D case
         output = sp_signal.sosfiltfilt(
@@ -555,6 +583,7 @@ def clean(
     t_r: Tr = 2.5,
     ensure_finite: bool = False,
     extrapolate: bool = False,
+    n_jobs: int = 1,
     **kwargs,
 ) -> np.ndarray:
     """Improve :term:`SNR` on masked :term:`fMRI` signals.
@@ -671,6 +700,11 @@ def clean(
         .. nilearn_versionchanged:: 0.13.0
             Default changed to False.
 
+    %(n_jobs)s
+        Batches of features are cleaned by several threads.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
     kwargs : :obj:`dict`
         Keyword arguments to be passed to functions called within ``clean``.
         Kwargs prefixed with ``'butterworth__'`` will be passed to
@@ -727,125 +761,241 @@ def clean(
             low_pass_,
             high_pass_,
             t_r_,
+            n_jobs=n_jobs,
         )
 
     # For the following steps, sample_mask should be either None or index-like
+    butterworth_kwargs = {
+        k.replace("butterworth__", ""): v
+        for k, v in kwargs.items()
+        if k.startswith("butterworth__")
+    }
+    plan = _CleaningPlan(
+        signals.shape[0],
+        detrend=detrend,
+        standardize=standardize,
+        sample_mask=sample_mask,
+        confounds=confounds,
+        standardize_confounds=standardize_confounds,
+        filter_type=filter_type,
+        low_pass=low_pass_,
+        high_pass=high_pass_,
+        t_r=t_r_,
+        extrapolate=extrapolate,
+        **butterworth_kwargs,
+    )
+    return plan.apply(signals, n_jobs=n_jobs)
 
-    # Generate cosine drift terms using the full length of the signals
-    if filter_type == "cosine":
-        confounds = _create_cosine_drift_terms(
-            signals, confounds, high_pass_, t_r_
-        )
-        if low_pass_ is not None:
-            warnings.warn(
-                "low_pass is not implemented for filter='cosine'",
-                stacklevel=find_stack_level(),
+
+class _CleaningPlan:
+    """Signal cleaning steps that do not depend on the signals.
+
+    Confounds are interpolated, detrended, filtered, censored and
+    orthogonalized, and the Butterworth filter is designed, only once.
+    The plan can then clean any number of signal matrices
+    with the same number of samples,
+    processing features by batches to limit memory usage.
+
+    See :func:`clean` for the parameters, that must have been sanitized.
+    Keyword arguments are passed to :func:`scipy.signal.sosfiltfilt`.
+    """
+
+    def __init__(
+        self,
+        n_samples,
+        detrend=True,
+        standardize="zscore_sample",
+        sample_mask=None,
+        confounds=None,
+        standardize_confounds=True,
+        filter_type="butterworth",
+        low_pass=None,
+        high_pass=None,
+        t_r=2.5,
+        extrapolate=False,
+        order=5,
+        # signals are always copied: 'butterworth__copy' has no effect
+        copy=None,  # noqa: ARG002
+        **filtfilt_kwargs,
+    ):
+        self.detrend = detrend
+        self.standardize = standardize
+        self.sample_mask = sample_mask
+        self.filter_type = filter_type
+        self.t_r = t_r
+        self.extrapolate = extrapolate
+        self.filtfilt_kwargs = filtfilt_kwargs
+
+        # Generate cosine drift terms using the full length of the signals
+        if filter_type == "cosine":
+            confounds = _create_cosine_drift_terms(
+                n_samples, confounds, high_pass, t_r
+            )
+            if low_pass is not None:
+                warnings.warn(
+                    "low_pass is not implemented for filter='cosine'",
+                    stacklevel=find_stack_level(),
+                )
+
+        # Interpolation / censoring of the confounds,
+        # with a column of zeros in place of the signals.
+        # The sample mask of the interpolated volumes is kept
+        # to censor them after filtering.
+        self.filtered_sample_mask = None
+        if sample_mask is not None:
+            _, confounds, filtered_sample_mask = _handle_scrubbed_volumes(
+                np.zeros((n_samples, 1)),
+                confounds,
+                sample_mask.copy(),
+                filter_type,
+                t_r,
+                extrapolate,
             )
+            if filter_type == "butterworth":
+                self.filtered_sample_mask = filtered_sample_mask
 
-    # Interpolation / censoring
-    signals, confounds, sample_mask = _handle_scrubbed_volumes(
-        signals, confounds, sample_mask, filter_type, t_r, extrapolate
-    )
-    # Detrend
-    # Detrend and filtering should apply to confounds, if confound presents
-    # keep filters orthogonal (according to Lindquist et al. (2018))
-    # Restrict the signal to the orthogonal of the confounds
-    original_mean_signals = signals.mean(axis=0)
-    if detrend:
-        signals = standardize_signal(
-            signals, standardize=None, detrend=detrend
-        )
-        if confounds is not None:
+        # Detrend and filtering should apply to confounds, if confound presents
+        # keep filters orthogonal (according to Lindquist et al. (2018))
+        if confounds is not None and detrend:
             confounds = standardize_signal(
                 confounds, standardize=None, detrend=detrend
             )
 
-    # Butterworth filtering
-    if filter_type == "butterworth":
-        if TYPE_CHECKING:
-            # guaranteed by _check_filter_parameters
-            assert t_r_ is not None
-        butterworth_kwargs = {
-            k.replace("butterworth__", ""): v
-            for k, v in kwargs.items()
-            if k.startswith("butterworth__")
-        }
-        signals = butterworth(
-            signals,
-            sampling_rate=1.0 / t_r_,
-            low_pass=low_pass_,
-            high_pass=high_pass_,
-            **butterworth_kwargs,
-        )
+        self.sos = None
+        if filter_type == "butterworth":
+            self.sos = _butterworth_sos(1.0 / t_r, low_pass, high_pass, order)
+        if confounds is not None:
+            confounds = self._filter(confounds)
+            if self.filtered_sample_mask is not None:
+                confounds = confounds[self.filtered_sample_mask, :]
+
+        # Orthonormal basis of the confounds
+        self.confounds_basis = None
         if confounds is not None:
-            # Apply low- and high-pass filters to keep filters orthogonal
-            # (according to Lindquist et al. (2018))
-            confounds = butterworth(
+            tmp = None if standardize_confounds is False else "zscore_sample"
+            confounds = standardize_signal(
                 confounds,
-                sampling_rate=1.0 / t_r_,
-                low_pass=low_pass_,
-                high_pass=high_pass_,
-                **butterworth_kwargs,
+                standardize=tmp,
+                detrend=False,
             )
 
-        # apply sample_mask to remove censored volumes after signal filtering
-        if sample_mask is not None:
-            signals, confounds = _censor_signals(
-                signals, confounds, sample_mask
+            if not standardize_confounds:
+                # Improve numerical stability by controlling the range of
+                # confounds. We don't rely on standardize_signal as it removes
+                # any constant contribution to confounds.
+                confound_max = np.max(np.abs(confounds), axis=0)
+                confound_max[confound_max == 0] = 1
+                confounds /= confound_max
+
+            # Pivoting in qr decomposition was added in scipy 0.10
+            Q, R, _ = linalg.qr(confounds, mode="economic", pivoting=True)
+            self.confounds_basis = Q[
+                :, np.abs(np.diag(R)) > np.finfo(np.float64).eps * 100.0
+            ]
+
+    def _filter(self, signals):
+        """Apply the Butterworth filter inplace."""
+        if self.sos is not None:
+            signals[...] = sp_signal.sosfiltfilt(
+                self.sos, x=signals, axis=0, **self.filtfilt_kwargs
             )
+        return signals
 
-    # Remove confounds
-    if confounds is not None:
-        tmp = None if standardize_confounds is False else "zscore_sample"
-        confounds = standardize_signal(
-            confounds,
-            standardize=tmp,
-            detrend=False,
-        )
+    def _apply_batch(self, signals):
+        """Clean a copy of some signals, except for standardization.
+
+        Also returns the mean of the signals after interpolation or censoring.
+        """
+        signals = signals.copy()
+        if self.sample_mask is not None:
+            signals, _, _ = _handle_scrubbed_volumes(
+                signals,
+                None,
+                self.sample_mask.copy(),
+                self.filter_type,
+                self.t_r,
+                self.extrapolate,
+            )
 
-        if not standardize_confounds:
-            # Improve numerical stability by controlling the range of
-            # confounds. We don't rely on standardize_signal as it removes any
-            # constant contribution to confounds.
-            confound_max = np.max(np.abs(confounds), axis=0)
-            confound_max[confound_max == 0] = 1
-            confounds /= confound_max
+        mean_signals = signals.mean(axis=0, dtype=np.float64)
+        if self.detrend:
+            signals = _detrend(signals, inplace=True)
 
-        # Pivoting in qr decomposition was added in scipy 0.10
-        Q, R, _ = linalg.qr(confounds, mode="economic", pivoting=True)
-        Q = Q[:, np.abs(np.diag(R)) > np.finfo(np.float64).eps * 100.0]
-        signals -= Q.dot(Q.T).dot(signals)
+        signals = self._filter(signals)
+        # apply sample_mask to remove censored volumes after signal filtering
+        if self.filtered_sample_mask is not None:
+            signals = signals[self.filtered_sample_mask, :]
 
-    # Standardize
-    if not standardize:
-        return signals
+        # Restrict the signal to the orthogonal of the confounds
+        if self.confounds_basis is not None:
+            signals -= self.confounds_basis.dot(
+                self.confounds_basis.T.dot(signals)
+            )
+        return signals, mean_signals
 
-    # detect if mean is close to zero; This can obscure the scale of the signal
-    # with percent signal change standardization. This should happen when the
-    # data was 1. detrended 2. high pass filtered.
-    filtered_mean_check = (
-        np.abs(signals.mean(0)).mean() / np.abs(original_mean_signals).mean()
-        < 1e-1
-    )
-    if standardize == "psc" and filtered_mean_check:
-        # If the signal is detrended, the mean signal will be zero or close to
-        # zero. If signal is high pass filtered with butterworth, the constant
-        # (mean) will be removed. This is detected through checking the scale
-        # difference of the original mean and filtered mean signal. When the
-        # mean is too small, we have to know the original mean signal to
-        # calculate the psc to avoid weird scaling.
-        signals = standardize_signal(
-            signals + original_mean_signals,
-            standardize=standardize,
-            detrend=False,
+    def apply(self, signals, n_batches=_N_BATCHES, n_jobs=1):
+        """Clean signals of shape (n_samples, n_features).
+
+        The input signals are not modified.
+        With n_jobs > 1, batches are cleaned by a pool of threads,
+        as numpy and scipy release the GIL during the computations.
+        """
+        n_jobs = effective_n_jobs(n_jobs)
+        n_batches = max(n_batches, n_jobs)
+        # No batching for small arrays
+        if signals.shape[1] < 500:
+            n_batches = n_jobs = 1
+
+        batches = list(gen_even_slices(signals.shape[1], n_batches))
+        cleaned_signals = None
+        original_mean_signals = np.empty(signals.shape[1])
+        with Parallel(n_jobs=n_jobs, prefer="threads") as parallel:
+            # only n_jobs batches are cleaned at once to limit memory usage
+            for start in range(0, len(batches), n_jobs):
+                group = batches[start : start + n_jobs]
+                results = parallel(
+                    delayed(self._apply_batch)(signals[:, batch])
+                    for batch in group
+                )
+                for batch, (cleaned_batch, mean_batch) in zip(
+                    group, results, strict=True
+                ):
+                    original_mean_signals[batch] = mean_batch
+                    if cleaned_signals is None:
+                        cleaned_signals = np.empty(
+                            (cleaned_batch.shape[0], signals.shape[1]),
+                            dtype=cleaned_batch.dtype,
+                        )
+                    cleaned_signals[:, batch] = cleaned_batch
+                del results
+
+        return self._standardize(cleaned_signals, original_mean_signals)
+
+    def _standardize(self, signals, original_mean_signals):
+        if not self.standardize:
+            return signals
+
+        # detect if mean is close to zero; This can obscure the scale of the
+        # signal with percent signal change standardization. This should
+        # happen when the data was 1. detrended 2. high pass filtered.
+        filtered_mean_check = (
+            np.abs(signals.mean(0)).mean()
+            / np.abs(original_mean_signals).mean()
+            < 1e-1
         )
-    else:
-        signals = standardize_signal(
+        if self.standardize == "psc" and filtered_mean_check:
+            # If the signal is detrended, the mean signal will be zero or close
+            # to zero. If signal is high pass filtered with butterworth, the
+            # constant (mean) will be removed. This is detected through
+            # checking the scale difference of the original mean and filtered
+            # mean signal. When the mean is too small, we have to know the
+            # original mean signal to calculate the psc to avoid weird scaling.
+            signals += original_mean_signals
+        return standardize_signal(
             signals,
-            standardize=standardize,
+            standardize=self.standardize,
             detrend=False,
         )
-    return signals
 
 
 def _handle_scrubbed_volumes(
@@ -944,9 +1094,9 @@ def create_cosine_drift(high_pass, frame_times):
     return cosine_drift
 
 
-def _create_cosine_drift_terms(signals, confounds, high_pass, t_r):
+def _create_cosine_drift_terms(n_samples, confounds, high_pass, t_r):
     """Create cosine drift terms, append to confounds regressors."""
-    frame_times = np.arange(signals.shape[0]) * t_r
+    frame_times = np.arange(n_samples) * t_r
     # remove constant, as the signal is mean centered
     cosine_drift = create_cosine_drift(high_pass, frame_times)[:, :-1]
     confounds = _check_cosine_by_user(confounds, cosine_drift)
@@ -998,6 +1148,7 @@ def _process_runs(
     low_pass,
     high_pass,
     t_r,
+    n_jobs=1,
 ):
     """Process each run independently."""
     if len(runs) != len(signals):
@@ -1023,6 +1174,7 @@ def _process_runs(
             low_pass=low_pass,
             high_pass=high_pass,
             t_r=t_r,
+            n_jobs=n_jobs,
         )
         cleaned_signals.append(run_signals)
     return np.vstack(cleaned_signals)
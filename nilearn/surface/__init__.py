@@ -7,6 +7,7 @@ from .surface import (
     PolyMesh,
     SurfaceImage,
     SurfaceMesh,
+    SurfaceProjector,
     load_surf_data,
     load_surf_mesh,
     vol_to_surf,
@@ -19,6 +20,7 @@ __all__ = [
     "PolyMesh",
     "SurfaceImage",
     "SurfaceMesh",
+    "SurfaceProjector",
     "load_surf_data",
     "load_surf_mesh",
     "vol_to_surf",
@@ -2,12 +2,14 @@
 
 import abc
 import gzip
+import json
 import pathlib
 import warnings
 from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import Any
 
+import joblib
 import numpy as np
 import pandas as pd
 import sklearn.cluster
@@ -19,7 +21,7 @@ from scipy.sparse import csr_matrix
 from scipy.sparse.csgraph import connected_components
 from sklearn.exceptions import EfficiencyWarning
 
-from nilearn._utils.helpers import stringify_path
+from nilearn._utils.helpers import KeyedLRUCache, stringify_path
 from nilearn._utils.logger import find_stack_level
 from nilearn._utils.niimg import ensure_finite_data, has_non_finite
 from nilearn._utils.param_validation import (
@@ -466,6 +468,111 @@ def _projection_matrix(
     return proj
 
 
+def _linear_projection_matrix(
+    mesh,
+    affine,
+    img_shape,
+    kind="auto",
+    radius=3.0,
+    n_points=None,
+    mask=None,
+    inner_mesh=None,
+    depth=None,
+):
+    """Get a sparse matrix that performs the 'linear' vol_to_surf sampling.
+
+    Each row averages the trilinear interpolation of the image at the sample
+    locations of one vertex that fall inside the image (and the mask).
+
+    See _projection_matrix for a description of the parameters.
+    All dimensions of ``img_shape`` must be larger than 1.
+
+    Returns
+    -------
+    proj : :obj:`scipy.sparse.csr_matrix`
+       Shape (n_mesh_vertices, n_voxels).
+
+    empty : :obj:`numpy.ndarray` of shape (n_mesh_vertices,)
+       True for vertices whose samples are all outside of the image or mask.
+    """
+    mesh = load_surf_mesh(mesh)
+    sample_locations = _sample_locations(
+        mesh,
+        affine,
+        kind=kind,
+        radius=radius,
+        n_points=n_points,
+        inner_mesh=inner_mesh,
+        depth=depth,
+    )
+    n_vertices, n_points, _ = sample_locations.shape
+    locations = np.vstack(sample_locations)
+    kept = ~_masked_indices(locations, img_shape, mask=mask)
+    n_kept = kept.reshape((n_vertices, n_points)).sum(axis=1)
+    rows = np.repeat(np.arange(n_vertices), n_points)[kept]
+    locations = locations[kept]
+
+    # same cells as scipy's RegularGridInterpolator,
+    # which extrapolates from the border cells
+    lower = np.clip(np.floor(locations), 0, np.asarray(img_shape) - 2)
+    fractions = locations - lower
+    lower = lower.astype(int)
+    columns, weights = [], []
+    for corner in np.ndindex(2, 2, 2):
+        columns.append(np.ravel_multi_index((lower + corner).T, img_shape))
+        weights.append(np.where(corner, fractions, 1 - fractions).prod(axis=1))
+    weights = np.stack(weights, axis=1) / n_kept[rows, np.newaxis]
+    proj = sparse.csr_matrix(
+        (
+            weights.ravel(),
+            (np.repeat(rows, 8), np.stack(columns, axis=1).ravel()),
+        ),
+        shape=(n_vertices, np.prod(img_shape)),
+    )
+    return proj, n_kept == 0
+
+
+# Linear projections recently used by vol_to_surf,
+# indexed by a hash of the parameters they were built from.
+_LINEAR_PROJECTIONS = KeyedLRUCache(max_items=2)
+
+
+def _cached_linear_projection_matrix(mesh, affine, img_shape, **kwargs):
+    """Return _linear_projection_matrix, reusing recent results.
+
+    Projecting several images (e.g. all the runs of all subjects) onto the
+    same mesh with the same parameters then builds the matrix only once.
+    """
+    inner_mesh = kwargs.get("inner_mesh")
+    key = joblib.hash(
+        (
+            mesh.coordinates,
+            mesh.faces,
+            None if inner_mesh is None else inner_mesh.coordinates,
+            np.asarray(affine),
+            tuple(img_shape),
+            kwargs,
+        )
+    )
+    return _LINEAR_PROJECTIONS.get(
+        key,
+        lambda: _linear_projection_matrix(mesh, affine, img_shape, **kwargs),
+    )
+
+
+def _apply_projection(proj, empty, data):
+    """Project 4D data with a matrix from _linear_projection_matrix.
+
+    Returns an array of shape (n_mesh_vertices, n_volumes).
+    """
+    texture = proj @ data.reshape((-1, data.shape[-1]))
+    # if all samples around a mesh vertex are outside the image,
+    # there is no reasonable value to assign to this vertex.
+    # in this case we return NaN for this vertex.
+    texture[empty] = np.nan
+    return texture
+
+
 def _mask_sample_locations(sample_locations, img_shape, mesh_n_vertices, mask):
     """Mask sample locations without changing to indices."""
     sample_locations = np.asarray(np.round(sample_locations), dtype=int)
@@ -826,30 +933,268 @@ def vol_to_surf(
 
     img = check_niimg(img, atleast_4d=True)
 
-    frames = np.rollaxis(get_vol_data(img), -1)
+    data = get_vol_data(img)
 
     mesh = load_surf_mesh(surf_mesh)
 
     if inner_mesh is not None:
         inner_mesh = load_surf_mesh(inner_mesh)
 
-    sampling = sampling_schemes[interpolation]
+    sampling_kwargs = {
+        "radius": radius,
+        "kind": kind,
+        "n_points": n_samples,
+        "mask": mask,
+        "inner_mesh": inner_mesh,
+        "depth": depth,
+    }
 
-    texture = sampling(
-        frames,
-        mesh,
-        img.affine,
-        radius=radius,
-        kind=kind,
-        n_points=n_samples,
-        mask=mask,
-        inner_mesh=inner_mesh,
-        depth=depth,
-    )
+    # the linear interpolation is a sparse matrix product,
+    # except for images the matrix cannot reproduce
+    # (non-finite values are ignored when averaging the samples)
+    if (
+        interpolation == "linear"
+        and min(data.shape[:3]) > 1
+        and np.isfinite(data).all()
+    ):
+        proj, empty = _cached_linear_projection_matrix(
+            mesh, img.affine, data.shape[:3], **sampling_kwargs
+        )
+        texture = _apply_projection(proj, empty, data)
+    else:
+        sampling = sampling_schemes[interpolation]
+        texture = sampling(
+            np.rollaxis(data, -1), mesh, img.affine, **sampling_kwargs
+        ).T
 
     if original_dimension == 3:
-        texture = texture[0]
-    return texture.T
+        texture = texture[:, 0]
+    return texture
+
+
+class SurfaceProjector:
+    """Reusable projection of volume images onto a surface mesh.
+
+    Build once the sparse matrix that :func:`~nilearn.surface.vol_to_surf`
+    uses for the 'linear' interpolation, for a given mesh, sampling strategy
+    and image grid, then project any number of images on this grid
+    with a single sparse matrix product.
+
+    .. nilearn_versionadded:: 0.14.0dev
+
+    Parameters
+    ----------
+    surf_mesh : :obj:`str`, :obj:`pathlib.Path`, :obj:`numpy.ndarray`, or \
+                :obj:`~nilearn.surface.InMemoryMesh`
+        Surface :term:`mesh` onto which images are projected.
+        See :func:`~nilearn.surface.vol_to_surf`.
+
+    affine : :obj:`numpy.ndarray` of shape (4, 4)
+        Affine of the images to project.
+
+    img_shape : 3-tuple of :obj:`int`
+        Spatial shape of the images to project.
+        All dimensions must be larger than 1.
+
+    radius : :obj:`float`, default=3.0
+        See :func:`~nilearn.surface.vol_to_surf`.
+
+    kind : {'auto', 'depth', 'line', 'ball'}, default='auto'
+        See :func:`~nilearn.surface.vol_to_surf`.
+
+    n_samples : :obj:`int` or `None`, default=None
+        See :func:`~nilearn.surface.vol_to_surf`.
+
+    mask_img : Niimg-like object or `None`, default=None
+        Samples falling out of this mask or out of the image are ignored.
+        The mask is resampled to ``affine`` and ``img_shape``.
+        If `None`, don't apply any mask.
+
+    inner_mesh : :obj:`str` or :obj:`numpy.ndarray` or None, default=None
+        See :func:`~nilearn.surface.vol_to_surf`.
+
+    depth : sequence of :obj:`float` or `None`, default=None
+        See :func:`~nilearn.surface.vol_to_surf`.
+
+    Attributes
+    ----------
+    n_vertices : :obj:`int`
+        Number of vertices of the mesh.
+
+    Notes
+    -----
+    Contrary to :func:`~nilearn.surface.vol_to_surf`, which ignores them,
+    non-finite values in the images propagate to the vertices whose samples
+    are interpolated from them.
+
+    Examples
+    --------
+    Project the runs of several subjects registered to the same template::
+
+     >>> projector = SurfaceProjector(
+     ...     fsaverage["pial_left"],
+     ...     affine=template.affine,
+     ...     img_shape=template.shape,
+     ...     inner_mesh=fsaverage["white_left"],
+     ... )  # doctest: +SKIP
+     >>> textures = projector.project(run_imgs)  # doctest: +SKIP
+     >>> projector.to_filename("projector.npz")  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        surf_mesh,
+        affine,
+        img_shape,
+        radius=3.0,
+        kind="auto",
+        n_samples=None,
+        mask_img=None,
+        inner_mesh=None,
+        depth=None,
+    ):
+        # avoid circular import
+        from nilearn.image import check_niimg_3d
+        from nilearn.image.image import get_data as get_vol_data
+        from nilearn.image.resampling import resample_img
+
+        self.affine = np.asarray(affine)
+        self.img_shape = tuple(int(size) for size in img_shape)
+        if len(self.img_shape) != 3 or min(self.img_shape) < 2:
+            raise ValueError(
+                "'img_shape' must be 3 dimensions larger than 1. "
+                f"Got {img_shape}."
+            )
+
+        mask = None
+        if mask_img is not None:
+            mask = get_vol_data(
+                resample_img(
+                    check_niimg_3d(mask_img),
+                    target_affine=self.affine,
+                    target_shape=self.img_shape,
+                    interpolation="nearest",
+                    copy=False,
+                )
+            )
+        if inner_mesh is not None:
+            inner_mesh = load_surf_mesh(inner_mesh)
+
+        self._proj, self._empty = _linear_projection_matrix(
+            surf_mesh,
+            self.affine,
+            self.img_shape,
+            kind=kind,
+            radius=radius,
+            n_points=n_samples,
+            mask=mask,
+            inner_mesh=inner_mesh,
+            depth=depth,
+        )
+
+    @property
+    def n_vertices(self):
+        """Number of vertices of the mesh."""
+        return self._proj.shape[0]
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} "
+            f"{self.img_shape} -> {self.n_vertices} vertices>"
+        )
+
+    def project(self, imgs):
+        """Project images onto the mesh.
+
+        Parameters
+        ----------
+        imgs : 3D or 4D Niimg-like object, or :obj:`list` of those
+            Images to project, with the affine and shape of the projector.
+            All the volumes of a list of images are projected at once.
+
+        Returns
+        -------
+        texture : :obj:`numpy.ndarray`, 1d or 2d, or :obj:`list` of those
+            Same as :func:`~nilearn.surface.vol_to_surf`:
+            one value per vertex for a 3D image,
+            an array of shape (n_vertices, n_volumes) for a 4D image.
+            A list of textures is returned for a list of images.
+        """
+        # avoid circular import
+        from nilearn.image import check_niimg
+        from nilearn.image.image import get_data as get_vol_data
+
+        is_list = isinstance(imgs, (list, tuple))
+        data, n_dims = [], []
+        for img in imgs if is_list else [imgs]:
+            img = check_niimg(img)
+            if img.shape[:3] != self.img_shape or not np.allclose(
+                img.affine, self.affine
+            ):
+                raise ValueError(
+                    "Images must have the affine and shape of the projector: "
+                    f"{self.img_shape} and\n{self.affine}.\n"
+                    f"Got {img.shape[:3]} and\n{img.affine}."
+                )
+            img_data = get_vol_data(img)
+            n_dims.append(img_data.ndim)
+            data.append(img_data.reshape((np.prod(self.img_shape), -1)))
+
+        texture = _apply_projection(
+            self._proj, self._empty, np.concatenate(data, axis=1)
+        )
+        textures = np.split(
+            texture, np.cumsum([d.shape[1] for d in data])[:-1], axis=1
+        )
+        textures = [
+            t[:, 0] if ndim == 3 else t
+            for t, ndim in zip(textures, n_dims, strict=True)
+        ]
+        return textures if is_list else textures[0]
+
+    def to_filename(self, filename):
+        """Save the projector to a numpy ``.npz`` file.
+
+        Parameters
+        ----------
+        filename : :obj:`str` or :obj:`pathlib.Path`
+            Path of the file, ``.npz`` is appended if missing.
+        """
+        np.savez(
+            filename,
+            data=self._proj.data,
+            indices=self._proj.indices,
+            indptr=self._proj.indptr,
+            shape=self._proj.shape,
+            empty=self._empty,
+            affine=self.affine,
+            img_shape=self.img_shape,
+        )
+
+    @classmethod
+    def from_filename(cls, filename):
+        """Load a projector saved with \
+        :meth:`~nilearn.surface.SurfaceProjector.to_filename`.
+
+        Parameters
+        ----------
+        filename : :obj:`str` or :obj:`pathlib.Path`
+            Path of the ``.npz`` file.
+
+        Returns
+        -------
+        :obj:`~nilearn.surface.SurfaceProjector`
+        """
+        projector = cls.__new__(cls)
+        with np.load(filename) as saved:
+            projector.affine = saved["affine"]
+            projector.img_shape = tuple(int(n) for n in saved["img_shape"])
+            projector._empty = saved["empty"]
+            projector._proj = csr_matrix(
+                (saved["data"], saved["indices"], saved["indptr"]),
+                shape=tuple(saved["shape"]),
+            )
+        return projector
 
 
 def _load_surf_files_gifti_gzip(surf_file):
@@ -2051,6 +2396,80 @@ class SurfaceImage:
 
         return cls(mesh=mesh, data=data)
 
+    def to_cache(self, directory) -> None:
+        """Save the image to a directory of numpy ``.npy`` files.
+
+        The mesh coordinates, mesh faces and data of each hemisphere
+        are saved to separate ``.npy`` files,
+        next to a JSON file listing the hemispheres.
+        Contrary to GIFTI files, the data can then be memory-mapped
+        when loading the image with
+        :meth:`~nilearn.surface.SurfaceImage.from_cache`.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
+        Parameters
+        ----------
+        directory : :obj:`str` or :obj:`pathlib.Path`
+            Directory where to save the image.
+            It is created if it does not exist.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for hemi, data in self.data.parts.items():
+            mesh = self.mesh.parts[hemi]
+            prefix = _cache_file_prefix(directory, hemi)
+            np.save(f"{prefix}_coordinates.npy", mesh.coordinates)
+            np.save(f"{prefix}_faces.npy", mesh.faces)
+            np.save(f"{prefix}_data.npy", data)
+        (directory / _SURFACE_IMAGE_CACHE_METADATA).write_text(
+            json.dumps({"parts": list(self.data.parts)})
+        )
+
+    @classmethod
+    def from_cache(cls, directory, mmap_mode="r"):
+        """Load an image saved with \
+        :meth:`~nilearn.surface.SurfaceImage.to_cache`.
+
+        .. nilearn_versionadded:: 0.14.0dev
+
+        Parameters
+        ----------
+        directory : :obj:`str` or :obj:`pathlib.Path`
+            Directory where the image was saved.
+
+        mmap_mode : {None, 'r+', 'r', 'w+', 'c'}, default='r'
+            Memory-map mode of the data passed to :func:`numpy.load`.
+            With the default, the data is only read from disk when accessed
+            and the files cannot be modified through the image.
+            If None, the data is loaded in memory.
+
+        Returns
+        -------
+        :obj:`~nilearn.surface.SurfaceImage`
+        """
+        directory = Path(directory)
+        metadata = json.loads(
+            (directory / _SURFACE_IMAGE_CACHE_METADATA).read_text()
+        )
+        mesh, data = {}, {}
+        for hemi in metadata["parts"]:
+            prefix = _cache_file_prefix(directory, hemi)
+            mesh[hemi] = InMemoryMesh(
+                np.load(f"{prefix}_coordinates.npy"),
+                np.load(f"{prefix}_faces.npy"),
+            )
+            data[hemi] = np.load(f"{prefix}_data.npy", mmap_mode=mmap_mode)
+        return cls(mesh=mesh, data=data)
+
+
+_SURFACE_IMAGE_CACHE_METADATA = "surface_image.json"
+
+
+def _cache_file_prefix(directory, hemi):
+    """Return the prefix of the files of one hemisphere in a cache."""
+    return directory / f"hemi-{hemi[0].upper()}"
+
 
 def check_surf_img(img: SurfaceImage | Iterable[SurfaceImage]) -> None:
     """Validate SurfaceImage.
@@ -2227,6 +2646,51 @@ def compute_adjacency_matrix(mesh: InMemoryMesh, values="ones", dtype=None):
     return csr_matrix((ee, (uv, vu)), shape=(n, n))
 
 
+# Smoothing matrices recently used by _smoothing_matrix,
+# indexed by a hash of the mesh faces they were built from.
+_SMOOTHING_MATRICES = KeyedLRUCache(max_items=2)
+
+
+def _smoothing_matrix(mesh, center_weight=0.5):
+    """Return the matrix of one iteration of surface smoothing.
+
+    Each vertex value is replaced by a weighted sum
+    of its value (``center_weight``) and of the mean of its neighbors
+    (``1 - center_weight``).
+
+    The matrix is kept for the two most recently smoothed meshes,
+    so that smoothing several images on the same mesh builds it only once.
+
+    Parameters
+    ----------
+    mesh : InMemoryMesh
+
+    center_weight : :obj:`float`, default=0.5
+        Weight of the value of the vertex itself.
+
+    Returns
+    -------
+    matrix : scipy.sparse.csr_matrix
+        Matrix of shape (n_vertices, n_vertices).
+        Its rows sum to 1, except for the rows of isolated vertices,
+        which only have ``center_weight`` on the diagonal.
+    """
+
+    def _compute():
+        adjacency = compute_adjacency_matrix(mesh, values="ones", dtype=float)
+        n_neighbors = np.asarray(adjacency.sum(axis=1)).ravel()
+        # isolated vertices have no neighbor weight to normalize
+        n_neighbors[n_neighbors == 0] = 1
+        surround_weights = sparse.diags((1 - center_weight) / n_neighbors)
+        matrix = surround_weights @ adjacency + sparse.diags(
+            np.full(mesh.n_vertices, center_weight)
+        )
+        return csr_matrix(matrix)
+
+    key = joblib.hash((mesh.n_vertices, mesh.faces, center_weight))
+    return _SMOOTHING_MATRICES.get(key, _compute)
+
+
 def find_surface_clusters(
     mesh, mask, offset: int = 1
 ) -> tuple[pd.DataFrame, np.ndarray]:
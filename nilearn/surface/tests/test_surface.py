@@ -21,10 +21,13 @@ from nilearn.surface.surface import (
     PolyData,
     PolyMesh,
     SurfaceImage,
+    SurfaceProjector,
+    _apply_projection,
     _choose_kind,
     _gifti_img_to_data,
     _gifti_img_to_mesh,
     _interpolation_sampling,
+    _linear_projection_matrix,
     _load_surf_files_gifti_gzip,
     _load_uniform_ball_cloud,
     _masked_indices,
@@ -32,6 +35,7 @@ from nilearn.surface.surface import (
     _projection_matrix,
     _sample_locations,
     _sample_locations_between_surfaces,
+    _smoothing_matrix,
     _uniform_ball_cloud,
     _vertex_outer_normals,
     check_mesh_and_data,
@@ -847,6 +851,107 @@ def test_sampling_between_surfaces(projection, affine_eye):
     )
 
 
+@pytest.mark.parametrize("kind", ["line", "ball", "depth"])
+@pytest.mark.parametrize("use_mask", [True, False])
+def test_linear_projection_matrix(kind, use_mask, rng):
+    """Check the linear projection matrix matches the interpolation."""
+    mesh = flat_mesh(9, 11, 4)
+    inner_mesh = flat_mesh(9, 11, 2) if kind == "depth" else None
+    affine = np.eye(4)
+    affine[:3, :3] = [[1.2, 0.1, 0.0], [0.0, 0.9, 0.2], [0.1, 0.0, 1.1]]
+    affine[:3, 3] = [-1.0, 0.5, 0.3]
+    images = rng.standard_normal((3, 8, 10, 7))
+    mask = (rng.random(images.shape[1:]) > 0.3) if use_mask else None
+    kwargs = {"kind": kind, "radius": 2.0, "mask": mask}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        expected = _interpolation_sampling(
+            images, mesh, affine, inner_mesh=inner_mesh, **kwargs
+        )
+    proj, empty = _linear_projection_matrix(
+        mesh, affine, images.shape[1:], inner_mesh=inner_mesh, **kwargs
+    )
+    texture = _apply_projection(proj, empty, np.moveaxis(images, 0, -1))
+
+    assert_array_almost_equal(texture.T, expected)
+    assert_array_equal(empty, np.isnan(expected[0]))
+
+
+def test_vol_to_surf_non_finite(affine_eye):
+    """Check non-finite values are ignored when averaging samples."""
+    mesh = flat_mesh(5, 7, 4)
+    img = z_const_img(5, 7, 13)
+    img[:, :, 5] = np.nan
+
+    texture = vol_to_surf(
+        Nifti1Image(img, affine_eye), mesh, radius=0.5, n_samples=3
+    )
+
+    assert_array_almost_equal(texture, img[:, :, 4].ravel())
+
+
+@pytest.fixture
+def projector_inputs(affine_eye, rng):
+    """Return a mesh, 4D image and mask to build a SurfaceProjector."""
+    affine = affine_eye.copy()
+    affine[:3, 3] = [-1.0, -1.0, 0.0]
+    img = Nifti1Image(rng.standard_normal((8, 10, 7, 4)), affine)
+    mask = np.ones(img.shape[:3], dtype="int8")
+    mask[:2] = 0
+    return flat_mesh(9, 11, 4), img, Nifti1Image(mask, affine)
+
+
+@pytest.mark.parametrize("kind", ["line", "ball"])
+def test_surface_projector(projector_inputs, kind, tmp_path):
+    """Check SurfaceProjector gives the same textures as vol_to_surf."""
+    mesh, img, mask_img = projector_inputs
+    projector = SurfaceProjector(
+        mesh, img.affine, img.shape[:3], kind=kind, mask_img=mask_img
+    )
+
+    assert projector.n_vertices == 9 * 11
+
+    expected = vol_to_surf(img, mesh, kind=kind, mask_img=mask_img)
+    expected_3d = vol_to_surf(
+        image.index_img(img, 1), mesh, kind=kind, mask_img=mask_img
+    )
+
+    assert_array_almost_equal(projector.project(img), expected)
+    assert_array_almost_equal(
+        projector.project(image.index_img(img, 1)), expected_3d
+    )
+
+    textures = projector.project([img, image.index_img(img, 1), img])
+
+    assert len(textures) == 3
+    assert_array_almost_equal(textures[0], expected)
+    assert_array_almost_equal(textures[1], expected_3d)
+    assert_array_almost_equal(textures[2], expected)
+
+    projector.to_filename(tmp_path / "projector.npz")
+    loaded = SurfaceProjector.from_filename(tmp_path / "projector.npz")
+
+    assert loaded.img_shape == projector.img_shape
+    assert_array_equal(loaded.affine, projector.affine)
+    assert_array_equal(loaded.project(img), projector.project(img))
+
+
+def test_surface_projector_errors(projector_inputs):
+    """Check errors of SurfaceProjector."""
+    mesh, img, _ = projector_inputs
+
+    with pytest.raises(ValueError, match="must be 3 dimensions larger"):
+        SurfaceProjector(mesh, img.affine, (8, 10, 1))
+
+    projector = SurfaceProjector(mesh, img.affine, img.shape[:3])
+
+    with pytest.raises(ValueError, match="affine and shape of the projector"):
+        projector.project(Nifti1Image(image.get_data(img), 2 * img.affine))
+    with pytest.raises(ValueError, match="affine and shape of the projector"):
+        projector.project(Nifti1Image(image.get_data(img)[1:], img.affine))
+
+
 def test_choose_kind():
     kind = _choose_kind("abc", None)
     assert kind == "abc"
@@ -1217,6 +1322,44 @@ def test_save_dtype(surf_img_1d, tmp_path, dtype):
     surf_img_1d.data.to_filename(tmp_path / "data.gii")
 
 
+@pytest.mark.parametrize("mmap_mode", ["r", None])
+def test_surface_image_cache(surf_img_2d, tmp_path, mmap_mode):
+    """Check round trip through the numpy cache of a SurfaceImage."""
+    img = surf_img_2d(5)
+    img.to_cache(tmp_path / "cache")
+
+    loaded = SurfaceImage.from_cache(tmp_path / "cache", mmap_mode=mmap_mode)
+
+    assert loaded.shape == img.shape
+    for hemi, data in img.data.parts.items():
+        assert_array_equal(loaded.data.parts[hemi], data)
+        assert loaded.data.parts[hemi].dtype == data.dtype
+        assert isinstance(loaded.data.parts[hemi], np.memmap) == (
+            mmap_mode is not None
+        )
+        assert_array_equal(
+            loaded.mesh.parts[hemi].coordinates,
+            img.mesh.parts[hemi].coordinates,
+        )
+        assert_array_equal(
+            loaded.mesh.parts[hemi].faces, img.mesh.parts[hemi].faces
+        )
+
+
+def test_surface_image_cache_one_hemisphere(surf_img_1d, tmp_path):
+    """Check the cache of an image with a single hemisphere."""
+    img = SurfaceImage(
+        mesh={"left": surf_img_1d.mesh.parts["left"]},
+        data={"left": surf_img_1d.data.parts["left"]},
+    )
+    img.to_cache(tmp_path)
+
+    loaded = SurfaceImage.from_cache(tmp_path)
+
+    assert list(loaded.data.parts) == ["left"]
+    assert_array_equal(loaded.data.parts["left"], img.data.parts["left"])
+
+
 @pytest.mark.thread_unsafe
 def test_load_from_volume_3d_nifti(img_3d_mni, surf_mesh, tmp_path):
     """Instantiate surface image with 3D Niftiimage object or file for data."""
@@ -1377,6 +1520,40 @@ def test_compute_adjacency_matrix(surf_mesh):
     assert np.sum(np.sum(adjacency_matrix)) == 18
 
 
+@pytest.mark.thread_unsafe
+@pytest.mark.parametrize("center_weight", [0.5, 0.2])
+def test_smoothing_matrix(surf_mesh, center_weight):
+    """Check the smoothing matrix averages the center and its neighbors."""
+    mesh = surf_mesh.parts["right"]
+    matrix = _smoothing_matrix(mesh, center_weight=center_weight)
+
+    assert matrix.shape == (5, 5)
+    assert_array_almost_equal(matrix.diagonal(), center_weight)
+    assert_array_almost_equal(np.asarray(matrix.sum(axis=1)).ravel(), 1)
+
+    adjacency = compute_adjacency_matrix(mesh).toarray()
+    neighbors_mean = adjacency / adjacency.sum(axis=1, keepdims=True)
+    assert_array_almost_equal(
+        matrix.toarray(),
+        center_weight * np.eye(5) + (1 - center_weight) * neighbors_mean,
+    )
+
+    # the matrix is reused for the same mesh
+    assert _smoothing_matrix(mesh, center_weight=center_weight) is matrix
+
+
+def test_smoothing_matrix_isolated_vertex():
+    """Check that isolated vertices only keep their weighted value."""
+    mesh = InMemoryMesh(
+        coordinates=np.eye(4), faces=np.array([[0, 1, 2]], dtype=int)
+    )
+
+    matrix = _smoothing_matrix(mesh, center_weight=0.3).toarray()
+
+    assert_array_almost_equal(matrix.sum(axis=1), [1, 1, 1, 0.3])
+    assert_array_almost_equal(matrix[3], [0, 0, 0, 0.3])
+
+
 @pytest.mark.parametrize(
     "mask, expected_n_clusters",
     [
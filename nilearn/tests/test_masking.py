@@ -375,6 +375,68 @@ def test_apply_mask(tmp_path, create_files, affine):
         assert_equal(proj.sum(), 9 / np.abs(affine[axis, axis]))
 
 
+@pytest.mark.parametrize("chunk_size", [1, 3, 10])
+@pytest.mark.parametrize("smoothing_fwhm", [None, 4])
+@pytest.mark.parametrize("create_files", (False, True))
+def test_apply_mask_chunk_size(
+    tmp_path, rng, affine_eye, create_files, chunk_size, smoothing_fwhm
+):
+    """Check that masking by blocks of volumes gives the same result."""
+    data = rng.standard_normal((9, 10, 11, 7))
+    data[2, 3, 4, 5] = np.nan
+    data_img = Nifti1Image(data, affine_eye)
+
+    mask = np.zeros((9, 10, 11))
+    mask[2:7, 2:7, 2:7] = 1
+    mask_img = Nifti1Image(mask, affine_eye)
+
+    filenames = write_imgs_to_path(
+        data_img,
+        mask_img,
+        file_path=tmp_path,
+        create_files=create_files,
+    )
+
+    expected = apply_mask(
+        filenames[0], filenames[1], smoothing_fwhm=smoothing_fwhm
+    )
+    series = apply_mask(
+        filenames[0],
+        filenames[1],
+        smoothing_fwhm=smoothing_fwhm,
+        chunk_size=chunk_size,
+    )
+
+    assert series.shape == (7, int(mask.sum()))
+    assert series.dtype == expected.dtype
+    np.testing.assert_allclose(series, expected)
+
+
+def test_apply_mask_chunk_size_output_file(tmp_path, rng, affine_eye):
+    """Check that masked data can be written to a memory-mapped file."""
+    data = rng.standard_normal((9, 10, 11, 5)).astype("float32")
+    data_img = Nifti1Image(data, affine_eye)
+    mask_img = Nifti1Image(np.ones((9, 10, 11), dtype="int8"), affine_eye)
+    output_file = tmp_path / "series.npy"
+
+    series = apply_mask(
+        data_img, mask_img, chunk_size=2, output_file=output_file
+    )
+
+    assert isinstance(series, np.memmap)
+    assert series.dtype == np.float32
+    assert_array_equal(np.load(output_file), apply_mask(data_img, mask_img))
+
+
+def test_apply_mask_chunk_size_error(affine_eye, img_4d_ones_eye):
+    """Check errors for invalid chunk_size."""
+    mask_img = Nifti1Image(np.ones(img_4d_ones_eye.shape[:3]), affine_eye)
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        apply_mask(img_4d_ones_eye, mask_img, chunk_size=0)
+    with pytest.raises(TypeError, match="must be of type"):
+        apply_mask(img_4d_ones_eye, mask_img, chunk_size=1.5)
+
+
 def test_apply_mask_surface(surf_img_1d, surf_mask_1d):
     """Test apply_mask on surface.
 
@@ -14,6 +14,7 @@ from nilearn.conftest import _rng
 from nilearn.exceptions import AllVolumesRemovedError
 from nilearn.signal import (
     _censor_signals,
+    _CleaningPlan,
     _create_cosine_drift_terms,
     _detrend,
     _handle_scrubbed_volumes,
@@ -690,6 +691,50 @@ def test_clean_leaves_input_untouched():
     assert array_equal(sx_orig, sx)
 
 
+@pytest.mark.parametrize("filter_type", ["butterworth", "cosine"])
+def test_cleaning_plan_reuse(rng, filter_type):
+    """Check that a cleaning plan can clean several signals, by batches."""
+    n_samples = 50
+    confounds = rng.standard_normal((n_samples, 3))
+    sample_mask = np.delete(np.arange(n_samples), [0, 10, 11, 30])
+    kwargs = {
+        "confounds": confounds,
+        "sample_mask": sample_mask,
+        "high_pass": 0.01,
+        "t_r": 2.0,
+        "filter": filter_type,
+    }
+    plan = _CleaningPlan(
+        n_samples,
+        confounds=confounds,
+        sample_mask=sample_mask,
+        filter_type=filter_type,
+        high_pass=0.01,
+        t_r=2.0,
+    )
+
+    for n_features in [3, 600]:
+        signals = rng.standard_normal((n_samples, n_features))
+        signals_orig = signals.copy()
+
+        cleaned = plan.apply(signals, n_batches=4)
+
+        assert_array_equal(signals, signals_orig)
+        assert_almost_equal(cleaned, clean(signals, **kwargs))
+        assert_almost_equal(cleaned, plan.apply(signals, n_batches=1))
+
+
+def test_clean_n_jobs(rng):
+    """Check that cleaning with several threads gives the same result."""
+    signals = rng.standard_normal((40, 1000))
+    runs = np.repeat([0, 1], 20)
+    kwargs = {"runs": runs, "high_pass": 0.01, "t_r": 2.0}
+
+    assert_almost_equal(
+        clean(signals, n_jobs=3, **kwargs), clean(signals, **kwargs)
+    )
+
+
 def test_clean_runs():
     """Check cleaning across runs."""
     n_samples = 21
@@ -1393,6 +1438,27 @@ def test_clean_psc_warning(rng):
     assert_equal(cleaned_w_zero[:, -3:].mean(0), 0)
 
 
+@pytest.mark.parametrize("standardize", ["zscore_sample", "psc"])
+def test_clean_float32(rng, standardize):
+    """Check that single precision signals are cleaned in single precision.
+
+    Means are accumulated in double precision,
+    so results stay close to double precision ones
+    even for signals with a large mean.
+    """
+    signals = 1000 + 10 * rng.standard_normal((1000, 50))
+
+    cleaned = clean(signals, standardize=standardize)
+    cleaned_float32 = clean(
+        signals.astype(np.float32), standardize=standardize
+    )
+
+    assert cleaned_float32.dtype == np.float32
+    assert (
+        np.abs(cleaned_float32 - cleaned).max() < 1e-5 * np.abs(cleaned).max()
+    )
+
+
 def test_clean_zscore(rng):
     """Check that cleaning with Z scoring gives expected results.
 
@@ -1659,20 +1725,20 @@ def test_create_cosine_drift_terms():
     confounds_with_drift = np.hstack((confounds, cosine_drift))
 
     cosine_confounds = _create_cosine_drift_terms(
-        signals, confounds, high_pass, t_r
+        signals.shape[0], confounds, high_pass, t_r
     )
     assert_almost_equal(cosine_confounds, np.hstack((confounds, cosine_drift)))
 
     # Not passing confounds it will return drift terms only
     drift_terms_only = _create_cosine_drift_terms(
-        signals, None, high_pass, t_r
+        signals.shape[0], None, high_pass, t_r
     )
     assert_almost_equal(drift_terms_only, cosine_drift)
 
     # drift terms in confounds will create warning and no change to confounds
     with pytest.warns(UserWarning, match="user supplied confounds"):
         cosine_confounds = _create_cosine_drift_terms(
-            signals, confounds_with_drift, high_pass, t_r
+            signals.shape[0], confounds_with_drift, high_pass, t_r
         )
     assert_array_equal(cosine_confounds, confounds_with_drift)
 
@@ -1680,7 +1746,7 @@ def test_create_cosine_drift_terms():
     high_pass_fail = 0.002
     with pytest.warns(UserWarning, match="Cosine filter was not created"):
         cosine_confounds = _create_cosine_drift_terms(
-            signals, confounds, high_pass_fail, t_r
+            signals.shape[0], confounds, high_pass_fail, t_r
         )
     assert_array_equal(cosine_confounds, confounds)
 